@@ -0,0 +1,165 @@
+"""Benchmark keyword search on customers before/after the pg_trgm GIN indexes.
+
+Loads N synthetic customers into a temporary table (same columns the customer search touches),
+times the repository keyword filter (``keyword_condition``) and the ``lower(business_domain)``
+filter without indexes, then creates the trigram / functional indexes from migration
+``f0d685374288`` and times them again. Everything runs in one rolled-back transaction.
+
+Requires a reachable Postgres (``DB_*`` settings); trigram timings are skipped when the server
+does not ship the pg_trgm extension.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import BigInteger, Boolean, Column, MetaData, String, Table, func, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from src.intrastructure.database.postgres import postgres_db  # noqa: E402
+from src.intrastructure.repositories.search import keyword_condition  # noqa: E402
+
+DOMAINS = 40
+
+bench_customers = Table(
+    "bench_customers",
+    MetaData(),
+    Column("id", BigInteger),
+    Column("customer_code", String),
+    Column("customer_name", String),
+    Column("business_domain", String),
+    Column("is_deleted", Boolean),
+)
+
+SETUP_SQL = [
+    """
+    CREATE TEMP TABLE bench_customers (
+        id bigint PRIMARY KEY,
+        customer_code varchar(64) NOT NULL,
+        customer_name varchar(128) NOT NULL,
+        business_domain varchar(64) NOT NULL,
+        is_deleted boolean NOT NULL DEFAULT false
+    ) ON COMMIT DROP
+    """,
+    """
+    INSERT INTO bench_customers (id, customer_code, customer_name, business_domain)
+    SELECT i,
+           'CUST' || lpad(i::text, 8, '0'),
+           initcap(substr(md5(i::text), 1, 6)) || ' ' || initcap(substr(md5((i * 7)::text), 1, 8)) || ' 株式会社',
+           'DOMAIN_' || (i % :domains)
+    FROM generate_series(1, :rows) AS i
+    """,
+    "ANALYZE bench_customers",
+]
+
+TRGM_INDEXES = [
+    "CREATE INDEX bench_customers_name_trgm ON bench_customers USING gin (customer_name gin_trgm_ops)",
+    "CREATE INDEX bench_customers_code_trgm ON bench_customers USING gin (customer_code gin_trgm_ops)",
+]
+DOMAIN_INDEX = "CREATE INDEX bench_customers_domain_lower ON bench_customers (lower(business_domain))"
+
+
+def keyword_query(keyword: str) -> Any:
+    condition = keyword_condition(keyword, bench_customers.c.customer_name, bench_customers.c.customer_code)
+    return (
+        select(bench_customers.c.id)
+        .where(bench_customers.c.is_deleted.is_(False), condition)
+        .order_by(bench_customers.c.id.desc())
+        .limit(20)
+    )
+
+
+def keyword_count_query(keyword: str) -> Any:
+    condition = keyword_condition(keyword, bench_customers.c.customer_name, bench_customers.c.customer_code)
+    return select(func.count()).select_from(bench_customers).where(bench_customers.c.is_deleted.is_(False), condition)
+
+
+def domain_count_query(domain: str) -> Any:
+    return (
+        select(func.count()).select_from(bench_customers).where(func.lower(bench_customers.c.business_domain) == domain)
+    )
+
+
+async def time_query(session: AsyncSession, stmt: Any, repeat: int) -> tuple[float, str]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await session.execute(stmt)
+        samples.append((time.perf_counter() - started) * 1000)
+    compiled = stmt.compile(dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    plan = (await session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar_one()
+    return statistics.median(samples), _scan_nodes(plan[0]["Plan"] if isinstance(plan, list) else plan)
+
+
+def _scan_nodes(node: dict[str, Any]) -> str:
+    found: list[str] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if "Scan" in current["Node Type"]:
+            found.append(current["Node Type"])
+        stack.extend(current.get("Plans", []))
+    return ", ".join(sorted(set(found)))
+
+
+async def run(rows: int, repeat: int, keywords: list[str]) -> None:
+    async with postgres_db.session() as session:
+        transaction = await session.begin()
+        try:
+            started = time.perf_counter()
+            for sql in SETUP_SQL:
+                await session.execute(text(sql), {"rows": rows, "domains": DOMAINS})
+            print(f"loaded {rows:,} customers in {time.perf_counter() - started:.1f} s")
+
+            queries = [(f"page  {kw!r}", keyword_query(kw)) for kw in keywords]
+            queries += [(f"count {kw!r}", keyword_count_query(kw)) for kw in keywords]
+            domain_query = ("count lower(domain)", domain_count_query("domain_7"))
+
+            before = {label: await time_query(session, stmt, repeat) for label, stmt in [*queries, domain_query]}
+
+            has_trgm = bool(
+                (await session.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))).scalar()
+            )
+            if has_trgm:
+                await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for sql in TRGM_INDEXES:
+                    await session.execute(text(sql))
+            await session.execute(text(DOMAIN_INDEX))
+            await session.execute(text("ANALYZE bench_customers"))
+
+            after_queries = [*queries, domain_query] if has_trgm else [domain_query]
+            after = {label: await time_query(session, stmt, repeat) for label, stmt in after_queries}
+
+            print(f"{'query':<26} {'before ms':>10} {'after ms':>10}  plan before -> after")
+            for label, (before_ms, before_plan) in before.items():
+                if label in after:
+                    after_ms, after_plan = after[label]
+                    print(f"{label:<26} {before_ms:>10.2f} {after_ms:>10.2f}  {before_plan} -> {after_plan}")
+                else:
+                    print(f"{label:<26} {before_ms:>10.2f} {'n/a':>10}  {before_plan} (pg_trgm unavailable)")
+        finally:
+            await transaction.rollback()
+    await postgres_db.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keyword", action="append", dest="keywords", help="keyword to search (repeatable)")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat, args.keywords or ["CUST0042", "a3f9", "株式会社"]))
+
+
+if __name__ == "__main__":
+    main()
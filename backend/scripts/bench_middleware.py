@@ -0,0 +1,173 @@
+"""Benchmark the request middleware stack: BaseHTTPMiddleware vs pure ASGI.
+
+Builds two FastAPI apps with a trivial ``GET /ping`` endpoint and the same middleware order as
+``src.main`` (CORS → request context → exception handler). The baseline app uses the previous
+``BaseHTTPMiddleware`` implementations (copied below); the other uses the middlewares from
+``src.shared``. Requests are driven in-process straight through the ASGI interface with a fixed
+number of concurrent workers, so the numbers isolate middleware overhead from sockets and servers.
+A ``/boom`` endpoint checks that both stacks map unhandled errors to the same response.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.shared.logger import setup_logging  # noqa: E402
+
+setup_logging()
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+from structlog.contextvars import bind_contextvars, clear_contextvars  # noqa: E402
+
+from src.shared.context import clear_request_context, get_trace_id, set_trace_id  # noqa: E402
+from src.shared.error.app_error import AppError, handle_app_error  # noqa: E402
+from src.shared.error.handle import handle_error  # noqa: E402
+from src.shared.logger.middlewares import RequestContextMiddleware  # noqa: E402
+from src.shared.middlewares.cors import CORSHandleMiddleware  # noqa: E402
+from src.shared.middlewares.exception import ExceptionHandlerMiddleware  # noqa: E402
+
+
+class LegacyExceptionHandlerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        try:
+            return await call_next(request)
+        except AppError as exc:
+            return handle_app_error(request, exc)
+        except Exception as exc:
+            return handle_error(request, exc)
+
+
+class LegacyRequestContextMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        clear_contextvars()
+        clear_request_context()
+        trace_id = str(uuid.uuid4())
+        set_trace_id(trace_id)
+        bind_contextvars(trace_id=trace_id, path=request.url.path, method=request.method)
+        response = await call_next(request)
+        response.headers["X-Trace-Id"] = get_trace_id() or trace_id
+        return response
+
+
+class LegacyCORSHandleMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = CORSHandleMiddleware(app)
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        await self.app(scope, receive, send)
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/boom")
+    async def boom() -> dict[str, str]:
+        raise RuntimeError("boom")
+
+    if legacy:
+        app.add_middleware(LegacyExceptionHandlerMiddleware)
+        app.add_middleware(LegacyRequestContextMiddleware)
+        app.add_middleware(LegacyCORSHandleMiddleware)
+    else:
+        app.add_middleware(ExceptionHandlerMiddleware)
+        app.add_middleware(RequestContextMiddleware)
+        app.add_middleware(CORSHandleMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> tuple[int, dict[str, str], bytes]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"origin", b"http://example.com")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    headers = {key.decode().lower(): value.decode() for key, value in start["headers"]}
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], headers, body
+
+
+async def load(app: FastAPI, requests: int, concurrency: int) -> float:
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call(app, "/ping")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def run(requests: int, concurrency: int, rounds: int) -> None:
+    apps = {"BaseHTTPMiddleware": build_app(legacy=True), "pure ASGI": build_app(legacy=False)}
+
+    for label, app in apps.items():
+        status, headers, _ = await call(app, "/ping")
+        error_status, error_headers, error_body = await call(app, "/boom")
+        print(
+            f"{label:<20} /ping {status} trace={'x-trace-id' in headers} "
+            f"cors={headers.get('access-control-allow-origin')!r} | "
+            f"/boom {error_status} trace={'x-trace-id' in error_headers} {error_body.decode()}"
+        )
+        await load(app, min(requests, 500), concurrency)
+
+    results: dict[str, list[float]] = {label: [] for label in apps}
+    for _ in range(rounds):
+        for label, app in apps.items():
+            results[label].append(await load(app, requests, concurrency))
+
+    print(f"\n{requests:,} requests x {rounds} rounds, concurrency {concurrency}")
+    baseline = max(results["BaseHTTPMiddleware"])
+    for label, samples in results.items():
+        best = max(samples)
+        print(f"{label:<20} {best:>10,.0f} req/s  {1_000_000 / best:>8.1f} µs/req  x{best / baseline:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.concurrency, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark PostalRegionIndex over the full Japanese postal code range (0000000-9999999).
+
+Builds a synthetic JP hierarchy (47 prefectures on 2-digit prefixes, cities on 3-digit prefixes,
+~120k towns on full 7-digit codes) plus three carrier services mapped at prefecture level, checks
+the index against a naive longest-prefix scan on a sample, then resolves every postal code and
+times region-tree coverage lookups and subtree expansion.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.region import GeoGroupRef, PostalRegionIndex, RegionNode  # noqa: E402
+
+PREFECTURES = 47
+SERVICES = 3
+
+
+def build_regions(towns: int, seed: int) -> tuple[list[RegionNode], list[GeoGroupRef]]:
+    rng = random.Random(seed)
+    regions = [RegionNode(region_code="JP", name="日本", level="COUNTRY")]
+    for idx in range(PREFECTURES):
+        regions.append(RegionNode(region_code=f"P{idx:02d}", name=f"県{idx}", level="PREFECTURE", parent_code="JP"))
+    for prefix in range(100):
+        prefecture = f"P{prefix % PREFECTURES:02d}"
+        # 2 位前缀挂在都道府县下的虚拟区，再细分到 3 位前缀的市区町村
+        area = f"A{prefix:02d}"
+        regions.append(
+            RegionNode(
+                region_code=area,
+                name=f"地区{prefix}",
+                level="CITY",
+                parent_code=prefecture,
+                postal_code_prefix=f"{prefix:02d}",
+            )
+        )
+        for digit in range(10):
+            regions.append(
+                RegionNode(
+                    region_code=f"C{prefix:02d}{digit}",
+                    name=f"市{prefix}{digit}",
+                    level="DISTRICT",
+                    parent_code=area,
+                    postal_code_prefix=f"{prefix:02d}{digit}",
+                )
+            )
+    for code in rng.sample(range(10_000_000), towns):
+        postal = f"{code:07d}"
+        regions.append(
+            RegionNode(
+                region_code=f"T{postal}",
+                name=f"町{postal}",
+                level="TOWN",
+                parent_code=f"C{postal[:3]}",
+                postal_code_prefix=f"{postal[:3]}-{postal[3:]}",
+            )
+        )
+    geo_groups = [
+        GeoGroupRef(
+            carrier_service_id=service_id,
+            group_id=service_id * 100 + idx % 12,
+            group_code=f"S{service_id}-G{idx % 12}",
+            region_code=f"P{idx:02d}",
+        )
+        for service_id in range(1, SERVICES + 1)
+        for idx in range(PREFECTURES)
+    ]
+    return regions, geo_groups
+
+
+def naive_lookup(prefixes: list[tuple[str, RegionNode]], postal_code: str) -> str | None:
+    best: tuple[str, RegionNode] | None = None
+    for prefix, region in prefixes:
+        if postal_code.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, region)
+    return best[1].region_code if best else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--towns", type=int, default=120_000)
+    parser.add_argument("--step", type=int, default=1, help="resolve every N-th postal code")
+    parser.add_argument("--naive-samples", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    regions, geo_groups = build_regions(args.towns, args.seed)
+    started = time.perf_counter()
+    index = PostalRegionIndex(regions, geo_groups)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    prefixes = [(region.postal_code_prefix.replace("-", ""), region) for region in regions if region.postal_code_prefix]
+    rng = random.Random(args.seed)
+    samples = [f"{rng.randrange(10_000_000):07d}" for _ in range(args.naive_samples)]
+    samples += [region.region_code[1:] for region in regions[-10:]]
+    started = time.perf_counter()
+    for postal_code in samples:
+        resolution = index.resolve(postal_code)
+        expected = naive_lookup(prefixes, postal_code)
+        if (resolution.region.region_code if resolution else None) != expected:
+            raise SystemExit(f"mismatch for {postal_code}: expected {expected}")
+        if resolution is not None and len(resolution.geo_groups) != SERVICES:
+            raise SystemExit(f"geo groups missing for {postal_code}")
+    naive_elapsed = time.perf_counter() - started
+
+    codes = [f"{code:07d}" for code in range(0, 10_000_000, args.step)]
+    started = time.perf_counter()
+    resolved = 0
+    resolve = index.resolve
+    for postal_code in codes:
+        if resolve(postal_code) is not None:
+            resolved += 1
+    elapsed = time.perf_counter() - started
+
+    tree = index.tree
+    town_codes = [region.region_code for region in regions if region.level == "TOWN"]
+    started = time.perf_counter()
+    for code in town_codes:
+        tree.covering_group(code, 1)
+    covering_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    expanded = sum(len(tree.descendants(f"P{idx:02d}")) for idx in range(PREFECTURES))
+    subtree_elapsed = time.perf_counter() - started
+
+    print(f"build       {build_ms:9.1f} ms  ({index.region_count:,} regions, {index.prefix_count:,} prefixes)")
+    print(f"index       {len(codes):,} codes  {elapsed:.3f} s  ({elapsed / len(codes) * 1e6:.3f} µs/code)")
+    print(
+        f"naive scan  {len(samples):,} codes  {naive_elapsed:.3f} s  ({naive_elapsed / len(samples) * 1e6:.1f} µs/code)"
+    )
+    print(f"resolved    {resolved:,}")
+    print(
+        f"covering    {len(town_codes):,} towns  {covering_elapsed:.3f} s  "
+        f"({covering_elapsed / max(len(town_codes), 1) * 1e6:.3f} µs/town)"
+    )
+    print(f"subtrees    {PREFECTURES} prefectures  {expanded:,} regions  {subtree_elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
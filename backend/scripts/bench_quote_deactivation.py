@@ -0,0 +1,195 @@
+"""Benchmark quote deactivation: legacy load-and-flush vs set-based ``UPDATE ... RETURNING``.
+
+Seeds an isolated business domain inside one transaction: one GLOBAL scope that has accumulated
+``--quotes`` ACTIVE quotes (all from one template) and ``--groups`` GROUP scopes with one ACTIVE quote each.
+Each scenario runs inside a savepoint that is rolled back, so both implementations see the same rows;
+everything is rolled back at the end. Statements are counted at the cursor (executemany rows included).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import event, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from src.domain.billing.entities import SCOPE_PRIORITY, QuoteScope, QuoteStatus, TemplateType  # noqa: E402
+from src.intrastructure.database.models import (  # noqa: E402
+    BillingQuote,
+    BillingTemplate,
+    BusinessDomain,
+    CustomerGroup,
+)
+from src.intrastructure.database.postgres import postgres_db  # noqa: E402
+from src.intrastructure.repositories import BillingQuoteRepository, QuoteScopeRef  # noqa: E402
+
+DOMAIN = "BENCH_DEACTIVATE"
+EMPTY_PAYLOAD = {"template": {}, "rules": []}
+
+
+async def seed(session: AsyncSession, quotes: int, groups: int) -> tuple[int, list[int]]:
+    """写入基准数据，返回 (模板 ID, 客户组 ID 列表)."""
+    now = datetime.now(UTC)
+    session.add(BusinessDomain(code=DOMAIN, name=DOMAIN))
+    template = BillingTemplate(
+        template_code="bench-template",
+        template_name="bench",
+        template_type=TemplateType.GLOBAL.value,
+        business_domain=DOMAIN,
+        effective_date=now - timedelta(days=30),
+    )
+    session.add(template)
+    await session.flush()
+    group_rows = [{"name": f"bench-deactivate-{idx}", "business_domain": DOMAIN} for idx in range(groups)]
+    group_ids = list((await session.execute(insert(CustomerGroup).returning(CustomerGroup.id), group_rows)).scalars())
+
+    def quote_row(code: str, scope: QuoteScope, group_id: int | None) -> dict[str, object]:
+        return {
+            "quote_code": code,
+            "template_id": template.id,
+            "scope_type": scope.value,
+            "scope_priority": SCOPE_PRIORITY[scope],
+            "customer_group_id": group_id,
+            "business_domain": DOMAIN,
+            "status": QuoteStatus.ACTIVE.value,
+            "effective_date": now - timedelta(days=1),
+            "payload": EMPTY_PAYLOAD,
+        }
+
+    rows = [quote_row(f"bench-global-{idx}", QuoteScope.GLOBAL, None) for idx in range(quotes)]
+    rows.extend(quote_row(f"bench-group-{idx}", QuoteScope.GROUP, group_id) for idx, group_id in enumerate(group_ids))
+    await session.execute(insert(BillingQuote), rows)
+    return template.id, group_ids
+
+
+async def legacy_deactivate_scope(session: AsyncSession, scope: QuoteScopeRef) -> int:
+    """原实现：SELECT 全部 ACTIVE 报价单进会话，逐条改状态后 flush."""
+    stmt = select(BillingQuote).where(
+        BillingQuote.scope_type == scope.scope_type.value,
+        BillingQuote.business_domain == scope.business_domain,
+        BillingQuote.status == QuoteStatus.ACTIVE.value,
+        BillingQuote.is_deleted.is_(False),
+    )
+    if scope.scope_type is QuoteScope.GROUP:
+        stmt = stmt.where(BillingQuote.customer_group_id == scope.customer_group_id)
+    else:
+        stmt = stmt.where(BillingQuote.customer_id.is_(None), BillingQuote.customer_group_id.is_(None))
+    quotes = list((await session.execute(stmt)).scalars().all())
+    for quote in quotes:
+        quote.status = QuoteStatus.INACTIVE.value
+    await session.flush()
+    return len(quotes)
+
+
+async def legacy_deactivate_template(session: AsyncSession, template_id: int) -> int:
+    stmt = select(BillingQuote).where(
+        BillingQuote.template_id == template_id,
+        BillingQuote.status == QuoteStatus.ACTIVE.value,
+        BillingQuote.is_deleted.is_(False),
+    )
+    quotes = list((await session.execute(stmt)).scalars().all())
+    for quote in quotes:
+        quote.status = QuoteStatus.INACTIVE.value
+    await session.flush()
+    return len(quotes)
+
+
+async def measure(session: AsyncSession, action: Callable[[], Awaitable[int]]) -> tuple[float, int, int]:
+    """在回滚的保存点内执行，返回 (耗时 ms, 语句数, 失效行数)."""
+    connection = (await session.connection()).sync_connection
+    statements = 0
+
+    def count(_conn: Any, _cursor: Any, statement: str, params: Any, _context: Any, executemany: bool) -> None:
+        nonlocal statements
+        # 保存点在首条语句前惰性发出，不计入
+        if not statement.startswith("SAVEPOINT"):
+            statements += len(params) if executemany else 1
+
+    savepoint = await session.begin_nested()
+    session.expunge_all()
+    event.listen(connection, "before_cursor_execute", count)
+    try:
+        started = time.perf_counter()
+        affected = await action()
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        event.remove(connection, "before_cursor_execute", count)
+        await savepoint.rollback()
+    return elapsed, statements, affected
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quotes", type=int, default=10_000, help="ACTIVE quotes accumulated in the GLOBAL scope")
+    parser.add_argument("--groups", type=int, default=1_000, help="GROUP scopes regenerated at once")
+    args = parser.parse_args()
+
+    await postgres_db.connect()
+    try:
+        async with postgres_db.session() as session:
+            transaction = await session.begin()
+            try:
+                template_id, group_ids = await seed(session, args.quotes, args.groups)
+                await session.flush()
+                repo = BillingQuoteRepository(session)
+                global_scope = QuoteScopeRef(scope_type=QuoteScope.GLOBAL, business_domain=DOMAIN)
+                group_scopes = [
+                    QuoteScopeRef(scope_type=QuoteScope.GROUP, business_domain=DOMAIN, customer_group_id=group_id)
+                    for group_id in group_ids
+                ]
+
+                async def legacy_groups() -> int:
+                    total = 0
+                    for scope in group_scopes:
+                        total += await legacy_deactivate_scope(session, scope)
+                    return total
+
+                async def set_scope() -> int:
+                    return len(await repo.deactivate_scope_quotes([global_scope]))
+
+                async def set_template() -> int:
+                    return len(await repo.deactivate_by_template(template_id))
+
+                async def set_groups() -> int:
+                    return len(await repo.deactivate_scope_quotes(group_scopes))
+
+                scenarios: list[tuple[str, Callable[[], Awaitable[int]], Callable[[], Awaitable[int]]]] = [
+                    (
+                        f"scope ({args.quotes:,} quotes)",
+                        lambda: legacy_deactivate_scope(session, global_scope),
+                        set_scope,
+                    ),
+                    (
+                        f"template ({args.quotes + args.groups:,})",
+                        lambda: legacy_deactivate_template(session, template_id),
+                        set_template,
+                    ),
+                    (f"{args.groups:,} group scopes", legacy_groups, set_groups),
+                ]
+                print(f"{'scenario':<26} {'impl':<8} {'ms':>10} {'statements':>11} {'rows':>8}")
+                for name, legacy, set_based in scenarios:
+                    legacy_ms, legacy_statements, legacy_rows = await measure(session, legacy)
+                    set_ms, set_statements, set_rows = await measure(session, set_based)
+                    if legacy_rows != set_rows:
+                        raise SystemExit(f"{name}: legacy deactivated {legacy_rows}, set-based {set_rows}")
+                    print(f"{name:<26} {'legacy':<8} {legacy_ms:>10.1f} {legacy_statements:>11,} {legacy_rows:>8,}")
+                    print(f"{'':<26} {'set':<8} {set_ms:>10.1f} {set_statements:>11,} {set_rows:>8,}")
+            finally:
+                await transaction.rollback()
+    finally:
+        await postgres_db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
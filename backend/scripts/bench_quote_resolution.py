@@ -0,0 +1,276 @@
+"""Benchmark customer quote resolution: legacy N+3 lookups vs single-statement resolve vs materialized lookup.
+
+Seeds an isolated business domain inside one transaction, measures latency for customers
+in 0, 1 and 20 groups plus one batch resolve over every seeded customer, then rolls everything back.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from src.domain.billing.entities import SCOPE_PRIORITY, QuoteScope, QuoteStatus, TemplateType  # noqa: E402
+from src.intrastructure.database.models import (  # noqa: E402
+    BillingQuote,
+    BillingTemplate,
+    BusinessDomain,
+    Company,
+    Customer,
+    CustomerGroup,
+    CustomerGroupMember,
+    CustomerStatus,
+)
+from src.intrastructure.database.postgres import postgres_db  # noqa: E402
+from src.intrastructure.repositories import (  # noqa: E402
+    BillingQuoteRepository,
+    CustomerEffectiveQuoteRepository,
+    CustomerRepository,
+)
+
+DOMAIN = "BENCH_RESOLVE"
+GROUP_COUNTS = (0, 1, 20)
+EMPTY_PAYLOAD = {"template": {}, "rules": []}
+
+
+async def seed(session: AsyncSession, filler_customers: int) -> tuple[dict[int, int], list[int]]:
+    """写入基准数据，返回 ({group_count: customer_id}, 全部客户 ID)."""
+    now = datetime.now(UTC)
+    session.add(BusinessDomain(code=DOMAIN, name=DOMAIN))
+    session.add(
+        Company(
+            company_id="bench-company",
+            company_name="bench",
+            company_code="bench-company",
+            company_corporation="bench",
+            company_phone="-",
+            company_email="-",
+            company_address="-",
+            source="bench",
+        )
+    )
+    await session.flush()
+
+    customer_rows = [
+        {
+            "customer_name": f"bench-{idx}",
+            "customer_code": f"bench-{idx}",
+            "address": "-",
+            "contact_email": "-",
+            "contact_person": "-",
+            "operation_name": "-",
+            "operation_uid": "-",
+            "status": CustomerStatus.ACTIVE,
+            "company_id": "bench-company",
+            "business_domain": DOMAIN,
+            "source": "bench",
+        }
+        for idx in range(len(GROUP_COUNTS) + filler_customers)
+    ]
+    customer_ids = list((await session.execute(insert(Customer).returning(Customer.id), customer_rows)).scalars())
+
+    max_groups = max(GROUP_COUNTS)
+    group_rows = [{"name": f"bench-group-{idx}", "business_domain": DOMAIN} for idx in range(max_groups)]
+    group_ids = list((await session.execute(insert(CustomerGroup).returning(CustomerGroup.id), group_rows)).scalars())
+
+    template = BillingTemplate(
+        template_code="bench-template",
+        template_name="bench",
+        template_type=TemplateType.GLOBAL.value,
+        business_domain=DOMAIN,
+        effective_date=now - timedelta(days=30),
+    )
+    session.add(template)
+    await session.flush()
+
+    targets: dict[int, int] = {}
+    member_rows: list[dict[str, object]] = []
+    for customer_id, group_count in zip(customer_ids, GROUP_COUNTS, strict=False):
+        targets[group_count] = customer_id
+        for idx, group_id in enumerate(group_ids[:group_count]):
+            member_rows.append(
+                {
+                    "group_id": group_id,
+                    "customer_id": customer_id,
+                    "business_domain": DOMAIN,
+                    "assigned_at": now - timedelta(hours=idx),
+                }
+            )
+    if member_rows:
+        await session.execute(insert(CustomerGroupMember), member_rows)
+
+    def quote_row(code: str, scope: QuoteScope, customer_id: int | None, group_id: int | None) -> dict[str, object]:
+        return {
+            "quote_code": code,
+            "template_id": template.id,
+            "scope_type": scope.value,
+            "scope_priority": SCOPE_PRIORITY[scope],
+            "customer_id": customer_id,
+            "customer_group_id": group_id,
+            "business_domain": DOMAIN,
+            "status": QuoteStatus.ACTIVE.value,
+            "effective_date": now - timedelta(days=1),
+            "payload": EMPTY_PAYLOAD,
+        }
+
+    # 只有最早加入的客户组有报价，强制旧实现遍历全部客户组
+    quote_rows = [
+        quote_row("bench-global", QuoteScope.GLOBAL, None, None),
+        quote_row("bench-group-last", QuoteScope.GROUP, None, group_ids[-1]),
+    ]
+    quote_rows.extend(
+        quote_row(f"bench-filler-{idx}", QuoteScope.CUSTOMER, customer_id, None)
+        for idx, customer_id in enumerate(customer_ids[len(GROUP_COUNTS) :])
+    )
+    await session.execute(insert(BillingQuote), quote_rows)
+    inactive_rows = [
+        quote_row(f"bench-inactive-{idx}", QuoteScope.GROUP, None, group_id)
+        for idx, group_id in enumerate(group_ids[:-1])
+    ]
+    for row in inactive_rows:
+        row["status"] = QuoteStatus.INACTIVE.value
+    await session.execute(insert(BillingQuote), inactive_rows)
+    return targets, customer_ids
+
+
+async def resolve_legacy(session: AsyncSession, customer_id: int) -> int | None:
+    """原 ResolveCustomerQuoteUseCase 的 N+3 查询路径."""
+    customer = await CustomerRepository(session).get_detail(customer_id)
+    if customer is None:
+        return None
+    repo = BillingQuoteRepository(session)
+    now = datetime.now(UTC)
+    quote = await repo.find_active_quote(
+        scope=QuoteScope.CUSTOMER, business_domain=customer.business_domain, now=now, customer_id=customer.id
+    )
+    if quote is not None:
+        return quote.id
+    members = sorted(
+        (member for member in customer.groups if not member.is_deleted),
+        key=lambda member: member.assigned_at or datetime.min.replace(tzinfo=UTC),
+        reverse=True,
+    )
+    for member in members:
+        quote = await repo.find_active_quote(
+            scope=QuoteScope.GROUP, business_domain=customer.business_domain, now=now, customer_group_id=member.group_id
+        )
+        if quote is not None:
+            return quote.id
+    quote = await repo.find_active_quote(scope=QuoteScope.GLOBAL, business_domain=customer.business_domain, now=now)
+    return quote.id if quote is not None else None
+
+
+async def resolve_single(session: AsyncSession, customer_id: int) -> int | None:
+    resolved = await BillingQuoteRepository(session).resolve_effective_quote(
+        customer_id=customer_id, now=datetime.now(UTC)
+    )
+    if resolved is None or resolved[1] is None:
+        return None
+    return resolved[1].id
+
+
+async def resolve_materialized(session: AsyncSession, customer_id: int) -> int | None:
+    resolved = await CustomerEffectiveQuoteRepository(session).resolve(customer_id=customer_id, now=datetime.now(UTC))
+    if resolved is None or resolved[1] is None:
+        return None
+    return resolved[1].id
+
+
+async def measure(
+    session: AsyncSession,
+    resolver: Callable[[AsyncSession, int], Awaitable[int | None]],
+    customer_id: int,
+    iterations: int,
+) -> tuple[list[float], int | None]:
+    samples: list[float] = []
+    quote_id: int | None = None
+    for _ in range(iterations):
+        session.expunge_all()
+        started = time.perf_counter()
+        quote_id = await resolver(session, customer_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, quote_id
+
+
+async def measure_batch(session: AsyncSession, customer_ids: list[int]) -> tuple[float, int, dict[int, int | None]]:
+    statements = 0
+
+    def count(_: object) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(session.sync_session, "do_orm_execute", count)
+    try:
+        started = time.perf_counter()
+        resolved = await BillingQuoteRepository(session).resolve_effective_quote_ids(
+            customer_ids=customer_ids, business_domains=[DOMAIN.lower()], now=datetime.now(UTC)
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        event.remove(session.sync_session, "do_orm_execute", count)
+    return elapsed, statements, resolved
+
+
+def describe(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return f"p50 {statistics.median(ordered):7.3f} ms  p95 {p95:7.3f} ms"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--filler-customers", type=int, default=5000)
+    args = parser.parse_args()
+
+    await postgres_db.connect()
+    try:
+        async with postgres_db.session() as session:
+            transaction = await session.begin()
+            try:
+                targets, customer_ids = await seed(session, args.filler_customers)
+                await session.flush()
+                started = time.perf_counter()
+                await CustomerEffectiveQuoteRepository(session).refresh_customers(customer_ids)
+                print(f"materialize {len(customer_ids):,} customers  {(time.perf_counter() - started) * 1000:9.3f} ms")
+                for group_count, customer_id in targets.items():
+                    legacy, legacy_id = await measure(session, resolve_legacy, customer_id, args.iterations)
+                    single, single_id = await measure(session, resolve_single, customer_id, args.iterations)
+                    materialized, materialized_id = await measure(
+                        session, resolve_materialized, customer_id, args.iterations
+                    )
+                    if not legacy_id == single_id == materialized_id:
+                        raise SystemExit(
+                            f"mismatch for {group_count} groups: legacy={legacy_id} single={single_id} "
+                            f"materialized={materialized_id}"
+                        )
+                    print(f"groups={group_count:<3} legacy  {describe(legacy)}")
+                    print(f"{'':10} single  {describe(single)}")
+                    print(f"{'':10} mat.    {describe(materialized)}")
+
+                elapsed, statements, resolved = await measure_batch(session, customer_ids)
+                for group_count, customer_id in targets.items():
+                    single_id = await resolve_single(session, customer_id)
+                    if resolved.get(customer_id) != single_id:
+                        raise SystemExit(f"batch mismatch for {group_count} groups: batch={resolved.get(customer_id)}")
+                print(f"batch      {len(customer_ids):,} customers  {elapsed:9.3f} ms  statements={statements}")
+            finally:
+                await transaction.rollback()
+    finally:
+        await postgres_db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
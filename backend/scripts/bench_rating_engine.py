@@ -0,0 +1,136 @@
+"""Benchmark RatingEngine: rate 1M synthetic usage rows against a 20-rule quote."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.billing.entities import (  # noqa: E402
+    PricingMode,
+    RuleCategory,
+    RuleChannel,
+    RuleUnit,
+    TemplateRule,
+)
+from src.domain.billing.rating import RatingEngine, UsageSeries, group_usage  # noqa: E402
+
+TIERED_UNITS = [RuleUnit.CBM_DAY, RuleUnit.KG_DAY, RuleUnit.CBM_MONTH, RuleUnit.KG_MONTH, RuleUnit.PALLET]
+FLAT_UNITS = [RuleUnit.PIECE, RuleUnit.ORDER]
+
+
+def build_payload(rule_count: int = 20) -> dict:
+    rules: list[dict] = []
+    for idx in range(rule_count):
+        if idx % 2 == 0:
+            tiers = [
+                {"min_value": 0, "max_value": 100, "price": 120},
+                {"min_value": 100, "max_value": 500, "price": 100},
+                {"min_value": 500, "max_value": 2000, "price": 80},
+                {"min_value": 2000, "max_value": None, "price": 60},
+            ]
+            rule = TemplateRule(
+                charge_code=f"STO_{idx:02d}",
+                charge_name=f"仓储费 {idx}",
+                category=RuleCategory.STORAGE,
+                channel=RuleChannel.AUTO,
+                unit=TIERED_UNITS[idx // 2 % len(TIERED_UNITS)],
+                pricing_mode=PricingMode.TIERED,
+                tiers=tiers,
+            )
+        else:
+            rule = TemplateRule(
+                charge_code=f"IO_{idx:02d}",
+                charge_name=f"出入库费 {idx}",
+                category=RuleCategory.INBOUND_OUTBOUND,
+                channel=RuleChannel.SCAN,
+                unit=FLAT_UNITS[idx // 2 % len(FLAT_UNITS)],
+                pricing_mode=PricingMode.FLAT,
+                price=35 + idx,
+            )
+        rules.append(rule.to_dict())
+    return {"template": {}, "rules": rules}
+
+
+def build_usage(engine: RatingEngine, rows: int, seed: int) -> list[tuple[str, RuleUnit, float]]:
+    rng = random.Random(seed)
+    rules = list(engine.rules.values())
+    records: list[tuple[str, RuleUnit, float]] = []
+    for _ in range(rows):
+        rule = rules[rng.randrange(len(rules))]
+        if rule.pricing_mode is PricingMode.TIERED:
+            quantity: float = round(rng.uniform(0, 3000), 3)
+        else:
+            quantity = rng.randint(1, 50)
+        records.append((rule.charge_code, rule.unit, quantity))
+    return records
+
+
+def rate_naive(engine: RatingEngine, series: list[UsageSeries]) -> int:
+    """逐条记录循环的参考实现，用于对比与校验."""
+    total = 0
+    for item in series:
+        rule = engine.get_rule(item.charge_code)
+        amounts: list[float] = []
+        for quantity in item.quantities:
+            price = None
+            for idx, edge in enumerate(rule.edges):
+                if quantity < edge:
+                    price = rule.prices[idx]
+                    break
+            else:
+                price = rule.prices[-1]
+            if price is None:
+                raise ValueError(f"no tier for {quantity}")
+            amounts.append(quantity * price)
+        total += round(sum(amounts))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--rules", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-naive", action="store_true", help="skip per-record reference loop")
+    args = parser.parse_args()
+
+    payload = build_payload(args.rules)
+
+    started = time.perf_counter()
+    engine = RatingEngine.from_payload(payload)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    records = build_usage(engine, args.rows, args.seed)
+
+    started = time.perf_counter()
+    series = group_usage(records)
+    group_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = engine.rate(series)
+    rate_s = time.perf_counter() - started
+
+    print(f"rules={len(engine.rules)} rows={args.rows:,}")
+    print(f"compile       {compile_ms:8.3f} ms")
+    print(f"group_usage   {group_s:8.3f} s")
+    print(f"rate          {rate_s:8.3f} s  ({args.rows / rate_s:,.0f} rows/s)")
+    print(f"total_amount  {result.total_amount:,}")
+
+    if not args.skip_naive:
+        started = time.perf_counter()
+        naive_total = rate_naive(engine, series)
+        naive_s = time.perf_counter() - started
+        print(f"naive loop    {naive_s:8.3f} s  (x{naive_s / rate_s:.1f})")
+        if naive_total != result.total_amount:
+            raise SystemExit(f"mismatch: engine={result.total_amount} naive={naive_total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Benchmark list / tariff response rendering: pydantic models + response_model vs direct row dicts.
+
+Builds an in-process FastAPI app whose routes return pre-built (transient) ORM rows, so only the
+response path is measured:
+
+* ``legacy``: ``Schema.from_model`` per row, wrapped in ``SuccessResponse``; FastAPI then
+  re-validates the result against ``response_model`` and serializes it.
+* ``fast``: ``Schema.dump_rows`` reads attributes straight into alias-keyed dicts and
+  ``success_json`` encodes them with pydantic-core, skipping both validation passes.
+
+Payloads: carrier and billing-template lists (``--items`` rows each) and a full tariff matrix
+(``--groups`` geo groups x ``--rows`` tariff rows). Each route's body is checked to be identical
+(as parsed JSON) between the two paths before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.types import Message  # noqa: E402
+
+from src.application.carrier.use_cases import CarrierServiceTariffGroupResult  # noqa: E402
+from src.intrastructure.database.models import BillingTemplate, Carrier, CarrierServiceTariff  # noqa: E402
+from src.presentation.schema.billing import BillingTemplateListItemSchema, BillingTemplateListResponse  # noqa: E402
+from src.presentation.schema.carrier import (  # noqa: E402
+    CarrierListResponse,
+    CarrierSchema,
+    CarrierServiceTariffGroupListResponse,
+    CarrierServiceTariffGroupSchema,
+    CarrierServiceTariffRowSchema,
+)
+from src.shared.schemas.response import JSONBytesResponse, SuccessResponse, success_json  # noqa: E402
+
+
+def build_rows(items: int, groups: int, rows: int) -> dict[str, Any]:
+    now = datetime(2026, 9, 1, tzinfo=UTC)
+    carriers = [
+        Carrier(
+            id=i,
+            carrier_code=f"C{i:05d}",
+            carrier_name=f"運送会社 {i}",
+            country_code="JP",
+            status="ACTIVE",
+            description="synthetic",
+            contact_email=f"ops{i}@example.com",
+            contact_phone="03-0000-0000",
+            website=None,
+        )
+        for i in range(items)
+    ]
+    templates = [
+        BillingTemplate(
+            id=i,
+            template_code=f"T{i:06d}",
+            template_name=f"倉庫テンプレート {i}",
+            template_type="CUSTOMER",
+            business_domain="WAREHOUSE",
+            description=None,
+            effective_date=now,
+            expire_date=now + timedelta(days=365),
+            customer_id=i,
+            customer_group_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(items)
+    ]
+    matrix = [
+        CarrierServiceTariffGroupResult(
+            geo_group_id=g,
+            currency="JPY",
+            rows=[
+                CarrierServiceTariff(
+                    weight_max_kg=float(r + 1) / 2,
+                    volume_max_cm3=None,
+                    girth_max_cm=60 + 20 * r,
+                    price_amount=700 + 55 * r + g,
+                )
+                for r in range(rows)
+            ],
+        )
+        for g in range(groups)
+    ]
+    return {"carriers": carriers, "templates": templates, "matrix": matrix}
+
+
+def build_app(data: dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+    carriers, templates, matrix = data["carriers"], data["templates"], data["matrix"]
+    total = len(carriers)
+
+    @app.get("/legacy/carriers", response_model=SuccessResponse[CarrierListResponse])
+    async def legacy_carriers() -> SuccessResponse[CarrierListResponse]:
+        items = [CarrierSchema.from_model(carrier) for carrier in carriers]
+        return SuccessResponse(data=CarrierListResponse(total=total, items=items, nextCursor="c"))
+
+    @app.get("/fast/carriers", response_model=SuccessResponse[CarrierListResponse])
+    async def fast_carriers() -> JSONBytesResponse:
+        return success_json({"total": total, "items": CarrierSchema.dump_rows(carriers), "nextCursor": "c"})
+
+    @app.get("/legacy/templates", response_model=SuccessResponse[BillingTemplateListResponse])
+    async def legacy_templates() -> SuccessResponse[BillingTemplateListResponse]:
+        return SuccessResponse(
+            data=BillingTemplateListResponse(
+                items=[BillingTemplateListItemSchema.from_model(item) for item in templates],
+                total=total,
+                nextCursor="c",
+            )
+        )
+
+    @app.get("/fast/templates", response_model=SuccessResponse[BillingTemplateListResponse])
+    async def fast_templates() -> JSONBytesResponse:
+        items = BillingTemplateListItemSchema.dump_rows(templates)
+        return success_json({"items": items, "total": total, "nextCursor": "c"})
+
+    @app.get("/legacy/tariffs", response_model=SuccessResponse[CarrierServiceTariffGroupListResponse])
+    async def legacy_tariffs() -> SuccessResponse[CarrierServiceTariffGroupListResponse]:
+        items = [
+            CarrierServiceTariffGroupSchema(
+                geoGroupId=item.geo_group_id,
+                currency=item.currency,
+                rows=[
+                    CarrierServiceTariffRowSchema(
+                        weightMaxKg=row.weight_max_kg,
+                        volumeMaxCm3=row.volume_max_cm3,
+                        girthMaxCm=row.girth_max_cm,
+                        priceAmount=row.price_amount,
+                    )
+                    for row in item.rows
+                ],
+            )
+            for item in matrix
+        ]
+        return SuccessResponse(data=CarrierServiceTariffGroupListResponse(items=items))
+
+    @app.get("/fast/tariffs", response_model=SuccessResponse[CarrierServiceTariffGroupListResponse])
+    async def fast_tariffs() -> JSONBytesResponse:
+        items = [
+            {
+                "geoGroupId": item.geo_group_id,
+                "currency": item.currency,
+                "rows": CarrierServiceTariffRowSchema.dump_rows(item.rows),
+            }
+            for item in matrix
+        ]
+        return success_json({"items": items})
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def measure(app: FastAPI, path: str, repeat: int) -> tuple[float, int]:
+    samples: list[float] = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await call(app, path)
+        samples.append((time.perf_counter() - started) * 1000)
+        size = len(body)
+    return statistics.median(samples), size
+
+
+async def run(items: int, groups: int, rows: int, repeat: int) -> None:
+    app = build_app(build_rows(items, groups, rows))
+    payloads = [
+        (f"carriers x{items}", "carriers"),
+        (f"templates x{items}", "templates"),
+        (f"tariffs {groups}x{rows}", "tariffs"),
+    ]
+    for _, name in payloads:
+        legacy = json.loads(await call(app, f"/legacy/{name}"))
+        fast = json.loads(await call(app, f"/fast/{name}"))
+        if legacy != fast:
+            raise RuntimeError(f"{name}: fast response differs from legacy response")
+
+    print(f"{'payload':<20} {'bytes':>10} {'legacy ms':>10} {'fast ms':>10} {'speedup':>8}")
+    for label, name in payloads:
+        legacy_ms, size = await measure(app, f"/legacy/{name}", repeat)
+        fast_ms, _ = await measure(app, f"/fast/{name}", repeat)
+        print(f"{label:<20} {size:>10,} {legacy_ms:>10.2f} {fast_ms:>10.2f} {legacy_ms / fast_ms:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--groups", type=int, default=47, help="geo groups in the tariff matrix")
+    parser.add_argument("--rows", type=int, default=60, help="tariff rows per geo group")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.groups, args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
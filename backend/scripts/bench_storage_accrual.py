@@ -0,0 +1,96 @@
+"""Benchmark storage accrual: stream synthetic daily inventory snapshots through StorageAggregator.
+
+Generates customers x days snapshots in customer order, feeds them chunk by chunk and rates every
+completed customer against the STORAGE rules of a synthetic quote; reports throughput and peak
+RSS, which should stay flat as the row count grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.shared.logger import setup_logging  # noqa: E402
+
+# 组件 logger 在导入时绑定，需先按配置初始化日志，避免逐客户的 debug 输出拖慢基准
+setup_logging()
+
+from bench_rating_engine import build_payload  # noqa: E402
+
+from src.domain.billing.rating import CompiledPriceBook  # noqa: E402
+from src.domain.billing.storage import (  # noqa: E402
+    BillingPeriod,
+    InventorySnapshot,
+    StorageAggregator,
+    rate_storage,
+)
+
+
+def generate(period: BillingPeriod, customers: int, chunk_size: int, seed: int) -> Iterator[list[InventorySnapshot]]:
+    rng = random.Random(seed)
+    chunk: list[InventorySnapshot] = []
+    for customer_id in range(1, customers + 1):
+        base = rng.uniform(1, 800)
+        for offset in range(period.days):
+            chunk.append(
+                InventorySnapshot(
+                    customer_id=customer_id,
+                    snapshot_date=period.start + timedelta(days=offset),
+                    volume_cbm=base * rng.uniform(0.8, 1.2),
+                    weight_kg=base * 150 * rng.uniform(0.8, 1.2),
+                )
+            )
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--period", default="2026-09")
+    parser.add_argument("--customers", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    period = BillingPeriod.parse(args.period)
+    book = CompiledPriceBook.from_payload(build_payload(), quote_id=1)
+    aggregator = StorageAggregator(period)
+
+    started = time.perf_counter()
+    rows = customers = 0
+    total_amount = 0
+    for chunk in generate(period, args.customers, args.chunk_size, args.seed):
+        rows += len(chunk)
+        for acc in aggregator.feed(chunk):
+            total_amount += rate_storage(book, acc).total_amount
+            customers += 1
+    for acc in aggregator.drain():
+        total_amount += rate_storage(book, acc).total_amount
+        customers += 1
+    elapsed = time.perf_counter() - started
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if customers != args.customers:
+        raise SystemExit(f"customer count mismatch: {customers} != {args.customers}")
+    print(f"rows        {rows:,}")
+    print(f"customers   {customers:,}")
+    print(f"elapsed     {elapsed:.3f} s  ({rows / elapsed:,.0f} rows/s)")
+    print(f"peak RSS    {peak_kib / 1024:.1f} MiB")
+    print(f"total       {total_amount:,}")
+
+
+if __name__ == "__main__":
+    main()
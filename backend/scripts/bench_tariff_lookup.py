@@ -0,0 +1,99 @@
+"""Benchmark TariffLookup: 1M parcel lookups against the Yamato-style matrix in the payload doc.
+
+Parses the example payload from docs/carrier-service-tariff-snapshot-payload.md, verifies the
+compiled bisect lookup against a linear scan of the raw rows, then times both.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.carrier import Parcel, TariffLookup, TariffLookupError  # noqa: E402
+
+PAYLOAD_DOC = PROJECT_ROOT / "docs" / "carrier-service-tariff-snapshot-payload.md"
+
+
+def load_payload() -> dict[str, Any]:
+    match = re.search(r"```json\n(.*?)\n```", PAYLOAD_DOC.read_text(encoding="utf-8"), re.S)
+    if match is None:
+        raise SystemExit(f"no json payload found in {PAYLOAD_DOC}")
+    return json.loads(match.group(1))
+
+
+def naive_price(payload: dict[str, Any], region_code: str, girth: float, weight: float) -> int | None:
+    """文档中的查询规则：按区域取行，返回第一条各维度都满足的行."""
+    for entry in payload["matrix"]:
+        if entry["region_code"] != region_code:
+            continue
+        for row in entry["rows"]:
+            if row["girth_max_cm"] is not None and girth > row["girth_max_cm"]:
+                continue
+            if row["weight_max_kg"] is not None and weight > row["weight_max_kg"]:
+                continue
+            return int(row["price_amount"])
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--naive-lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payload = load_payload()
+    started = time.perf_counter()
+    lookup = TariffLookup.from_payload(payload)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(args.seed)
+    regions = lookup.region_codes
+    parcels = [
+        (rng.choice(regions), Parcel(girth_cm=rng.uniform(10, 270), weight_kg=rng.uniform(0.1, 55)))
+        for _ in range(args.lookups)
+    ]
+
+    def quote_or_none(region_code: str, parcel: Parcel) -> int | None:
+        try:
+            return lookup.price(region_code, parcel)
+        except TariffLookupError:
+            return None
+
+    for region_code, parcel in parcels[: args.naive_lookups]:
+        expected = naive_price(payload, region_code, parcel.girth_cm or 0, parcel.weight_kg or 0)
+        if quote_or_none(region_code, parcel) != expected:
+            raise SystemExit(f"mismatch for {region_code} {parcel}: expected {expected}")
+
+    started = time.perf_counter()
+    priced = sum(1 for region_code, parcel in parcels if quote_or_none(region_code, parcel) is not None)
+    compiled_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for region_code, parcel in parcels[: args.naive_lookups]:
+        naive_price(payload, region_code, parcel.girth_cm or 0, parcel.weight_kg or 0)
+    naive_elapsed = time.perf_counter() - started
+
+    print(f"compile     {compile_ms:.3f} ms  ({len(regions)} regions)")
+    print(
+        f"bisect      {args.lookups:,} lookups  {compiled_elapsed:.3f} s  "
+        f"({args.lookups / compiled_elapsed:,.0f}/s, {priced:,} priced)"
+    )
+    print(
+        f"linear scan {args.naive_lookups:,} lookups  {naive_elapsed:.3f} s  "
+        f"({args.naive_lookups / naive_elapsed:,.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
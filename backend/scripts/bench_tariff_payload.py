@@ -0,0 +1,125 @@
+"""Benchmark tariff snapshot payload encodings: v1 (per-region matrix) vs v2 (shared price sets).
+
+Builds a synthetic rate card (``--groups`` geo groups x ``--regions`` regions per group x ``--rows``
+size bands), encodes it with the previous per-region builder (copied below) and with
+``encode_tariff_payload``, checks that both compile to lookups giving identical prices, then
+reports the JSON size and the time to parse + compile each payload (what every snapshot read pays).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.carrier import (  # noqa: E402
+    Parcel,
+    RateCardRow,
+    TariffLookup,
+    TariffLookupError,
+    encode_tariff_payload,
+)
+
+
+def legacy_payload(groups: list[tuple[list[str], list[RateCardRow]]], names: dict[str, str]) -> dict[str, Any]:
+    """v1：每个区域重复一份完整的价格行."""
+    rows = [row for _, group_rows in groups for row in group_rows]
+    metric_axis: dict[str, list[Any]] = {}
+    for name in ("weight_max_kg", "volume_max_cm3", "girth_max_cm"):
+        values = sorted({getattr(row, name) for row in rows if getattr(row, name) is not None})
+        if values:
+            metric_axis[name] = values
+    matrix = []
+    for region_codes, group_rows in groups:
+        region_rows = [
+            {
+                "weight_max_kg": row.weight_max_kg,
+                "volume_max_cm3": row.volume_max_cm3,
+                "girth_max_cm": row.girth_max_cm,
+                "price_amount": row.price_amount,
+            }
+            for row in group_rows
+        ]
+        matrix.extend({"region_code": code, "rows": region_rows} for code in region_codes)
+    return {
+        "currency": "JPY",
+        "geo_axis": [{"code": code, "name": names[code]} for codes, _ in groups for code in codes],
+        "metric_axis": metric_axis,
+        "matrix": matrix,
+    }
+
+
+def build_groups(
+    groups: int, regions: int, rows: int
+) -> tuple[list[tuple[list[str], list[RateCardRow]]], dict[str, str]]:
+    result: list[tuple[list[str], list[RateCardRow]]] = []
+    names: dict[str, str] = {}
+    for g in range(groups):
+        codes = [f"JP-{g:02d}-{r:04d}" for r in range(regions)]
+        names.update({code: f"市区町村 {code}" for code in codes})
+        bands = [RateCardRow(60 + 20 * b, float(2 + 3 * b), None, 700 + 110 * b + 40 * g) for b in range(rows)]
+        result.append((codes, bands))
+    return result, names
+
+
+def load(raw: bytes) -> TariffLookup:
+    return TariffLookup.from_payload(json.loads(raw))
+
+
+def measure(raw: bytes, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load(raw)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=13)
+    parser.add_argument("--regions", type=int, default=150, help="regions per geo group")
+    parser.add_argument("--rows", type=int, default=11, help="size bands per geo group")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    groups, names = build_groups(args.groups, args.regions, args.rows)
+    v1 = json.dumps(legacy_payload(groups, names), ensure_ascii=False).encode()
+    v2 = json.dumps(encode_tariff_payload("JPY", groups, names), ensure_ascii=False).encode()
+
+    legacy, compact = load(v1), load(v2)
+    rng = random.Random(7)
+    for _ in range(20_000):
+        region = rng.choice(legacy.region_codes)
+        parcel = Parcel(girth_cm=rng.uniform(10, 300), weight_kg=rng.uniform(0.1, 40))
+        try:
+            expected: int | None = legacy.price(region, parcel)
+        except TariffLookupError:
+            expected = None
+        try:
+            actual: int | None = compact.price(region, parcel)
+        except TariffLookupError:
+            actual = None
+        if expected != actual:
+            raise SystemExit(f"mismatch for {region} {parcel}: v1 {expected}, v2 {actual}")
+
+    regions = args.groups * args.regions
+    print(f"{args.groups} groups x {args.regions} regions ({regions:,}) x {args.rows} bands")
+    print(f"{'payload':<8} {'bytes':>12} {'parse+compile ms':>18}")
+    v1_ms, v2_ms = measure(v1, args.repeat), measure(v2, args.repeat)
+    print(f"{'v1':<8} {len(v1):>12,} {v1_ms:>18.2f}")
+    print(f"{'v2':<8} {len(v2):>12,} {v2_ms:>18.2f}")
+    print(f"size x{len(v1) / len(v2):.1f} smaller, load x{v1_ms / v2_ms:.1f} faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Benchmark usage-event ingestion: one INSERT per event vs the batched ``IngestUsageEventsUseCase``.
+
+Seeds an isolated business domain with ``--customers`` customers and a GLOBAL quote defining the
+SCAN charges the events report, then ingests ``--batches`` request
+bodies of ``--batch-size`` events each (JSON validated through ``UsageEventBatchRequest`` as the API
+does). The batched path is replayed once more to measure the all-duplicate case. Everything written
+is deleted at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import delete, insert  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # noqa: E402
+
+from src.application.billing import (  # noqa: E402
+    IngestUsageEventsCommand,
+    IngestUsageEventsUseCase,
+    UsageEventInput,
+)
+from src.domain.billing.entities import (  # noqa: E402
+    SCOPE_PRIORITY,
+    PricingMode,
+    QuoteScope,
+    QuoteStatus,
+    RuleCategory,
+    RuleChannel,
+    RuleUnit,
+    TemplateRule,
+    TemplateType,
+)
+from src.intrastructure.database.models import (  # noqa: E402
+    BillingQuote,
+    BillingTemplate,
+    BusinessDomain,
+    Company,
+    Customer,
+    CustomerStatus,
+    UsageEvent,
+)
+from src.intrastructure.database.postgres import postgres_db  # noqa: E402
+from src.presentation.schema.billing import UsageEventBatchRequest  # noqa: E402
+from src.shared.context import set_current_user_context  # noqa: E402
+from src.shared.models.user import UserContext  # noqa: E402
+
+DOMAIN = "BENCH_USAGE"
+COMPANY_ID = "bench-usage"
+CHARGES = [("SCAN_LABEL", "PIECE"), ("SCAN_CARTON", "PIECE"), ("SCAN_PALLET", "PALLET"), ("SCAN_ORDER", "ORDER")]
+
+
+async def seed(customers: int) -> list[int]:
+    async with postgres_db.session() as session, session.begin():
+        session.add(BusinessDomain(code=DOMAIN, name=DOMAIN))
+        session.add(
+            Company(
+                company_id=COMPANY_ID,
+                company_name=COMPANY_ID,
+                company_code=COMPANY_ID,
+                company_corporation="-",
+                company_phone="-",
+                company_email="-",
+                company_address="-",
+                source="BENCH",
+            )
+        )
+        await session.flush()
+        template = BillingTemplate(
+            template_code=COMPANY_ID,
+            template_name=COMPANY_ID,
+            template_type=TemplateType.GLOBAL.value,
+            business_domain=DOMAIN,
+            effective_date=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        session.add(template)
+        await session.flush()
+        rules = [
+            TemplateRule(
+                charge_code=charge_code,
+                charge_name=charge_code,
+                category=RuleCategory.INBOUND_OUTBOUND,
+                channel=RuleChannel.SCAN,
+                unit=RuleUnit(unit),
+                pricing_mode=PricingMode.FLAT,
+                price=50,
+            ).to_dict()
+            for charge_code, unit in CHARGES
+        ]
+        session.add(
+            BillingQuote(
+                quote_code=COMPANY_ID,
+                template_id=template.id,
+                scope_type=QuoteScope.GLOBAL.value,
+                scope_priority=SCOPE_PRIORITY[QuoteScope.GLOBAL],
+                business_domain=DOMAIN,
+                status=QuoteStatus.ACTIVE.value,
+                effective_date=datetime(2026, 1, 1, tzinfo=UTC),
+                payload={"template": {}, "rules": rules},
+            )
+        )
+        rows = [
+            {
+                "customer_name": f"bench-usage-{idx}",
+                "customer_code": f"bench-usage-{idx}",
+                "address": "-",
+                "contact_email": "-",
+                "contact_person": "-",
+                "operation_name": "-",
+                "operation_uid": "-",
+                "status": CustomerStatus.ACTIVE,
+                "company_id": COMPANY_ID,
+                "business_domain": DOMAIN,
+                "source": "BENCH",
+            }
+            for idx in range(customers)
+        ]
+        return list((await session.execute(insert(Customer).returning(Customer.id), rows)).scalars())
+
+
+async def cleanup() -> None:
+    async with postgres_db.session() as session, session.begin():
+        await session.execute(delete(UsageEvent).where(UsageEvent.business_domain == DOMAIN))
+        await session.execute(delete(BillingQuote).where(BillingQuote.business_domain == DOMAIN))
+        await session.execute(delete(BillingTemplate).where(BillingTemplate.business_domain == DOMAIN))
+        await session.execute(delete(Customer).where(Customer.business_domain == DOMAIN))
+        await session.execute(delete(Company).where(Company.company_id == COMPANY_ID))
+        await session.execute(delete(BusinessDomain).where(BusinessDomain.code == DOMAIN))
+
+
+def build_bodies(customer_ids: list[int], batches: int, batch_size: int, rng: random.Random) -> list[bytes]:
+    start = datetime(2026, 9, 1, tzinfo=UTC)
+    bodies: list[bytes] = []
+    for _ in range(batches):
+        events = []
+        for _ in range(batch_size):
+            charge_code, unit = rng.choice(CHARGES)
+            events.append(
+                {
+                    "idempotencyKey": uuid4().hex,
+                    "customerId": rng.choice(customer_ids),
+                    "chargeCode": charge_code,
+                    "unit": unit,
+                    "quantity": rng.randint(1, 20),
+                    "occurredAt": (start + timedelta(seconds=rng.randrange(30 * 86_400))).isoformat(),
+                    "reference": f"WB{rng.randrange(10**10):010d}",
+                }
+            )
+        bodies.append(json.dumps({"events": events, "source": "BENCH"}).encode())
+    return bodies
+
+
+def to_command(body: bytes) -> IngestUsageEventsCommand:
+    payload = UsageEventBatchRequest.model_validate_json(body)
+    return IngestUsageEventsCommand(
+        events=[
+            UsageEventInput(
+                idempotency_key=item.idempotency_key,
+                customer_id=item.customer_id,
+                charge_code=item.charge_code,
+                unit=item.unit,
+                quantity=item.quantity,
+                occurred_at=item.occurred_at,
+                reference=item.reference,
+            )
+            for item in payload.events
+        ],
+        source=payload.source,
+    )
+
+
+async def ingest_row_by_row(body: bytes) -> int:
+    """对照：每个事件一条 ``INSERT ... ON CONFLICT DO NOTHING``."""
+    cmd = to_command(body)
+    async with postgres_db.session() as session, session.begin():
+        for item in cmd.events:
+            stmt = (
+                pg_insert(UsageEvent)
+                .values(
+                    idempotency_key=item.idempotency_key,
+                    customer_id=item.customer_id,
+                    business_domain=DOMAIN,
+                    charge_code=item.charge_code,
+                    unit=item.unit.value,
+                    quantity=item.quantity,
+                    occurred_at=item.occurred_at,
+                    reference=item.reference,
+                    source=cmd.source,
+                )
+                .on_conflict_do_nothing(index_elements=[UsageEvent.business_domain, UsageEvent.idempotency_key])
+            )
+            await session.execute(stmt)
+    return len(cmd.events)
+
+
+async def ingest_batched(body: bytes) -> int:
+    async with postgres_db.session() as session:
+        result = await IngestUsageEventsUseCase(session).execute(to_command(body))
+    if result.rejected:
+        raise RuntimeError(f"unexpected rejections: {result.rejected[:3]}")
+    return result.inserted
+
+
+async def run(label: str, bodies: list[bytes], ingest: Callable[[bytes], Awaitable[int]]) -> None:
+    started = time.perf_counter()
+    events = inserted = 0
+    for body in bodies:
+        inserted += await ingest(body)
+        events += body.count(b'"idempotencyKey"')
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<14} {events:>8,} events  {inserted:>8,} inserted  {elapsed:7.3f} s  {events / elapsed:>10,.0f} events/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--customers", type=int, default=2_000)
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    set_current_user_context(UserContext(user_id="bench", union_id="bench", name="bench", domain_codes=[DOMAIN]))
+    await postgres_db.connect()
+    try:
+        customer_ids = await seed(args.customers)
+        row_bodies = build_bodies(customer_ids, 1, args.batch_size, rng)
+        batch_bodies = build_bodies(customer_ids, args.batches, args.batch_size, rng)
+        await run("row-by-row", row_bodies, ingest_row_by_row)
+        await run("batched", batch_bodies, ingest_batched)
+        await run("batched replay", batch_bodies, ingest_batched)
+    finally:
+        await cleanup()
+        await postgres_db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Rebuild the ``customer_effective_quotes`` materialized table for every customer.
+
+Run once before enabling ``BILLING_MATERIALIZE_EFFECTIVE_QUOTES`` (and after any out-of-band quote or
+group membership edit). Customers are processed in id order, one transaction per batch. ``--verify``
+compares the materialized result with the live resolver for every customer at the current time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import func, select  # noqa: E402
+
+from src.intrastructure.database.models import Customer  # noqa: E402
+from src.intrastructure.database.postgres import postgres_db  # noqa: E402
+from src.intrastructure.repositories import BillingQuoteRepository, CustomerEffectiveQuoteRepository  # noqa: E402
+
+
+async def customer_batches(batch_size: int) -> list[tuple[list[int], list[str]]]:
+    async with postgres_db.session() as session:
+        rows = (
+            await session.execute(select(Customer.id, func.lower(Customer.business_domain)).order_by(Customer.id))
+        ).all()
+    return [
+        (
+            [row[0] for row in rows[start : start + batch_size]],
+            sorted({row[1] for row in rows[start : start + batch_size]}),
+        )
+        for start in range(0, len(rows), batch_size)
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--verify", action="store_true", help="compare with the live resolver after rebuilding")
+    args = parser.parse_args()
+
+    await postgres_db.connect()
+    try:
+        batches = await customer_batches(args.batch_size)
+        started = time.perf_counter()
+        customers = rows = 0
+        for customer_ids, _ in batches:
+            async with postgres_db.session() as session, session.begin():
+                rows += await CustomerEffectiveQuoteRepository(session).refresh_customers(customer_ids)
+            customers += len(customer_ids)
+        print(f"rebuilt {customers:,} customers -> {rows:,} intervals in {time.perf_counter() - started:.2f} s")
+
+        if args.verify:
+            now = datetime.now(UTC)
+            mismatches = 0
+            async with postgres_db.session() as session:
+                for customer_ids, domains in batches:
+                    live = await BillingQuoteRepository(session).resolve_effective_quote_ids(
+                        customer_ids=customer_ids, business_domains=domains, now=now
+                    )
+                    materialized = await CustomerEffectiveQuoteRepository(session).resolve_ids(
+                        customer_ids=customer_ids, business_domains=domains, now=now
+                    )
+                    for customer_id in customer_ids:
+                        if live.get(customer_id) != materialized.get(customer_id):
+                            mismatches += 1
+                            print(
+                                f"mismatch customer={customer_id} live={live.get(customer_id)} "
+                                f"materialized={materialized.get(customer_id)}"
+                            )
+            print(f"verified {customers:,} customers, {mismatches} mismatches")
+            if mismatches:
+                raise SystemExit(1)
+    finally:
+        await postgres_db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,6 +7,7 @@ from src.application.auth.services import UserDomainMappingService
 from src.application.auth.use_cases import AuthenticateUserUseCase, AuthorizeRequestService, RefreshTokenUseCase
 from src.intrastructure.auth import MockDingTalkAuthGateway, RealDingTalkAuthGateway, TokenService
 from src.intrastructure.cache.dingtalk_qr_state import DingTalkQrStateRepository
+from src.intrastructure.cache.verified_token import verified_token_cache
 from src.shared.config import settings
 
 
@@ -43,7 +44,7 @@ def get_authenticate_user_use_case() -> AuthenticateUserUseCase:
 
 @lru_cache
 def get_authorize_request_service() -> AuthorizeRequestService:
-    return AuthorizeRequestService(token_service=get_token_service())
+    return AuthorizeRequestService(token_service=get_token_service(), token_cache=verified_token_cache)
 
 
 @lru_cache
@@ -7,6 +7,7 @@ from structlog.contextvars import bind_contextvars
 from src.application.auth.exceptions import AuthenticationFailedError, AuthorizationError
 from src.application.auth.services import UserDomainMappingService
 from src.intrastructure.auth import DingTalkAuthGateway, TokenService, TokenVerificationError
+from src.intrastructure.cache.verified_token import VerifiedTokenCache
 from src.shared.context import set_current_user_context, set_trace_id
 from src.shared.logger.factories import app_logger
 from src.shared.schemas.auth import AuthenticationResult, CurrentUser, DingTalkLoginRequest
@@ -49,10 +50,15 @@ class AuthenticateUserUseCase:
 
 
 class AuthorizeRequestService:
-    """校验 Authorization header 并绑定当前用户."""
+    """校验 Authorization header 并绑定当前用户.
 
-    def __init__(self, token_service: TokenService) -> None:
+    前端会反复携带同一 token 轮询，传入 ``token_cache`` 时已验签的载荷缓存至 token 过期，
+    命中后跳过签名校验与模型校验。
+    """
+
+    def __init__(self, token_service: TokenService, token_cache: VerifiedTokenCache | None = None) -> None:
         self._token_service = token_service
+        self._token_cache = token_cache
 
     def _extract_token(self, authorization: str | None) -> str:
         if not authorization:
@@ -66,11 +72,15 @@ class AuthorizeRequestService:
 
     def authorize(self, authorization: str | None) -> CurrentUser:
         token = self._extract_token(authorization)
-        try:
-            claims = self._token_service.decode(token)
-            current_user = self._token_service.build_current_user(claims)
-        except TokenVerificationError as exc:
-            raise AuthorizationError(str(exc)) from exc
+        claims = self._token_cache.get(token) if self._token_cache is not None else None
+        if claims is None:
+            try:
+                claims = self._token_service.decode(token)
+            except TokenVerificationError as exc:
+                raise AuthorizationError(str(exc)) from exc
+            if self._token_cache is not None:
+                self._token_cache.put(token, claims)
+        current_user = self._token_service.build_current_user(claims)
 
         trace_id = claims.trace_id
         if trace_id:
@@ -1,22 +1,42 @@
 """Application layer for billing templates and quotes."""
 
 from .commands import (
+    AccrueStorageFeesCommand,
     CreateBillingTemplateCommand,
+    ExportBillingQuotesCommand,
+    IngestUsageEventsCommand,
+    PrepareBillRunCommand,
+    PreviewQuoteChargesCommand,
     QueryBillingQuotesCommand,
     QueryBillingTemplatesCommand,
     ResolveCustomerQuoteCommand,
+    ResolveCustomerQuotesBatchCommand,
+    RetryFailedInvoicesCommand,
+    RunBillPartitionCommand,
     TemplateRuleInput,
     TemplateRuleTierInput,
     UpdateBillingTemplateCommand,
+    UsageEventInput,
+    UsageInput,
 )
 from .use_cases import (
+    AccrueStorageFeesUseCase,
+    CompleteBillRunUseCase,
     CreateBillingTemplateUseCase,
     DeleteBillingTemplateUseCase,
+    ExportBillingQuotesUseCase,
     GetBillingQuoteDetailUseCase,
     GetBillingTemplateDetailUseCase,
+    GetQuotePriceBookUseCase,
+    IngestUsageEventsUseCase,
+    PrepareBillRunUseCase,
+    PreviewQuoteChargesUseCase,
     QueryBillingQuotesUseCase,
     QueryBillingTemplatesUseCase,
+    ResolveCustomerQuotesBatchUseCase,
     ResolveCustomerQuoteUseCase,
+    RetryFailedInvoicesUseCase,
+    RunBillPartitionUseCase,
     UpdateBillingTemplateUseCase,
 )
 
@@ -27,7 +47,17 @@ __all__ = [
     "UpdateBillingTemplateCommand",
     "QueryBillingTemplatesCommand",
     "QueryBillingQuotesCommand",
+    "ExportBillingQuotesCommand",
     "ResolveCustomerQuoteCommand",
+    "ResolveCustomerQuotesBatchCommand",
+    "UsageInput",
+    "PreviewQuoteChargesCommand",
+    "AccrueStorageFeesCommand",
+    "PrepareBillRunCommand",
+    "RunBillPartitionCommand",
+    "RetryFailedInvoicesCommand",
+    "UsageEventInput",
+    "IngestUsageEventsCommand",
     "CreateBillingTemplateUseCase",
     "UpdateBillingTemplateUseCase",
     "DeleteBillingTemplateUseCase",
@@ -35,5 +65,15 @@ __all__ = [
     "GetBillingTemplateDetailUseCase",
     "QueryBillingQuotesUseCase",
     "GetBillingQuoteDetailUseCase",
+    "ExportBillingQuotesUseCase",
     "ResolveCustomerQuoteUseCase",
+    "ResolveCustomerQuotesBatchUseCase",
+    "GetQuotePriceBookUseCase",
+    "PreviewQuoteChargesUseCase",
+    "AccrueStorageFeesUseCase",
+    "PrepareBillRunUseCase",
+    "RunBillPartitionUseCase",
+    "RetryFailedInvoicesUseCase",
+    "CompleteBillRunUseCase",
+    "IngestUsageEventsUseCase",
 ]
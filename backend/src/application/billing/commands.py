@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
 
 from src.domain.billing.entities import (
     PricingMode,
@@ -12,6 +14,7 @@ from src.domain.billing.entities import (
     RuleUnit,
     TemplateType,
 )
+from src.intrastructure.repositories import TotalMode
 
 
 @dataclass(slots=True)
@@ -70,6 +73,8 @@ class QueryBillingTemplatesCommand:
     customer_group_id: int | None = None
     limit: int = 20
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
 
 
 @dataclass(slots=True)
@@ -80,8 +85,83 @@ class QueryBillingQuotesCommand:
     status: QuoteStatus | None = None
     limit: int = 20
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+
+
+@dataclass(slots=True)
+class ExportBillingQuotesCommand:
+    template_id: int | None = None
+    customer_id: int | None = None
+    customer_group_id: int | None = None
+    status: QuoteStatus | None = None
 
 
 @dataclass(slots=True)
 class ResolveCustomerQuoteCommand:
     customer_id: int
+    as_of: datetime | None = None
+
+
+@dataclass(slots=True)
+class ResolveCustomerQuotesBatchCommand:
+    customer_ids: Sequence[int]
+    as_of: datetime | None = None
+
+
+@dataclass(slots=True)
+class AccrueStorageFeesCommand:
+    period: str
+    csv_path: Path | None = None
+    chunk_size: int = 20_000
+
+
+@dataclass(slots=True)
+class PrepareBillRunCommand:
+    period: str
+    partitions: int = 16
+
+
+@dataclass(slots=True)
+class RunBillPartitionCommand:
+    bill_run_id: int
+    partition_no: int
+    batch_size: int = 500
+    chunk_size: int = 20_000
+
+
+@dataclass(slots=True)
+class RetryFailedInvoicesCommand:
+    bill_run_id: int
+    batch_size: int = 500
+    chunk_size: int = 20_000
+
+
+@dataclass(slots=True)
+class UsageInput:
+    charge_code: str
+    unit: RuleUnit
+    quantity: int | float
+
+
+@dataclass(slots=True)
+class PreviewQuoteChargesCommand:
+    quote_id: int
+    usages: Sequence[UsageInput] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class UsageEventInput:
+    idempotency_key: str
+    customer_id: int
+    charge_code: str
+    unit: RuleUnit
+    quantity: Decimal
+    occurred_at: datetime
+    reference: str | None = None
+
+
+@dataclass(slots=True)
+class IngestUsageEventsCommand:
+    events: Sequence[UsageEventInput] = field(default_factory=list)
+    source: str = "WMS"
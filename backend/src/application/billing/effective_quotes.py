@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.intrastructure.database.models import BillingQuote
+from src.intrastructure.repositories import BillingQuoteRepository, CustomerEffectiveQuoteRepository
+from src.shared.config import settings
+from src.shared.logger.factories import app_logger
+from src.shared.utils import ensure_utc
+
+logger = app_logger.bind(component="effective_quotes")
+
+
+class EffectiveQuoteResolver:
+    """客户生效报价解析入口，按 ``BILLING_MATERIALIZE_EFFECTIVE_QUOTES`` 选择实时解析或物化表.
+
+    物化模式下，报价单、客户组成员与客户的变更需在同一事务内调用 ``on_*`` 方法重算受影响客户；
+    非物化模式下这些方法不做任何事。``*_at`` 方法在指定时刻早于当前时间时按报价单实际生效区间
+    （``applied_range``）做历史解析，用于重算历史账期。
+    """
+
+    def __init__(self, session: AsyncSession, materialized: bool | None = None) -> None:
+        self._quote_repo = BillingQuoteRepository(session)
+        self._materialized_repo = CustomerEffectiveQuoteRepository(session)
+        self._materialized = settings.billing.MATERIALIZE_EFFECTIVE_QUOTES if materialized is None else materialized
+
+    @property
+    def materialized(self) -> bool:
+        return self._materialized
+
+    async def resolve(self, *, customer_id: int, now: datetime) -> tuple[str, BillingQuote | None] | None:
+        if self._materialized:
+            return await self._materialized_repo.resolve(customer_id=customer_id, now=now)
+        return await self._quote_repo.resolve_effective_quote(customer_id=customer_id, now=now)
+
+    async def resolve_ids(
+        self,
+        *,
+        customer_ids: Sequence[int],
+        business_domains: Sequence[str],
+        now: datetime,
+    ) -> dict[int, int | None]:
+        if self._materialized:
+            return await self._materialized_repo.resolve_ids(
+                customer_ids=customer_ids, business_domains=business_domains, now=now
+            )
+        return await self._quote_repo.resolve_effective_quote_ids(
+            customer_ids=customer_ids, business_domains=business_domains, now=now
+        )
+
+    async def resolve_at(self, *, customer_id: int, at: datetime) -> tuple[str, BillingQuote | None] | None:
+        # 客户端可能传入不带时区的 asOf，按 UTC 处理
+        at = ensure_utc(at)
+        if at < datetime.now(UTC):
+            return await self._quote_repo.resolve_quote_at(customer_id=customer_id, at=at)
+        return await self.resolve(customer_id=customer_id, now=at)
+
+    async def resolve_ids_at(
+        self,
+        *,
+        customer_ids: Sequence[int],
+        business_domains: Sequence[str],
+        at: datetime,
+    ) -> dict[int, int | None]:
+        at = ensure_utc(at)
+        if at < datetime.now(UTC):
+            return await self._quote_repo.resolve_quote_ids_at(
+                customer_ids=customer_ids, business_domains=business_domains, at=at
+            )
+        return await self.resolve_ids(customer_ids=customer_ids, business_domains=business_domains, now=at)
+
+    async def on_quotes_changed(self, quote_ids: Sequence[int]) -> None:
+        """报价单新增或失效（模板保存 / 删除）."""
+        if self._materialized and quote_ids:
+            rows = await self._materialized_repo.refresh_for_quotes(quote_ids)
+            logger.info("customer effective quotes refreshed", quotes=len(quote_ids), rows=rows)
+
+    async def on_group_members_changed(self, group_id: int) -> None:
+        if self._materialized:
+            rows = await self._materialized_repo.refresh_group(group_id)
+            logger.info("customer effective quotes refreshed", group_id=group_id, rows=rows)
+
+    async def on_customers_created(self, customer_ids: Sequence[int]) -> None:
+        if self._materialized and customer_ids:
+            await self._materialized_repo.refresh_customers(customer_ids)
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.billing.commands import (
+    AccrueStorageFeesCommand,
     CreateBillingTemplateCommand,
+    ExportBillingQuotesCommand,
+    IngestUsageEventsCommand,
+    PrepareBillRunCommand,
+    PreviewQuoteChargesCommand,
     QueryBillingQuotesCommand,
     QueryBillingTemplatesCommand,
     ResolveCustomerQuoteCommand,
+    ResolveCustomerQuotesBatchCommand,
+    RetryFailedInvoicesCommand,
+    RunBillPartitionCommand,
     TemplateRuleInput,
     TemplateRuleTierInput,
     UpdateBillingTemplateCommand,
+    UsageEventInput,
 )
+from src.application.billing.effective_quotes import EffectiveQuoteResolver
 from src.domain.billing.entities import (
     BillingDomainError,
     BillingQuote as DomainQuote,
@@ -28,13 +38,43 @@ from src.domain.billing.entities import (
     TemplateRuleTier,
     TemplateType,
 )
+from src.domain.billing.invoice import BillRunPartitionStatus, BillRunStatus, InvoiceDraft
+from src.domain.billing.rating import (
+    CompiledPriceBook,
+    RatingEngine,
+    RatingResult,
+    group_counted_usage,
+    group_usage,
+)
+from src.domain.billing.storage import (
+    STORAGE_UNITS,
+    BillingPeriod,
+    StorageAccrual,
+    StorageAccumulator,
+    StorageAggregator,
+    rate_storage,
+)
 from src.domain.customer import BusinessDomainGuard
-from src.intrastructure.database.models import BillingQuote, BillingTemplate, BillingTemplateRule
+from src.intrastructure.cache.effective_quote import EffectiveQuoteCache
+from src.intrastructure.cache.price_book import PriceBookCache, price_book_cache
+from src.intrastructure.database.models import (
+    BillingQuote,
+    BillingTemplate,
+    BillingTemplateRule,
+    BillRun,
+    BillRunPartition,
+)
 from src.intrastructure.database.models.billing import TemplateRuleTierRecord
 from src.intrastructure.repositories import (
     BillingQuoteRepository,
     BillingTemplateRepository,
+    BillRunRepository,
     CustomerRepository,
+    InventorySnapshotRepository,
+    InvoiceRepository,
+    QuoteScopeRef,
+    UsageEventRepository,
+    iter_inventory_csv_chunks,
 )
 from src.shared.logger.factories import app_logger
 from src.shared.utils.random import generate_urlsafe_code
@@ -45,19 +85,51 @@ logger = app_logger.bind(component="billing_use_cases")
 @dataclass(slots=True)
 class QueryTemplatesResult:
     items: list[BillingTemplate]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
 
 
 @dataclass(slots=True)
 class QueryQuotesResult:
     items: list[BillingQuote]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class ResolveQuotesBatchResult:
+    quote_ids: dict[int, int | None]
+    missing_customer_ids: list[int]
+
+
+@dataclass(slots=True)
+class RejectedUsageEvent:
+    index: int
+    idempotency_key: str
+    reason: str
+
+
+@dataclass(slots=True)
+class IngestUsageEventsResult:
+    """``duplicates`` 含同批重复与已写入过的幂等键."""
+
+    received: int
+    inserted: int = 0
+    duplicates: int = 0
+    rejected: list[RejectedUsageEvent] = field(default_factory=list)
 
 
 class CreateBillingTemplateUseCase:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        quote_cache: EffectiveQuoteCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
         self._session = session
         self._template_repo = BillingTemplateRepository(session)
+        self._quote_cache = quote_cache or EffectiveQuoteCache()
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
 
     async def execute(
         self,
@@ -89,13 +161,15 @@ class CreateBillingTemplateUseCase:
             domain_template.id = orm_template.id
             # 保存时立即生成报价单
             quote_repo = BillingQuoteRepository(self._session)
-            await _regenerate_quotes(
+            changed = await _regenerate_quotes(
                 template=orm_template,
                 domain_template=domain_template,
                 repo=quote_repo,
                 operator=operator,
             )
+            await self._effective_quotes.on_quotes_changed(changed)
 
+        await self._quote_cache.invalidate_domain(orm_template.business_domain)
         logger.info("billing template created", template_code=orm_template.template_code, template_id=orm_template.id)
         template = await self._template_repo.get_by_id(orm_template.id, with_rules=True)
         if template is None:
@@ -104,10 +178,17 @@ class CreateBillingTemplateUseCase:
 
 
 class UpdateBillingTemplateUseCase:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        quote_cache: EffectiveQuoteCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
         self._session = session
         self._template_repo = BillingTemplateRepository(session)
         self._quote_repo = BillingQuoteRepository(session)
+        self._quote_cache = quote_cache or EffectiveQuoteCache()
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
 
     async def execute(
         self,
@@ -139,13 +220,15 @@ class UpdateBillingTemplateUseCase:
 
             _apply_domain_template_to_model(domain_template, template, operator=operator)
             # 更新时旧报价单失效，生成新报价单
-            await _regenerate_quotes(
+            changed = await _regenerate_quotes(
                 template=template,
                 domain_template=domain_template,
                 repo=self._quote_repo,
                 operator=operator,
             )
+            await self._effective_quotes.on_quotes_changed(changed)
 
+        await self._quote_cache.invalidate_domain(template.business_domain)
         logger.info(
             "billing template updated",
             template_id=template.id,
@@ -165,7 +248,7 @@ class QueryBillingTemplatesUseCase:
         guard = BusinessDomainGuard.from_context()
         domains = guard.allowed_domains
         logger.info(f"业务域: {domains}")
-        items, total = await self._template_repo.search(
+        page = await self._template_repo.search(
             template_type=cmd.template_type,
             business_domains=domains,
             keyword=cmd.keyword,
@@ -173,8 +256,10 @@ class QueryBillingTemplatesUseCase:
             customer_group_id=cmd.customer_group_id,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
         )
-        return QueryTemplatesResult(items=items, total=total)
+        return QueryTemplatesResult(items=page.items, total=page.total, next_cursor=page.next_cursor)
 
 
 class GetBillingTemplateDetailUseCase:
@@ -199,7 +284,7 @@ class QueryBillingQuotesUseCase:
     async def execute(self, cmd: QueryBillingQuotesCommand) -> QueryQuotesResult:
         guard = BusinessDomainGuard.from_context()
         domains = guard.allowed_domains
-        items, total = await self._quote_repo.search(
+        page = await self._quote_repo.search(
             business_domains=domains,
             template_id=cmd.template_id,
             customer_id=cmd.customer_id,
@@ -207,8 +292,28 @@ class QueryBillingQuotesUseCase:
             status=cmd.status,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
+        )
+        return QueryQuotesResult(items=page.items, total=page.total, next_cursor=page.next_cursor)
+
+
+class ExportBillingQuotesUseCase:
+    """按列表相同的过滤条件导出全部报价单，返回分批读取的异步迭代器（由调用方流式消费）."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._quote_repo = BillingQuoteRepository(session)
+
+    async def execute(self, cmd: ExportBillingQuotesCommand) -> AsyncIterator[Sequence[BillingQuote]]:
+        guard = BusinessDomainGuard.from_context()
+        return self._quote_repo.iter_export_chunks(
+            business_domains=guard.allowed_domains,
+            template_id=cmd.template_id,
+            customer_id=cmd.customer_id,
+            customer_group_id=cmd.customer_group_id,
+            status=cmd.status,
         )
-        return QueryQuotesResult(items=items, total=total)
 
 
 class GetBillingQuoteDetailUseCase:
@@ -225,61 +330,623 @@ class GetBillingQuoteDetailUseCase:
         return quote
 
 
-class ResolveCustomerQuoteUseCase:
-    """根据客户→客户组→全局优先级获取生效中的报价单."""
+class GetQuotePriceBookUseCase:
+    """获取报价单价目表，命中进程内缓存时跳过 payload 解码与规则校验."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: PriceBookCache | None = None) -> None:
         self._session = session
         self._quote_repo = BillingQuoteRepository(session)
+        self._cache = cache or price_book_cache
+
+    async def execute(self, quote_id: int) -> CompiledPriceBook | None:
+        revision = await self._quote_repo.get_revision(quote_id)
+        if revision is None:
+            return None
+        business_domain, updated_at = revision
+        guard = BusinessDomainGuard.from_context()
+        guard.ensure_access(business_domain)
+
+        book = self._cache.get(quote_id, updated_at)
+        if book is not None:
+            return book
+
+        loaded = await self._quote_repo.get_payload(quote_id)
+        if loaded is None:
+            return None
+        payload, updated_at = loaded
+        book = CompiledPriceBook.from_payload(payload, quote_id=quote_id, updated_at=updated_at)
+        self._cache.put(book)
+        return book
+
+
+class PreviewQuoteChargesUseCase:
+    """按报价单试算用量费用."""
+
+    def __init__(self, session: AsyncSession, cache: PriceBookCache | None = None) -> None:
+        self._price_book_use_case = GetQuotePriceBookUseCase(session, cache)
+
+    async def execute(self, cmd: PreviewQuoteChargesCommand) -> RatingResult | None:
+        book = await self._price_book_use_case.execute(cmd.quote_id)
+        if book is None:
+            return None
+        series = group_usage((item.charge_code, item.unit, item.quantity) for item in cmd.usages)
+        return RatingEngine(book).rate(series)
+
+
+class _EffectivePriceBooks:
+    """批量解析客户在指定时刻生效的报价单并加载预编译价目表，价目表在批次间复用."""
+
+    def __init__(
+        self,
+        quote_repo: BillingQuoteRepository,
+        cache: PriceBookCache,
+        effective_quotes: EffectiveQuoteResolver,
+    ) -> None:
+        self._quote_repo = quote_repo
+        self._cache = cache
+        self._effective_quotes = effective_quotes
+        self.books: dict[int, CompiledPriceBook] = {}
+
+    async def resolve(
+        self, customer_ids: Sequence[int], business_domains: Sequence[str], at: datetime
+    ) -> dict[int, int | None]:
+        """返回 customer_id → 生效报价单 ID，对应价目表已加载到 ``books``."""
+        quote_ids = await self._effective_quotes.resolve_ids_at(
+            customer_ids=customer_ids, business_domains=business_domains, at=at
+        )
+        await self._load({quote_id for quote_id in quote_ids.values() if quote_id is not None})
+        return quote_ids
+
+    def get(self, quote_id: int | None) -> CompiledPriceBook | None:
+        return self.books.get(quote_id) if quote_id is not None else None
+
+    async def _load(self, quote_ids: set[int]) -> None:
+        missing = quote_ids - self.books.keys()
+        if not missing:
+            return
+        for quote_id, (payload, updated_at) in (await self._quote_repo.get_payloads(list(missing))).items():
+            book = self._cache.get(quote_id, updated_at)
+            if book is None:
+                book = CompiledPriceBook.from_payload(payload, quote_id=quote_id, updated_at=updated_at)
+                self._cache.put(book)
+            self.books[quote_id] = book
+
+
+class _StoragePricing:
+    """为一批客户的库存累计解析账期末生效报价并按 STORAGE 规则计价，价目表在批次间复用."""
+
+    def __init__(
+        self,
+        quote_repo: BillingQuoteRepository,
+        cache: PriceBookCache,
+        effective_quotes: EffectiveQuoteResolver,
+    ) -> None:
+        self._price_books = _EffectivePriceBooks(quote_repo, cache, effective_quotes)
+
+    @property
+    def books(self) -> dict[int, CompiledPriceBook]:
+        return self._price_books.books
+
+    async def rate(
+        self,
+        accumulators: list[StorageAccumulator],
+        period: BillingPeriod,
+        business_domains: list[str],
+    ) -> list[StorageAccrual]:
+        if not accumulators:
+            return []
+        # 已结束的账期按当时实际执行的报价单计费
+        quote_ids = await self._price_books.resolve(
+            [acc.customer_id for acc in accumulators], business_domains, period.closes_at
+        )
+
+        accruals: list[StorageAccrual] = []
+        for acc in accumulators:
+            quote_id = quote_ids.get(acc.customer_id)
+            accrual = StorageAccrual(
+                customer_id=acc.customer_id,
+                period=period.label,
+                quote_id=quote_id,
+                record_count=acc.record_count,
+                snapshot_days=acc.snapshot_days,
+            )
+            book = self._price_books.get(quote_id)
+            if book is None:
+                accrual.error = "no effective quote"
+            else:
+                try:
+                    accrual.result = rate_storage(book, acc)
+                except BillingDomainError as exc:
+                    accrual.error = str(exc)
+            if accrual.error:
+                logger.warning("storage accrual failed", customer_id=acc.customer_id, error=accrual.error)
+            accruals.append(accrual)
+        return accruals
+
+
+class AccrueStorageFeesUseCase:
+    """按账期流式计提仓储费（CBM_DAY / KG_DAY / CBM_MONTH / KG_MONTH）.
+
+    快照按客户有序分批读取（库表或 CSV），每批完成的客户一次性批量解析生效报价并计价，
+    内存只保留一批快照与尚未结束的最后一个客户。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: PriceBookCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
+        self._session = session
+        self._snapshot_repo = InventorySnapshotRepository(session)
+        self._pricing = _StoragePricing(
+            BillingQuoteRepository(session),
+            cache or price_book_cache,
+            effective_quotes or EffectiveQuoteResolver(session),
+        )
+
+    async def execute(self, cmd: AccrueStorageFeesCommand) -> AsyncIterator[StorageAccrual]:
+        period = BillingPeriod.parse(cmd.period)
+        guard = BusinessDomainGuard.from_context()
+        if cmd.csv_path is not None:
+            chunks = iter_inventory_csv_chunks(cmd.csv_path, chunk_size=cmd.chunk_size)
+        else:
+            chunks = self._snapshot_repo.iter_period_chunks(
+                start=period.start,
+                end=period.end,
+                business_domains=guard.allowed_domains,
+                chunk_size=cmd.chunk_size,
+            )
+
+        aggregator = StorageAggregator(period)
+        customers = 0
+        async for chunk in chunks:
+            for accrual in await self._pricing.rate(aggregator.feed(chunk), period, guard.allowed_domains):
+                customers += 1
+                yield accrual
+        for accrual in await self._pricing.rate(aggregator.drain(), period, guard.allowed_domains):
+            customers += 1
+            yield accrual
+        logger.info(
+            "storage fees accrued",
+            period=period.label,
+            customers=customers,
+            price_books=len(self._pricing.books),
+            skipped_snapshots=aggregator.skipped,
+        )
+
+
+class _InvoiceRating:
+    """为一批客户汇总账期内库存快照与用量事件，按账期末生效报价计价，生成账单草稿；分区出账与失败账单重算共用."""
+
+    def __init__(
+        self,
+        snapshot_repo: InventorySnapshotRepository,
+        event_repo: UsageEventRepository,
+        price_books: _EffectivePriceBooks,
+    ) -> None:
+        self._snapshot_repo = snapshot_repo
+        self._event_repo = event_repo
+        self._price_books = price_books
+
+    async def rate(
+        self, customers: list[tuple[int, str]], period: BillingPeriod, *, chunk_size: int, sparse: bool = False
+    ) -> list[InvoiceDraft]:
+        """``customers`` 为按 ID 升序的 (customer_id, business_domain)；``sparse`` 时客户 ID 不连续，用量按 ID 列表读取."""
+        domains = dict(customers)
+        business_domains = sorted({domain.lower() for domain in domains.values()})
+        first_customer_id, last_customer_id = customers[0][0], customers[-1][0]
+        customer_ids = list(domains) if sparse else None
+
+        aggregator = StorageAggregator(period)
+        accumulators: dict[int, StorageAccumulator] = {}
+        chunks = self._snapshot_repo.iter_period_chunks(
+            start=period.start,
+            end=period.end,
+            business_domains=business_domains,
+            chunk_size=chunk_size,
+            first_customer_id=first_customer_id,
+            last_customer_id=last_customer_id,
+            customer_ids=customer_ids,
+        )
+        async for chunk in chunks:
+            accumulators.update((acc.customer_id, acc) for acc in aggregator.feed(chunk))
+        accumulators.update((acc.customer_id, acc) for acc in aggregator.drain())
+
+        events: dict[int, list[tuple[str, RuleUnit, float, int]]] = {}
+        event_rows = await self._event_repo.summarize_period(
+            start=period.opens_at,
+            end=period.ends_at,
+            business_domains=business_domains,
+            first_customer_id=first_customer_id,
+            last_customer_id=last_customer_id,
+            customer_ids=customer_ids,
+        )
+        for customer_id, charge_code, unit, quantity, count in event_rows:
+            events.setdefault(customer_id, []).append((charge_code, RuleUnit(unit), quantity, count))
+
+        # 已结束的账期按当时实际执行的报价单计费
+        quote_ids = await self._price_books.resolve(list(domains), business_domains, period.closes_at)
+        drafts: list[InvoiceDraft] = []
+        # 区间内非 ACTIVE 客户的快照与事件忽略；无用量的客户按零用量出账
+        for customer_id, business_domain in domains.items():
+            quote_id = quote_ids.get(customer_id)
+            draft = InvoiceDraft(customer_id=customer_id, business_domain=business_domain, quote_id=quote_id)
+            book = self._price_books.get(quote_id)
+            if book is None:
+                draft.error = "no effective quote"
+            else:
+                accumulator = accumulators.get(customer_id) or StorageAccumulator(
+                    customer_id=customer_id, period=period
+                )
+                usage = accumulator.to_usage(book) + group_counted_usage(events.get(customer_id, ()))
+                try:
+                    draft.result = RatingEngine(book).rate(usage)
+                except BillingDomainError as exc:
+                    draft.error = str(exc)
+            if draft.error:
+                logger.warning("invoice rating failed", customer_id=customer_id, error=draft.error)
+            drafts.append(draft)
+        return drafts
+
+
+class PrepareBillRunUseCase:
+    """创建账期出账批次并按客户 ID 切分分区；批次已存在时续跑未完成的分区（失败账单由 ``RetryFailedInvoicesUseCase`` 重算）."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._run_repo = BillRunRepository(session)
         self._customer_repo = CustomerRepository(session)
 
-    async def execute(self, cmd: ResolveCustomerQuoteCommand) -> BillingQuote | None:
-        customer = await self._customer_repo.get_detail(cmd.customer_id)
-        if customer is None:
+    async def execute(self, cmd: PrepareBillRunCommand) -> BillRun:
+        period = BillingPeriod.parse(cmd.period)
+        if cmd.partitions <= 0:
+            raise BillingDomainError("partitions must be positive")
+        async with self._session.begin():
+            run = await self._run_repo.get_by_period(period.label)
+            if run is None:
+                bounds = await self._customer_repo.partition_active_ids(cmd.partitions)
+                run = await self._run_repo.create(period=period.label, bounds=bounds)
+                logger.info("bill run created", period=period.label, bill_run_id=run.id, partitions=len(bounds))
+            elif run.status == BillRunStatus.COMPLETED.value:
+                raise BillingDomainError(f"bill run for {period.label} is already completed")
+            else:
+                # 分区边界沿用首次执行时的切分，已提交的客户不会重复计价
+                reopened = await self._run_repo.reopen(run)
+                logger.info("bill run resumed", period=period.label, bill_run_id=run.id, partitions=reopened)
+        return run
+
+
+class RunBillPartitionUseCase:
+    """出账单个分区：按客户 ID 分批读取 ACTIVE 客户，批量解析账期末报价、汇总库存快照与用量事件并计价，写入账单.
+
+    每批的账单与分区检查点在同一事务提交，中断后从检查点之后的客户继续。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: PriceBookCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
+        self._session = session
+        self._run_repo = BillRunRepository(session)
+        self._customer_repo = CustomerRepository(session)
+        self._invoice_repo = InvoiceRepository(session)
+        self._rating = _InvoiceRating(
+            InventorySnapshotRepository(session),
+            UsageEventRepository(session),
+            _EffectivePriceBooks(
+                BillingQuoteRepository(session),
+                cache or price_book_cache,
+                effective_quotes or EffectiveQuoteResolver(session),
+            ),
+        )
+
+    async def execute(self, cmd: RunBillPartitionCommand) -> BillRunPartition | None:
+        """返回执行后的分区；分区已被领取或已完成时返回 None."""
+        async with self._session.begin():
+            run = await self._run_repo.get_by_id(cmd.bill_run_id)
+            if run is None:
+                raise BillingDomainError(f"bill run {cmd.bill_run_id} not found")
+            partition = await self._run_repo.start_partition(cmd.bill_run_id, cmd.partition_no)
+        if partition is None:
             return None
 
+        period = BillingPeriod.parse(run.period)
+        cursor = partition.cursor_customer_id
+        try:
+            while True:
+                async with self._session.begin():
+                    customers = await self._customer_repo.list_active_in_range(
+                        first_id=partition.first_customer_id if cursor is None else cursor + 1,
+                        last_id=partition.last_customer_id,
+                        limit=cmd.batch_size,
+                    )
+                    if not customers:
+                        await self._run_repo.finish_partition(
+                            cmd.bill_run_id, cmd.partition_no, BillRunPartitionStatus.COMPLETED
+                        )
+                        break
+                    drafts = await self._rating.rate(customers, period, chunk_size=cmd.chunk_size)
+                    created = set(await self._invoice_repo.add_drafts(bill_run_id=run.id, period=period, drafts=drafts))
+                    written = [draft for draft in drafts if draft.customer_id in created]
+                    cursor = customers[-1][0]
+                    await self._run_repo.checkpoint(
+                        cmd.bill_run_id,
+                        cmd.partition_no,
+                        cursor_customer_id=cursor,
+                        customers=len(customers),
+                        invoices=len(written),
+                        failed=sum(1 for draft in written if draft.error),
+                        amount=sum(draft.result.total_amount for draft in written),
+                    )
+                logger.debug("bill run batch committed", partition_no=cmd.partition_no, cursor_customer_id=cursor)
+        except Exception as exc:
+            async with self._session.begin():
+                await self._run_repo.finish_partition(
+                    cmd.bill_run_id, cmd.partition_no, BillRunPartitionStatus.FAILED, error=repr(exc)
+                )
+            raise
+
+        async with self._session.begin():
+            refreshed = await self._run_repo.get_partition(cmd.bill_run_id, cmd.partition_no)
+        logger.info(
+            "bill run partition completed",
+            bill_run_id=cmd.bill_run_id,
+            partition_no=cmd.partition_no,
+            customers=refreshed.customer_count if refreshed else None,
+        )
+        return refreshed
+
+
+class RetryFailedInvoicesUseCase:
+    """重算账期内的 FAILED 账单：报价补齐或修正后重跑账期时，按客户 ID 分批重新计价并覆盖失败账单.
+
+    已完成分区的客户不会再被分区出账读取，失败账单只能经此重算；仍失败的账单保持 FAILED。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: PriceBookCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
+        self._session = session
+        self._run_repo = BillRunRepository(session)
+        self._invoice_repo = InvoiceRepository(session)
+        self._rating = _InvoiceRating(
+            InventorySnapshotRepository(session),
+            UsageEventRepository(session),
+            _EffectivePriceBooks(
+                BillingQuoteRepository(session),
+                cache or price_book_cache,
+                effective_quotes or EffectiveQuoteResolver(session),
+            ),
+        )
+
+    async def execute(self, cmd: RetryFailedInvoicesCommand) -> int:
+        """返回本次重算成功（转为 ISSUED）的账单数."""
+        async with self._session.begin():
+            run = await self._run_repo.get_by_id(cmd.bill_run_id)
+            if run is None:
+                raise BillingDomainError(f"bill run {cmd.bill_run_id} not found")
+        period = BillingPeriod.parse(run.period)
+        cursor: int | None = None
+        retried = resolved = 0
+        while True:
+            async with self._session.begin():
+                customers = await self._invoice_repo.list_failed_customers(
+                    period, after_customer_id=cursor, limit=cmd.batch_size
+                )
+                if not customers:
+                    break
+                drafts = await self._rating.rate(customers, period, chunk_size=cmd.chunk_size, sparse=True)
+                await self._invoice_repo.add_drafts(bill_run_id=run.id, period=period, drafts=drafts)
+            cursor = customers[-1][0]
+            retried += len(drafts)
+            resolved += sum(1 for draft in drafts if not draft.error)
+        if retried:
+            logger.info("failed invoices re-rated", period=run.period, retried=retried, resolved=resolved)
+        return resolved
+
+
+class CompleteBillRunUseCase:
+    """汇总分区与账单结果，全部分区完成且无 FAILED 账单时批次标记为 COMPLETED，否则为 FAILED 等待重跑."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._run_repo = BillRunRepository(session)
+
+    async def execute(self, bill_run_id: int) -> BillRun:
+        async with self._session.begin():
+            run = await self._run_repo.get_by_id(bill_run_id)
+            if run is None:
+                raise BillingDomainError(f"bill run {bill_run_id} not found")
+            run = await self._run_repo.summarize(run)
+        logger.info(
+            "bill run finished",
+            period=run.period,
+            status=run.status,
+            customers=run.customer_count,
+            invoices=run.invoice_count,
+            failed=run.failed_count,
+            total_amount=run.total_amount,
+        )
+        return run
+
+
+class IngestUsageEventsUseCase:
+    """批量写入用量事件：业务域内幂等键重复（同批或已写入）的事件跳过；客户不存在、收费项不是生效报价单中的
+    SCAN 收费项或计量单位不符的事件拒收.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: PriceBookCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
+        self._session = session
+        self._customer_repo = CustomerRepository(session)
+        self._event_repo = UsageEventRepository(session)
+        self._price_books = _EffectivePriceBooks(
+            BillingQuoteRepository(session),
+            cache or price_book_cache,
+            effective_quotes or EffectiveQuoteResolver(session),
+        )
+
+    async def execute(self, cmd: IngestUsageEventsCommand) -> IngestUsageEventsResult:
         guard = BusinessDomainGuard.from_context()
-        guard.ensure_access(customer.business_domain)
-
-        now = datetime.now(UTC)
-        quote = await self._quote_repo.find_active_quote(
-            scope=QuoteScope.CUSTOMER,
-            business_domain=customer.business_domain,
-            now=now,
-            customer_id=customer.id,
+        result = IngestUsageEventsResult(received=len(cmd.events))
+
+        async with self._session.begin():
+            domains = await self._customer_repo.get_domains(
+                list({event.customer_id for event in cmd.events}), guard.allowed_domains
+            )
+            charges = await self._scan_charges(cmd.events, domains)
+            rows: list[dict[str, object]] = []
+            # 幂等键在业务域内唯一，同批重复只保留首条
+            seen: set[tuple[str | None, str]] = set()
+            for index, event in enumerate(cmd.events):
+                scoped_key = (domains.get(event.customer_id), event.idempotency_key)
+                if scoped_key in seen:
+                    continue
+                seen.add(scoped_key)
+                reason = _usage_event_reject_reason(event, domains, charges)
+                if reason is not None:
+                    result.rejected.append(RejectedUsageEvent(index, event.idempotency_key, reason))
+                    continue
+                rows.append(
+                    {
+                        "idempotency_key": event.idempotency_key,
+                        "customer_id": event.customer_id,
+                        "business_domain": domains[event.customer_id],
+                        "charge_code": event.charge_code,
+                        "unit": event.unit.value,
+                        "quantity": event.quantity,
+                        "occurred_at": event.occurred_at,
+                        "reference": event.reference,
+                        "source": cmd.source,
+                    }
+                )
+            result.inserted = len(await self._event_repo.add_many(rows))
+
+        result.duplicates = result.received - len(result.rejected) - result.inserted
+        logger.info(
+            "usage events ingested",
+            received=result.received,
+            inserted=result.inserted,
+            duplicates=result.duplicates,
+            rejected=len(result.rejected),
         )
-        if quote is not None:
+        return result
+
+    async def _scan_charges(
+        self, events: Sequence[UsageEventInput], domains: dict[int, str]
+    ) -> dict[tuple[int, str], CompiledPriceBook | None]:
+        """按事件所在账期末（当期即当前）生效的报价单取价目表：(customer_id, 账期) → 价目表，与出账计价一致."""
+        customers_by_period: dict[BillingPeriod, set[int]] = {}
+        for event in events:
+            if event.customer_id in domains:
+                customers_by_period.setdefault(BillingPeriod.of(event.occurred_at), set()).add(event.customer_id)
+        business_domains = sorted({domain.lower() for domain in domains.values()})
+        books: dict[tuple[int, str], CompiledPriceBook | None] = {}
+        for period, customer_ids in customers_by_period.items():
+            quote_ids = await self._price_books.resolve(sorted(customer_ids), business_domains, period.closes_at)
+            for customer_id in customer_ids:
+                books[customer_id, period.label] = self._price_books.get(quote_ids.get(customer_id))
+        return books
+
+
+class ResolveCustomerQuoteUseCase:
+    """根据客户→客户组→全局优先级获取生效中的报价单，优先读取 Redis 缓存."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        quote_cache: EffectiveQuoteCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
+        self._session = session
+        self._quote_cache = quote_cache or EffectiveQuoteCache()
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
+
+    async def execute(self, cmd: ResolveCustomerQuoteCommand) -> BillingQuote | None:
+        guard = BusinessDomainGuard.from_context()
+        if cmd.as_of is not None:
+            # 指定时刻的解析不走缓存
+            resolved = await self._effective_quotes.resolve_at(customer_id=cmd.customer_id, at=cmd.as_of)
+            if resolved is None:
+                return None
+            business_domain, quote = resolved
+            guard.ensure_access(business_domain)
             return quote
 
-        group_members = sorted(
-            (member for member in customer.groups if not member.is_deleted),
-            key=lambda member: member.assigned_at or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
+        # 只在当前用户可访问的业务域下查缓存，命中即已通过权限校验
+        lookup = await self._quote_cache.get(cmd.customer_id, guard.allowed_domains)
+        if lookup.hit:
+            return lookup.quote
+
+        resolved = await self._effective_quotes.resolve(
+            customer_id=cmd.customer_id,
+            now=datetime.now(UTC),
         )
-        for member in group_members:
-            quote = await self._quote_repo.find_active_quote(
-                scope=QuoteScope.GROUP,
-                business_domain=customer.business_domain,
-                now=now,
-                customer_group_id=member.group_id,
-            )
-            if quote is not None:
-                return quote
+        if resolved is None:
+            return None
 
-        return await self._quote_repo.find_active_quote(
-            scope=QuoteScope.GLOBAL,
-            business_domain=customer.business_domain,
-            now=now,
+        business_domain, quote = resolved
+        guard.ensure_access(business_domain)
+        await self._quote_cache.set(
+            cmd.customer_id,
+            business_domain,
+            quote,
+            version=lookup.versions.get(business_domain.lower()),
         )
+        return quote
+
+
+class ResolveCustomerQuotesBatchUseCase:
+    """批量解析客户生效报价单，用于月结等批处理场景."""
+
+    def __init__(self, session: AsyncSession, effective_quotes: EffectiveQuoteResolver | None = None) -> None:
+        self._session = session
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
+
+    async def execute(self, cmd: ResolveCustomerQuotesBatchCommand) -> ResolveQuotesBatchResult:
+        guard = BusinessDomainGuard.from_context()
+        requested = list(dict.fromkeys(cmd.customer_ids))
+        resolved = await self._effective_quotes.resolve_ids_at(
+            customer_ids=requested,
+            business_domains=guard.allowed_domains,
+            at=cmd.as_of or datetime.now(UTC),
+        )
+        # 结果按请求顺序（重复 ID 取首次出现）返回，与各分块的解析顺序无关
+        quote_ids = {customer_id: resolved[customer_id] for customer_id in requested if customer_id in resolved}
+        missing = [customer_id for customer_id in requested if customer_id not in resolved]
+        logger.info(
+            "customer quotes resolved in batch",
+            requested=len(cmd.customer_ids),
+            resolved=len(quote_ids),
+            missing=len(missing),
+        )
+        return ResolveQuotesBatchResult(quote_ids=quote_ids, missing_customer_ids=missing)
 
 
 class DeleteBillingTemplateUseCase:
     """删除计费模板（软删除）."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        quote_cache: EffectiveQuoteCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
         self._session = session
         self._template_repo = BillingTemplateRepository(session)
         self._quote_repo = BillingQuoteRepository(session)
+        self._quote_cache = quote_cache or EffectiveQuoteCache()
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
 
     async def execute(self, template_id: int, operator: str | None = None) -> bool:
         """删除模板并失效关联报价单.
@@ -307,12 +974,37 @@ class DeleteBillingTemplateUseCase:
             template.is_deleted = True
             template.updated_by = operator
             # 将关联报价单标记为 INACTIVE
-            await self._quote_repo.deactivate_by_template(template_id)
+            deactivated = await self._quote_repo.deactivate_by_template(template_id)
+            await self._effective_quotes.on_quotes_changed(deactivated)
 
+        await self._quote_cache.invalidate_domain(template.business_domain)
         logger.info("billing template deleted", template_id=template_id, operator=operator)
         return True
 
 
+def _usage_event_reject_reason(
+    event: UsageEventInput,
+    domains: dict[int, str],
+    charges: dict[tuple[int, str], CompiledPriceBook | None],
+) -> str | None:
+    if event.customer_id not in domains:
+        return "customer not found"
+    if event.unit in STORAGE_UNITS:
+        # 仓储费由每日库存快照计提
+        return f"unit {event.unit.value} is accrued from inventory snapshots"
+    book = charges.get((event.customer_id, BillingPeriod.of(event.occurred_at).label))
+    if book is None:
+        return "no effective quote"
+    rule = book.rules.get(event.charge_code)
+    if rule is None:
+        return f"charge {event.charge_code} is not defined in the effective quote"
+    if rule.channel is not RuleChannel.SCAN:
+        return f"charge {event.charge_code} is not a SCAN charge"
+    if rule.unit is not event.unit:
+        return f"unit {event.unit.value} does not match charge {event.charge_code} ({rule.unit.value})"
+    return None
+
+
 def _build_domain_template_from_payload(
     *,
     template_code: str,
@@ -487,22 +1179,33 @@ async def _regenerate_quotes(
     domain_template: DomainTemplate,
     repo: BillingQuoteRepository,
     operator: str | None,
-) -> None:
+) -> list[int]:
+    """失效受影响作用域的旧报价单并写入新报价单：一条 UPDATE + 一次批量 INSERT，与作用域数量无关.
+
+    返回失效与新增的报价单 ID。
+    """
     quotes = _build_domain_quotes(domain_template)
+    deactivated = await repo.deactivate_scope_quotes(
+        [
+            QuoteScopeRef(
+                scope_type=quote.scope_type,
+                business_domain=quote.business_domain,
+                customer_id=quote.customer_id,
+                customer_group_id=quote.customer_group_id,
+            )
+            for quote in quotes
+        ]
+    )
     orm_quotes: list[BillingQuote] = []
     for quote in quotes:
-        await repo.deactivate_scope_quotes(
-            scope_type=quote.scope_type,
-            business_domain=quote.business_domain,
-            customer_id=quote.customer_id,
-            customer_group_id=quote.customer_group_id,
-        )
         orm_quote = _to_quote_model(quote)
         orm_quote.template_id = template.id
         orm_quote.created_by = operator
         orm_quote.updated_by = operator
         orm_quotes.append(orm_quote)
     await repo.add_all(orm_quotes)
+    logger.debug("billing quotes regenerated", template_id=template.id, deactivated=len(deactivated))
+    return [*deactivated, *(orm_quote.id for orm_quote in orm_quotes)]
 
 
 def _build_domain_quotes(template: DomainTemplate) -> list[DomainQuote]:
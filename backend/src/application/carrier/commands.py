@@ -10,6 +10,7 @@ from src.intrastructure.database.models.carrier import (
     CarrierServiceStatus,
     CarrierStatus,
 )
+from src.intrastructure.repositories import TotalMode
 
 
 @dataclass(slots=True)
@@ -44,6 +45,14 @@ class QueryCarriersCommand:
     status: CarrierStatus | None = None
     limit: int = 20
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+
+
+@dataclass(slots=True)
+class ExportCarrierTariffsCommand:
+    carrier_id: int
+    service_id: int | None = None
 
 
 @dataclass(slots=True)
@@ -72,6 +81,8 @@ class QueryCarrierServicesCommand:
     status: CarrierServiceStatus | None = None
     limit: int = 20
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
 
 
 @dataclass(slots=True)
@@ -112,6 +123,16 @@ class CarrierServiceTariffRowInput:
     price_amount: int = 0
 
 
+@dataclass(slots=True)
+class ImportCarrierServiceRateCardCommand:
+    carrier_id: int
+    service_id: int
+    content: str
+    currency: str = "JPY"
+    effective_from: datetime | None = None
+    effective_to: datetime | None = None
+
+
 @dataclass(slots=True)
 class SetCarrierServiceTariffsCommand:
     carrier_id: int
@@ -121,3 +142,30 @@ class SetCarrierServiceTariffsCommand:
     effective_from: datetime | None = None
     effective_to: datetime | None = None
     rows: Sequence[CarrierServiceTariffRowInput] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class QuoteCarrierServiceCommand:
+    carrier_id: int
+    service_id: int
+    region_code: str
+    girth_cm: float | None = None
+    weight_kg: float | None = None
+    volume_cm3: float | None = None
+    as_of: datetime | None = None
+
+
+@dataclass(slots=True)
+class ParcelInput:
+    region_code: str
+    weight_kg: float | None = None
+    length_cm: float | None = None
+    width_cm: float | None = None
+    height_cm: float | None = None
+    reference: str | None = None
+
+
+@dataclass(slots=True)
+class QuoteParcelsBatchCommand:
+    parcels: Sequence[ParcelInput]
+    as_of: datetime | None = None
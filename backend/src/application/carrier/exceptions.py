@@ -28,3 +28,7 @@ class RegionNotFoundError(ValueError):
 
 class CarrierServiceTariffRegionMismatchError(ValueError):
     """Tariff region not in geo group."""
+
+
+class CarrierServiceTariffNotFoundError(ValueError):
+    """No effective tariff snapshot for carrier service."""
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.carrier.commands import (
     AssignGeoGroupRegionsCommand,
-    CarrierServiceTariffRowInput,
     CreateCarrierCommand,
     CreateCarrierServiceCommand,
     CreateGeoGroupCommand,
+    ExportCarrierTariffsCommand,
+    ImportCarrierServiceRateCardCommand,
+    ParcelInput,
     QueryCarriersCommand,
     QueryCarrierServicesCommand,
+    QuoteCarrierServiceCommand,
+    QuoteParcelsBatchCommand,
     SetCarrierServiceTariffsCommand,
     UpdateCarrierCommand,
     UpdateCarrierServiceCommand,
@@ -24,8 +32,21 @@ from src.application.carrier.exceptions import (
     CarrierServiceGeoGroupConflictError,
     CarrierServiceGeoGroupNotFoundError,
     CarrierServiceNotFoundError,
+    CarrierServiceTariffNotFoundError,
     RegionNotFoundError,
 )
+from src.domain.carrier import (
+    Parcel,
+    RateCardError,
+    RateCardRow,
+    TariffLookupError,
+    TariffMatch,
+    encode_tariff_payload,
+    parse_rate_card,
+)
+from src.domain.region import PostalRegionIndex
+from src.intrastructure.cache.postal_region_index import PostalRegionIndexHolder, postal_region_index
+from src.intrastructure.cache.tariff_snapshot import TariffSnapshotCache, tariff_snapshot_cache
 from src.intrastructure.database.models import (
     Carrier,
     CarrierService,
@@ -45,14 +66,16 @@ logger = app_logger.bind(component="carrier_use_cases")
 
 @dataclass(slots=True)
 class QueryCarriersResult:
-    total: int
+    total: int | None
     items: list[Carrier]
+    next_cursor: str | None = None
 
 
 @dataclass(slots=True)
 class QueryCarrierServicesResult:
-    total: int
+    total: int | None
     items: list[CarrierService]
+    next_cursor: str | None = None
 
 
 @dataclass(slots=True)
@@ -67,6 +90,49 @@ class CarrierServiceTariffGroupListResult:
     items: list[CarrierServiceTariffGroupResult]
 
 
+@dataclass(slots=True)
+class CarrierServiceQuoteResult:
+    snapshot_id: int
+    version: int
+    match: TariffMatch
+
+
+@dataclass(slots=True)
+class ServicePrice:
+    carrier_id: int
+    carrier_code: str
+    service_id: int
+    service_code: str
+    snapshot_version: int
+    currency: str
+    price_amount: int
+
+
+@dataclass(slots=True)
+class ServiceUnavailable:
+    """运输服务无法为包裹报价的原因（区域未覆盖、尺寸/重量超限、缺少运费表所需维度等）."""
+
+    carrier_id: int
+    carrier_code: str
+    service_id: int
+    service_code: str
+    reason: str
+
+
+@dataclass(slots=True)
+class ParcelQuoteResult:
+    parcel: ParcelInput
+    prices: list[ServicePrice]
+    unavailable: list[ServiceUnavailable] = field(default_factory=list)
+
+    @property
+    def cheapest(self) -> ServicePrice | None:
+        """最低价；各服务币种不一致时金额不可比较，返回 None."""
+        if len({price.currency for price in self.prices}) > 1:
+            return None
+        return min(self.prices, key=lambda price: price.price_amount, default=None)
+
+
 class CreateCarrierUseCase:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -124,13 +190,15 @@ class QueryCarriersUseCase:
         self._repo = CarrierRepository(session)
 
     async def execute(self, cmd: QueryCarriersCommand) -> QueryCarriersResult:
-        carriers, total = await self._repo.search_carriers(
+        page = await self._repo.search_carriers(
             keyword=cmd.keyword,
             status=cmd.status,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
         )
-        return QueryCarriersResult(items=carriers, total=total)
+        return QueryCarriersResult(items=page.items, total=page.total, next_cursor=page.next_cursor)
 
 
 class GetCarrierDetailUseCase:
@@ -195,13 +263,15 @@ class QueryCarrierServicesUseCase:
         self._repo = CarrierRepository(session)
 
     async def execute(self, cmd: QueryCarrierServicesCommand) -> QueryCarrierServicesResult:
-        services, total = await self._repo.search_services(
+        page = await self._repo.search_services(
             carrier_id=cmd.carrier_id,
             status=cmd.status,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
         )
-        return QueryCarrierServicesResult(items=services, total=total)
+        return QueryCarrierServicesResult(items=page.items, total=page.total, next_cursor=page.next_cursor)
 
 
 class GetCarrierServiceDetailUseCase:
@@ -276,6 +346,7 @@ class UpdateGeoGroupUseCase:
             group.attributes = cmd.attributes
             group.updated_by = operator
             await self._session.flush()
+        postal_region_index.request_refresh()
         logger.info("carrier service geo group updated", group_id=cmd.group_id)
         return group
 
@@ -293,11 +364,17 @@ class ListGeoGroupsUseCase:
 
 
 class AssignGeoGroupRegionsUseCase:
-    def __init__(self, session: AsyncSession) -> None:
+    """替换分组区域；区域编码优先在进程内区域树中校验，仅树中缺失（可能尚未刷新）的编码回查数据库."""
+
+    def __init__(self, session: AsyncSession, regions: PostalRegionIndexHolder | None = None) -> None:
         self._session = session
         self._repo = CarrierRepository(session)
+        self._regions = regions or postal_region_index
 
     async def execute(self, cmd: AssignGeoGroupRegionsCommand, operator: str) -> CarrierServiceGeoGroup:
+        codes = list(dict.fromkeys(cmd.region_codes))
+        tree = await self._regions.ensure_tree()
+        region_levels = {code: node.level for code in codes if (node := tree.get(code)) is not None}
         async with self._session.begin():
             group = await self._repo.get_geo_group_by_id(cmd.group_id, with_regions=True)
             if group is None:
@@ -306,27 +383,26 @@ class AssignGeoGroupRegionsUseCase:
             if service is None or service.carrier_id != cmd.carrier_id or group.carrier_service_id != service.id:
                 raise CarrierServiceNotFoundError("carrier service not found")
 
-            codes = list(dict.fromkeys(cmd.region_codes))
-            db_regions: list[Region] = await self._repo.fetch_regions_by_codes(codes)
-            found_codes = {region.region_code for region in db_regions}
-            missing = [code for code in codes if code not in found_codes]
+            unknown = [code for code in codes if code not in region_levels]
+            if unknown:
+                db_regions: list[Region] = await self._repo.fetch_regions_by_codes(unknown)
+                region_levels.update((region.region_code, region.level) for region in db_regions)
+            missing = [code for code in codes if code not in region_levels]
             if missing:
                 raise RegionNotFoundError(f"region codes not found: {', '.join(missing)}")
 
-            region_map = {region.region_code: region for region in db_regions}
-            new_regions: list[CarrierServiceGeoGroupRegion] = []
-            for idx, code in enumerate(codes, start=1):
-                region = region_map[code]
-                new_regions.append(
-                    CarrierServiceGeoGroupRegion(
-                        group_id=group.id,
-                        region_code=region.region_code,
-                        region_level=region.level,
-                        priority=idx,
-                    )
+            new_regions = [
+                CarrierServiceGeoGroupRegion(
+                    group_id=group.id,
+                    region_code=code,
+                    region_level=region_levels[code],
+                    priority=idx,
                 )
+                for idx, code in enumerate(codes, start=1)
+            ]
             await self._repo.replace_group_regions(group, new_regions)
             group.updated_by = operator
+        self._regions.request_refresh()
         logger.info("geo group regions updated", group_id=cmd.group_id, region_count=len(cmd.region_codes))
         return group
 
@@ -395,6 +471,24 @@ class ListCarrierServiceTariffsUseCase:
         return CarrierServiceTariffGroupListResult(items=items)
 
 
+class ExportCarrierTariffsUseCase:
+    """导出承运商（可限定服务）的全部运费行，返回分批读取的异步迭代器（由调用方流式消费）."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._repo = CarrierRepository(session)
+
+    async def execute(self, cmd: ExportCarrierTariffsCommand) -> AsyncIterator[Sequence[Row[Any]]]:
+        carrier = await self._repo.get_carrier_by_id(cmd.carrier_id)
+        if carrier is None:
+            raise CarrierNotFoundError("carrier not found")
+        if cmd.service_id is not None:
+            service = await self._repo.get_service_by_id(cmd.service_id)
+            if service is None or service.carrier_id != cmd.carrier_id:
+                raise CarrierServiceNotFoundError("carrier service not found")
+        return self._repo.iter_tariff_export_chunks(cmd.carrier_id, service_id=cmd.service_id)
+
+
 class SetCarrierServiceTariffsUseCase:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -403,6 +497,16 @@ class SetCarrierServiceTariffsUseCase:
     async def execute(self, cmd: SetCarrierServiceTariffsCommand, operator: str) -> CarrierServiceTariffSnapshot:
         if not cmd.rows:
             raise ValueError("tariff rows are required")
+        # 与运价表导入一致：同一尺寸档只能有一个价格
+        errors: list[str] = []
+        seen_bands: dict[tuple[int | None, float | None, int | None], int] = {}
+        for row_num, row in enumerate(cmd.rows, 1):
+            band = (row.girth_max_cm, row.weight_max_kg, row.volume_max_cm3)
+            first = seen_bands.setdefault(band, row_num)
+            if first != row_num:
+                errors.append(f"row {row_num}: duplicate size band (first seen on row {first})")
+        if errors:
+            raise RateCardError(errors)
         async with self._session.begin():
             service = await self._repo.get_service_by_id(cmd.service_id)
             if service is None or service.carrier_id != cmd.carrier_id:
@@ -437,12 +541,7 @@ class SetCarrierServiceTariffsUseCase:
             regions = await self._repo.fetch_regions_by_codes(region_codes)
             region_name_map = {region.region_code: region.name for region in regions}
 
-            payload = _build_tariff_snapshot_payload(
-                region_codes,
-                region_name_map,
-                cmd.currency,
-                list(cmd.rows),
-            )
+            payload = encode_tariff_payload(cmd.currency, [(region_codes, cmd.rows)], region_name_map)
             version = await self._repo.get_latest_tariff_snapshot_version(cmd.carrier_id, cmd.service_id) + 1
             snapshot = CarrierServiceTariffSnapshot(
                 carrier_id=cmd.carrier_id,
@@ -466,41 +565,191 @@ class SetCarrierServiceTariffsUseCase:
         return snapshot
 
 
-def _build_tariff_snapshot_payload(
-    region_codes: list[str],
-    region_name_map: dict[str, str],
-    currency: str,
-    rows: list[CarrierServiceTariffRowInput],
-) -> dict[str, object]:
-    girth_max_values = sorted({row.girth_max_cm for row in rows if row.girth_max_cm is not None})
-    weight_max_values = sorted({row.weight_max_kg for row in rows if row.weight_max_kg is not None})
-    volume_max_values = sorted({row.volume_max_cm3 for row in rows if row.volume_max_cm3 is not None})
-
-    region_axis = [{"code": code, "name": region_name_map.get(code, "")} for code in region_codes]
-    metric_axis: dict[str, list[float] | list[int]] = {}
-    if weight_max_values:
-        metric_axis["weight_max_kg"] = weight_max_values
-    if volume_max_values:
-        metric_axis["volume_max_cm3"] = volume_max_values
-    if girth_max_values:
-        metric_axis["girth_max_cm"] = girth_max_values
-
-    matrix: list[dict[str, object]] = []
-    region_rows = [
-        {
-            "weight_max_kg": row.weight_max_kg,
-            "volume_max_cm3": row.volume_max_cm3,
-            "girth_max_cm": row.girth_max_cm,
-            "price_amount": row.price_amount,
-        }
-        for row in rows
-    ]
-    for code in region_codes:
-        matrix.append({"region_code": code, "rows": region_rows})
-
-    return {
-        "currency": currency,
-        "geo_axis": region_axis,
-        "metric_axis": metric_axis,
-        "matrix": matrix,
-    }
+class ImportCarrierServiceRateCardUseCase:
+    """整张运价表（尺寸档 × 分组）导入.
+
+    先一次解析校验全部单元格，再在一个事务内整体替换服务的运费行（多行 INSERT），
+    并只生成一个覆盖表内全部分组的快照版本。
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._repo = CarrierRepository(session)
+
+    async def execute(self, cmd: ImportCarrierServiceRateCardCommand, operator: str) -> CarrierServiceTariffSnapshot:
+        rate_card = parse_rate_card(cmd.content.splitlines())
+        async with self._session.begin():
+            service = await self._repo.get_service_by_id(cmd.service_id)
+            if service is None or service.carrier_id != cmd.carrier_id:
+                raise CarrierServiceNotFoundError("carrier service not found")
+            carrier = await self._repo.get_carrier_by_id(cmd.carrier_id)
+            if carrier is None:
+                raise CarrierNotFoundError("carrier not found")
+
+            group_map = {group.group_code: group for group in await self._repo.list_geo_groups(cmd.service_id)}
+            missing = [code for code in rate_card.group_codes if code not in group_map]
+            if missing:
+                raise CarrierServiceGeoGroupNotFoundError(f"geo groups not found: {', '.join(missing)}")
+
+            groups: list[tuple[list[str], Sequence[RateCardRow]]] = []
+            owners: dict[str, str] = {}
+            errors: list[str] = []
+            for code in rate_card.group_codes:
+                region_codes = [region.region_code for region in group_map[code].regions]
+                if not region_codes:
+                    errors.append(f"geo group {code!r} has no regions")
+                for region_code in region_codes:
+                    owner = owners.setdefault(region_code, code)
+                    if owner != code:
+                        errors.append(f"region {region_code!r} is covered by both {owner!r} and {code!r}")
+                groups.append((region_codes, rate_card.rows[code]))
+            if errors:
+                raise RateCardError(errors)
+
+            tariff_rows = [
+                {
+                    "carrier_service_id": cmd.service_id,
+                    "geo_group_id": group_map[code].id,
+                    "weight_max_kg": row.weight_max_kg,
+                    "volume_max_cm3": row.volume_max_cm3,
+                    "girth_max_cm": row.girth_max_cm,
+                    "currency": cmd.currency,
+                    "price_amount": row.price_amount,
+                    "created_by": operator,
+                }
+                for code in rate_card.group_codes
+                for row in rate_card.rows[code]
+            ]
+            await self._repo.replace_service_tariffs(cmd.service_id, tariff_rows)
+
+            regions = await self._repo.fetch_regions_by_codes(list(owners))
+            region_name_map = {region.region_code: region.name for region in regions}
+            payload = encode_tariff_payload(cmd.currency, groups, region_name_map)
+            version = await self._repo.get_latest_tariff_snapshot_version(cmd.carrier_id, cmd.service_id) + 1
+            snapshot = CarrierServiceTariffSnapshot(
+                carrier_id=cmd.carrier_id,
+                service_id=cmd.service_id,
+                carrier_code=carrier.carrier_code,
+                service_code=service.service_code,
+                effective_from=cmd.effective_from,
+                effective_to=cmd.effective_to,
+                payload=payload,
+                status=CarrierServiceTariffSnapshotStatus.ACTIVE.value,
+                version=version,
+                created_by=operator,
+            )
+            await self._repo.add_tariff_snapshot(snapshot)
+        logger.info(
+            "carrier service rate card imported",
+            service_id=cmd.service_id,
+            geo_groups=len(rate_card.group_codes),
+            tariff_rows=len(tariff_rows),
+            snapshot_id=snapshot.id,
+            version=version,
+        )
+        return snapshot
+
+
+class QuoteCarrierServiceUseCase:
+    """按生效运费快照查询包裹运费；快照经进程内缓存解码，仅版本变化时重新读取.
+
+    区域未直接登记在运费表中时，沿进程内区域树的祖先链取最近的已覆盖区域。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        snapshots: TariffSnapshotCache | None = None,
+        regions: PostalRegionIndexHolder | None = None,
+    ) -> None:
+        self._session = session
+        self._repo = CarrierRepository(session)
+        self._snapshots = snapshots or tariff_snapshot_cache
+        self._regions = regions or postal_region_index
+
+    async def execute(self, cmd: QuoteCarrierServiceCommand) -> CarrierServiceQuoteResult:
+        snapshot = await self._snapshots.get_effective(
+            self._repo,
+            cmd.as_of or datetime.now(UTC),
+            carrier_id=cmd.carrier_id,
+            service_id=cmd.service_id,
+        )
+        if snapshot is None:
+            raise CarrierServiceTariffNotFoundError("no effective tariff snapshot")
+        index = await self._regions.ensure_loaded()
+        match = snapshot.lookup.quote(
+            cmd.region_code,
+            Parcel(girth_cm=cmd.girth_cm, weight_kg=cmd.weight_kg, volume_cm3=cmd.volume_cm3),
+            ancestors=_ancestor_codes(index, cmd.region_code),
+        )
+        return CarrierServiceQuoteResult(snapshot_id=snapshot.header.id, version=snapshot.header.version, match=match)
+
+
+class QuoteParcelsBatchUseCase:
+    """批量包裹运费试算：从快照缓存取所有 ACTIVE 运输服务的生效快照，对每个包裹逐服务查表.
+
+    区域按祖先链回退到最近的已覆盖区域；无法报价的服务连同原因列入 ``unavailable``。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        snapshots: TariffSnapshotCache | None = None,
+        regions: PostalRegionIndexHolder | None = None,
+    ) -> None:
+        self._session = session
+        self._repo = CarrierRepository(session)
+        self._snapshots = snapshots or tariff_snapshot_cache
+        self._regions = regions or postal_region_index
+
+    async def execute(self, cmd: QuoteParcelsBatchCommand) -> list[ParcelQuoteResult]:
+        services = await self._snapshots.list_effective(self._repo, cmd.as_of or datetime.now(UTC))
+        index = await self._regions.ensure_loaded()
+        ancestors: dict[str, tuple[str, ...]] = {}
+
+        results: list[ParcelQuoteResult] = []
+        for item in cmd.parcels:
+            parcel = Parcel.from_dimensions(
+                length_cm=item.length_cm,
+                width_cm=item.width_cm,
+                height_cm=item.height_cm,
+                weight_kg=item.weight_kg,
+            )
+            chain = ancestors.get(item.region_code)
+            if chain is None:
+                chain = ancestors[item.region_code] = _ancestor_codes(index, item.region_code)
+            result = ParcelQuoteResult(parcel=item, prices=[])
+            for service in services:
+                snapshot = service.header
+                try:
+                    amount = service.lookup.price(item.region_code, parcel, ancestors=chain)
+                except TariffLookupError as exc:
+                    result.unavailable.append(
+                        ServiceUnavailable(
+                            carrier_id=snapshot.carrier_id,
+                            carrier_code=snapshot.carrier_code,
+                            service_id=snapshot.service_id,
+                            service_code=snapshot.service_code,
+                            reason=str(exc),
+                        )
+                    )
+                    continue
+                result.prices.append(
+                    ServicePrice(
+                        carrier_id=snapshot.carrier_id,
+                        carrier_code=snapshot.carrier_code,
+                        service_id=snapshot.service_id,
+                        service_code=snapshot.service_code,
+                        snapshot_version=snapshot.version,
+                        currency=service.lookup.currency,
+                        price_amount=amount,
+                    )
+                )
+            results.append(result)
+        logger.info("parcels quoted in batch", parcels=len(cmd.parcels), services=len(services))
+        return results
+
+
+def _ancestor_codes(index: PostalRegionIndex, region_code: str) -> tuple[str, ...]:
+    """区域的上级区域编码（由近及远）；区域树中不存在的编码没有上级."""
+    return tuple(node.region_code for node in index.tree.ancestors(region_code, include_self=False))
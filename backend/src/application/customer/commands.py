@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from src.domain.customer import CustomerStatus
+from src.intrastructure.repositories import TotalMode
 
 
 @dataclass(slots=True)
@@ -33,6 +34,16 @@ class QueryCustomersCommand:
     source: str | None = None
     limit: int = 20
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+
+
+@dataclass(slots=True)
+class ExportCustomersCommand:
+    keyword: str | None = None
+    business_domain: str | None = None
+    status: CustomerStatus | None = None
+    source: str | None = None
 
 
 @dataclass(slots=True)
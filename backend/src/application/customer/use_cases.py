@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.billing.effective_quotes import EffectiveQuoteResolver
 from src.application.customer.commands import (
     CreateCompanyCommand,
     CreateCustomerCommand,
+    ExportCustomersCommand,
     QueryCustomersCommand,
     UpdateCustomerStatusCommand,
 )
@@ -23,6 +26,7 @@ from src.domain.customer import (
     CustomerGroupEntity,
     CustomerImportService,
 )
+from src.intrastructure.cache.effective_quote import EffectiveQuoteCache
 from src.intrastructure.database.external.company import RbCompanyInfo
 from src.intrastructure.database.models import (
     Company,
@@ -45,8 +49,9 @@ class CreateCustomerResult:
 
 
 class CreateCustomerUseCase:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, effective_quotes: EffectiveQuoteResolver | None = None) -> None:
         self._session = session
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
 
     async def execute(
         self,
@@ -130,6 +135,8 @@ class CreateCustomerUseCase:
 
             await company_repo.add(company)
             await customer_repo.add(customer)
+            # 新客户可能命中业务域的全局报价
+            await self._effective_quotes.on_customers_created([customer.id])
         logger.info("customer created", customer_code=customer.customer_code)
         return CreateCustomerResult(customer=customer, company=company)
 
@@ -137,7 +144,8 @@ class CreateCustomerUseCase:
 @dataclass
 class QueryCustomersResult:
     customers: list[Customer]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
 
 
 class QueryCustomersUseCase:
@@ -157,15 +165,39 @@ class QueryCustomersUseCase:
         else:
             filter_domains = domains
         status_filter = ORMCustStatus(cmd.status.value) if cmd.status else None
-        customers, total = await repo.search(
+        page = await repo.search(
             keyword=cmd.keyword,
             business_domains=filter_domains,
             status=status_filter,
             source=cmd.source,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
+        )
+        return QueryCustomersResult(customers=page.items, total=page.total, next_cursor=page.next_cursor)
+
+
+class ExportCustomersUseCase:
+    """按列表相同的过滤条件导出全部客户，返回分批读取的异步迭代器（由调用方流式消费）."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def execute(self, cmd: ExportCustomersCommand) -> AsyncIterator[Sequence[Customer]]:
+        repo = CustomerRepository(self._session)
+        domain_guard = BusinessDomainGuard.from_context()
+        if cmd.business_domain:
+            domain_guard.ensure_access(cmd.business_domain)
+            filter_domains = [cmd.business_domain]
+        else:
+            filter_domains = domain_guard.allowed_domains
+        return repo.iter_export_chunks(
+            keyword=cmd.keyword,
+            business_domains=filter_domains,
+            status=ORMCustStatus(cmd.status.value) if cmd.status else None,
+            source=cmd.source,
         )
-        return QueryCustomersResult(customers=customers, total=total)
 
 
 class GetCustomerDetailUseCase:
@@ -203,8 +235,15 @@ class ManageGroupResult:
 
 
 class ManageCustomerGroupUseCase:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        quote_cache: EffectiveQuoteCache | None = None,
+        effective_quotes: EffectiveQuoteResolver | None = None,
+    ) -> None:
         self._session = session
+        self._quote_cache = quote_cache or EffectiveQuoteCache()
+        self._effective_quotes = effective_quotes or EffectiveQuoteResolver(session)
 
     async def create_group(
         self,
@@ -251,6 +290,9 @@ class ManageCustomerGroupUseCase:
                 for customer_id in cmd.member_ids
             ]
             await repo.replace_members(cmd.group_id, members)
+            await self._effective_quotes.on_group_members_changed(cmd.group_id)
+        # 成员变化会影响组报价的命中，失效该业务域下的生效报价缓存
+        await self._quote_cache.invalidate_domain(group.business_domain)
         return group
 
 
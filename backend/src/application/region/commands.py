@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from src.intrastructure.database.models.region import RegionLevel
+from src.intrastructure.repositories import TotalMode
 
 
 @dataclass(slots=True)
@@ -13,3 +15,20 @@ class QueryRegionsCommand:
     keyword: str | None = None
     limit: int = 100
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+
+
+@dataclass(slots=True)
+class ResolvePostalCodesCommand:
+    postal_codes: Sequence[str]
+    carrier_service_id: int | None = None
+
+
+@dataclass(slots=True)
+class QueryRegionDescendantsCommand:
+    region_code: str
+    level: RegionLevel | None = None
+    include_self: bool = False
+    limit: int = 1000
+    offset: int = 0
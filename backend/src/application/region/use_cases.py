@@ -4,7 +4,13 @@ from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.region.commands import QueryRegionsCommand
+from src.application.region.commands import (
+    QueryRegionDescendantsCommand,
+    QueryRegionsCommand,
+    ResolvePostalCodesCommand,
+)
+from src.domain.region import GeoGroupRef, PostalResolution, RegionNode
+from src.intrastructure.cache.postal_region_index import PostalRegionIndexHolder, postal_region_index
 from src.intrastructure.database.models import Region
 from src.intrastructure.repositories import RegionRepository
 
@@ -12,23 +18,38 @@ from src.intrastructure.repositories import RegionRepository
 @dataclass(slots=True)
 class QueryRegionsResult:
     items: list[Region]
+    total: int | None
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class RegionDescendantsResult:
+    items: list[RegionNode]
     total: int
 
 
+@dataclass(slots=True)
+class PostalCodeResolveResult:
+    postal_code: str
+    resolution: PostalResolution | None
+
+
 class QueryRegionsUseCase:
     def __init__(self, session: AsyncSession) -> None:
         self._repo = RegionRepository(session)
 
     async def execute(self, cmd: QueryRegionsCommand) -> QueryRegionsResult:
-        regions, total = await self._repo.search(
+        page = await self._repo.search(
             country_code=cmd.country_code,
             level=cmd.level,
             parent_code=cmd.parent_code,
             keyword=cmd.keyword,
             limit=cmd.limit,
             offset=cmd.offset,
+            cursor=cmd.cursor,
+            total_mode=cmd.total_mode,
         )
-        return QueryRegionsResult(items=regions, total=total)
+        return QueryRegionsResult(items=page.items, total=page.total, next_cursor=page.next_cursor)
 
 
 class GetRegionDetailUseCase:
@@ -37,3 +58,72 @@ class GetRegionDetailUseCase:
 
     async def execute(self, region_code: str) -> Region | None:
         return await self._repo.get_by_code(region_code)
+
+
+class ResolvePostalCodesUseCase:
+    """批量邮编 → 最深区域 → 运输服务分组解析，全部在进程内索引完成."""
+
+    def __init__(self, holder: PostalRegionIndexHolder | None = None) -> None:
+        self._holder = holder or postal_region_index
+
+    async def execute(self, cmd: ResolvePostalCodesCommand) -> list[PostalCodeResolveResult]:
+        index = await self._holder.ensure_loaded()
+        results: list[PostalCodeResolveResult] = []
+        for postal_code in cmd.postal_codes:
+            resolution = index.resolve(postal_code)
+            if resolution is not None and cmd.carrier_service_id is not None:
+                group = resolution.geo_groups.get(cmd.carrier_service_id)
+                resolution = PostalResolution(
+                    postal_code=resolution.postal_code,
+                    region=resolution.region,
+                    geo_groups={cmd.carrier_service_id: group} if group is not None else {},
+                )
+            results.append(PostalCodeResolveResult(postal_code=postal_code, resolution=resolution))
+        return results
+
+
+class GetRegionAncestorsUseCase:
+    """区域自身到根的层级链，读取进程内区域树."""
+
+    def __init__(self, holder: PostalRegionIndexHolder | None = None) -> None:
+        self._holder = holder or postal_region_index
+
+    async def execute(self, region_code: str) -> list[RegionNode] | None:
+        tree = await self._holder.ensure_tree()
+        if region_code not in tree:
+            return None
+        return tree.ancestors(region_code)
+
+
+class ListRegionDescendantsUseCase:
+    """展开区域子树（先序），读取进程内区域树."""
+
+    def __init__(self, holder: PostalRegionIndexHolder | None = None) -> None:
+        self._holder = holder or postal_region_index
+
+    async def execute(self, cmd: QueryRegionDescendantsCommand) -> RegionDescendantsResult | None:
+        tree = await self._holder.ensure_tree()
+        if cmd.region_code not in tree:
+            return None
+        nodes = tree.descendants(
+            cmd.region_code,
+            level=cmd.level.value if cmd.level else None,
+            include_self=cmd.include_self,
+        )
+        return RegionDescendantsResult(items=nodes[cmd.offset : cmd.offset + cmd.limit], total=len(nodes))
+
+
+class GetRegionCoverageUseCase:
+    """覆盖区域的运输服务分组：沿父级找到最近的已分配区域."""
+
+    def __init__(self, holder: PostalRegionIndexHolder | None = None) -> None:
+        self._holder = holder or postal_region_index
+
+    async def execute(self, region_code: str, carrier_service_id: int | None = None) -> list[GeoGroupRef] | None:
+        tree = await self._holder.ensure_tree()
+        if region_code not in tree:
+            return None
+        if carrier_service_id is not None:
+            ref = tree.covering_group(region_code, carrier_service_id)
+            return [ref] if ref is not None else []
+        return sorted(tree.coverage(region_code).values(), key=lambda ref: ref.carrier_service_id)
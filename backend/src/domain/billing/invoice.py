@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from src.domain.billing.rating import RatingResult
+from src.domain.billing.storage import BillingPeriod
+
+
+class BillRunStatus(StrEnum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class BillRunPartitionStatus(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class InvoiceStatus(StrEnum):
+    """ISSUED 为已计价；FAILED 为未解析到报价或计价失败，``error`` 记录原因，修正报价后重跑账期会重算并覆盖."""
+
+    ISSUED = "ISSUED"
+    FAILED = "FAILED"
+
+
+def invoice_number(period: BillingPeriod, customer_id: int) -> str:
+    """账单号由账期与客户确定，重跑时保持不变."""
+    return f"INV-{period.start.year:04d}{period.start.month:02d}-{customer_id:010d}"
+
+
+@dataclass(slots=True)
+class InvoiceDraft:
+    """待写入的客户账单：``result`` 的每个计费明细行对应一条账单明细."""
+
+    customer_id: int
+    business_domain: str
+    quote_id: int | None
+    result: RatingResult = field(default_factory=RatingResult)
+    error: str | None = None
+
+    @property
+    def status(self) -> InvoiceStatus:
+        return InvoiceStatus.FAILED if self.error else InvoiceStatus.ISSUED
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import repeat
+from operator import mul
+from types import MappingProxyType
+from typing import Any
+
+from src.domain.billing.entities import (
+    BillingDomainError,
+    PricingMode,
+    RuleCategory,
+    RuleChannel,
+    RuleUnit,
+    TemplateRule,
+)
+from src.shared.logger.factories import domain_logger
+
+logger = domain_logger.bind(component="billing_rating")
+
+Quantity = int | float
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledRule:
+    """单条规则的预编译形态.
+
+    阶梯区间被展开为有序边界 ``edges`` 与单价表 ``prices``（长度为 ``len(edges) + 1``）：
+    数量 ``q`` 的单价为 ``prices[bisect_right(edges, q)]``，``None`` 表示该区间未定义价格
+    （低于首个阶梯 / 阶梯缺口 / 高于最后一个有上限阶梯）。阶梯为全量计价：整笔数量按所落阶梯的单价计费。
+    """
+
+    charge_code: str
+    charge_name: str
+    category: RuleCategory
+    channel: RuleChannel
+    unit: RuleUnit
+    pricing_mode: PricingMode
+    support_only: bool
+    edges: tuple[int, ...] = ()
+    prices: tuple[int | None, ...] = (None,)
+
+    @classmethod
+    def from_rule(cls, rule: TemplateRule) -> CompiledRule:
+        edges: list[int] = []
+        prices: list[int | None] = [None]
+        if rule.pricing_mode is PricingMode.FLAT and rule.price is not None:
+            edges.append(0)
+            prices.append(rule.price)
+        elif rule.pricing_mode is PricingMode.TIERED:
+            # TemplateRule._validate_tiers 已保证按 min_value 排序且互不重叠
+            for tier in rule._tier_items():
+                if edges and tier.min_value == edges[-1]:
+                    prices[-1] = tier.price
+                else:
+                    edges.append(tier.min_value)
+                    prices.append(tier.price)
+                if tier.max_value is None:
+                    break
+                edges.append(tier.max_value)
+                prices.append(None)
+        return cls(
+            charge_code=rule.charge_code,
+            charge_name=rule.charge_name,
+            category=rule.category,
+            channel=rule.channel,
+            unit=rule.unit,
+            pricing_mode=rule.pricing_mode,
+            support_only=rule.support_only,
+            edges=tuple(edges),
+            prices=tuple(prices),
+        )
+
+    def unit_prices(self, quantities: Sequence[Quantity]) -> list[int | None]:
+        """批量查单价，循环全部在 C 层完成."""
+        return list(map(self.prices.__getitem__, map(bisect_right, repeat(self.edges), quantities)))
+
+    def rate(self, quantities: Sequence[Quantity]) -> list[Quantity]:
+        """逐条计算金额（单价 × 数量），不做舍入."""
+        if self.support_only:
+            raise BillingDomainError(f"charge {self.charge_code} is support only and cannot be rated")
+        if not quantities:
+            return []
+        lowest = min(quantities)
+        if lowest < 0:
+            raise BillingDomainError(f"charge {self.charge_code} received negative quantity")
+        if len(self.edges) == 1 and self.prices[1] is not None:
+            # 单区间（FLAT 或单个无上限阶梯）直接乘以常量单价
+            if lowest < self.edges[0]:
+                raise BillingDomainError(f"charge {self.charge_code} has no tier covering quantity {lowest}")
+            return list(map(mul, quantities, repeat(self.prices[1])))
+        unit_prices = self.unit_prices(quantities)
+        if None in unit_prices:
+            missing = quantities[unit_prices.index(None)]
+            raise BillingDomainError(f"charge {self.charge_code} has no tier covering quantity {missing}")
+        return list(map(mul, quantities, unit_prices))
+
+
+@dataclass(slots=True)
+class UsageSeries:
+    """同一收费项、同一计量单位的一批用量；``counts`` 非空时 ``quantities[i]`` 代表 ``counts[i]`` 条数量相同的记录."""
+
+    charge_code: str
+    unit: RuleUnit
+    quantities: Sequence[Quantity]
+    counts: Sequence[int] | None = None
+
+
+@dataclass(slots=True)
+class RatedLine:
+    """计费明细行：按收费项汇总."""
+
+    charge_code: str
+    charge_name: str
+    category: RuleCategory
+    unit: RuleUnit
+    record_count: int
+    quantity: Quantity
+    amount: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "chargeCode": self.charge_code,
+            "chargeName": self.charge_name,
+            "category": self.category.value,
+            "unit": self.unit.value,
+            "recordCount": self.record_count,
+            "quantity": self.quantity,
+            "amount": self.amount,
+        }
+
+
+@dataclass(slots=True)
+class RatingResult:
+    lines: list[RatedLine] = field(default_factory=list)
+
+    @property
+    def total_amount(self) -> int:
+        return sum(line.amount for line in self.lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lines": [line.to_dict() for line in self.lines],
+            "totalAmount": self.total_amount,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledPriceBook:
+    """报价单价目表：charge_code → 预编译规则，只读，可跨请求共享.
+
+    编译时完成 JSON 解析与规则校验，后续计费/预览直接复用。
+    """
+
+    rules: Mapping[str, CompiledRule]
+    quote_id: int | None = None
+    updated_at: datetime | None = None
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any],
+        *,
+        quote_id: int | None = None,
+        updated_at: datetime | None = None,
+    ) -> CompiledPriceBook:
+        rules = (CompiledRule.from_rule(rule_from_payload(item)) for item in payload.get("rules") or [])
+        return cls.from_rules(rules, quote_id=quote_id, updated_at=updated_at)
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[CompiledRule],
+        *,
+        quote_id: int | None = None,
+        updated_at: datetime | None = None,
+    ) -> CompiledPriceBook:
+        mapping = MappingProxyType({rule.charge_code: rule for rule in rules})
+        return cls(rules=mapping, quote_id=quote_id, updated_at=updated_at)
+
+    def get_rule(self, charge_code: str) -> CompiledRule:
+        rule = self.rules.get(charge_code)
+        if rule is None:
+            raise BillingDomainError(f"charge {charge_code} is not defined in quote")
+        return rule
+
+
+class RatingEngine:
+    """基于报价单价目表的计费引擎.
+
+    ``rate`` 按收费项批量计算金额，避免逐条记录的 Python 循环。
+    """
+
+    def __init__(self, price_book: CompiledPriceBook) -> None:
+        self._price_book = price_book
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> RatingEngine:
+        return cls(CompiledPriceBook.from_payload(payload))
+
+    @property
+    def price_book(self) -> CompiledPriceBook:
+        return self._price_book
+
+    @property
+    def rules(self) -> Mapping[str, CompiledRule]:
+        return self._price_book.rules
+
+    def get_rule(self, charge_code: str) -> CompiledRule:
+        return self._price_book.get_rule(charge_code)
+
+    def rate_series(self, series: UsageSeries) -> RatedLine:
+        rule = self.get_rule(series.charge_code)
+        if series.unit is not rule.unit:
+            raise BillingDomainError(
+                f"charge {series.charge_code} expects unit {rule.unit.value}, got {series.unit.value}"
+            )
+        amounts = rule.rate(series.quantities)
+        if series.counts is None:
+            record_count, quantity, amount = len(series.quantities), sum(series.quantities), sum(amounts)
+        else:
+            # 阶梯按单条数量定价，数量相同的记录单价相同，按条数加权即可
+            record_count = sum(series.counts)
+            quantity = sum(map(mul, series.quantities, series.counts))
+            amount = sum(map(mul, amounts, series.counts))
+        return RatedLine(
+            charge_code=rule.charge_code,
+            charge_name=rule.charge_name,
+            category=rule.category,
+            unit=rule.unit,
+            record_count=record_count,
+            quantity=quantity,
+            amount=round(amount),
+        )
+
+    def rate(self, usage: Iterable[UsageSeries]) -> RatingResult:
+        result = RatingResult()
+        merged: dict[str, RatedLine] = {}
+        for series in usage:
+            line = self.rate_series(series)
+            existing = merged.get(line.charge_code)
+            if existing is None:
+                merged[line.charge_code] = line
+                result.lines.append(line)
+                continue
+            existing.record_count += line.record_count
+            existing.quantity += line.quantity
+            existing.amount += line.amount
+        logger.debug(
+            "usage rated",
+            quote_id=self._price_book.quote_id,
+            line_count=len(result.lines),
+            total_amount=result.total_amount,
+        )
+        return result
+
+
+def group_usage(records: Iterable[tuple[str, RuleUnit, Quantity]]) -> list[UsageSeries]:
+    """将 (charge_code, unit, quantity) 行数据按收费项与单位分组."""
+    buckets: dict[tuple[str, RuleUnit], list[Quantity]] = {}
+    for charge_code, unit, quantity in records:
+        key = (charge_code, unit)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = []
+        bucket.append(quantity)
+    return [UsageSeries(charge_code=code, unit=unit, quantities=qty) for (code, unit), qty in buckets.items()]
+
+
+def group_counted_usage(records: Iterable[tuple[str, RuleUnit, Quantity, int]]) -> list[UsageSeries]:
+    """将 (charge_code, unit, quantity, 条数) 聚合行按收费项与单位分组，数量相同的记录只计价一次."""
+    buckets: dict[tuple[str, RuleUnit], tuple[list[Quantity], list[int]]] = {}
+    for charge_code, unit, quantity, count in records:
+        key = (charge_code, unit)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = ([], [])
+        bucket[0].append(quantity)
+        bucket[1].append(count)
+    return [
+        UsageSeries(charge_code=code, unit=unit, quantities=quantities, counts=counts)
+        for (code, unit), (quantities, counts) in buckets.items()
+    ]
+
+
+def rule_from_payload(item: Mapping[str, Any]) -> TemplateRule:
+    """将报价单快照中的规则（camelCase JSON）还原为领域规则."""
+    tiers = [
+        {
+            "min_value": tier["minValue"],
+            "max_value": tier.get("maxValue"),
+            "price": tier["price"],
+            "description": tier.get("description"),
+        }
+        for tier in item.get("tiers") or []
+    ]
+    return TemplateRule(
+        charge_code=item["chargeCode"],
+        charge_name=item["chargeName"],
+        category=RuleCategory(item["category"]),
+        channel=RuleChannel(item["channel"]),
+        unit=RuleUnit(item["unit"]),
+        pricing_mode=PricingMode(item["pricingMode"]),
+        price=item.get("price"),
+        tiers=tiers,
+        description=item.get("description"),
+        support_only=bool(item.get("supportOnly", False)),
+    )
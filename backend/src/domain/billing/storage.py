@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import calendar
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+
+from src.domain.billing.entities import BillingDomainError, RuleCategory, RuleUnit
+from src.domain.billing.rating import CompiledPriceBook, RatingEngine, RatingResult, UsageSeries
+
+DAILY_UNITS = {RuleUnit.CBM_DAY: "volume", RuleUnit.KG_DAY: "weight"}
+MONTHLY_UNITS = {RuleUnit.CBM_MONTH: "volume", RuleUnit.KG_MONTH: "weight"}
+STORAGE_UNITS = frozenset(DAILY_UNITS) | frozenset(MONTHLY_UNITS)
+
+
+@dataclass(slots=True, frozen=True)
+class BillingPeriod:
+    """自然月账期，``end`` 为开区间."""
+
+    start: date
+    end: date
+
+    @classmethod
+    def parse(cls, value: str) -> BillingPeriod:
+        """解析 ``YYYY-MM`` 格式账期."""
+        try:
+            year, month = (int(part) for part in value.split("-"))
+            start = date(year, month, 1)
+        except ValueError as exc:
+            raise BillingDomainError(f"invalid billing period {value!r}, expected YYYY-MM") from exc
+        return cls(start=start, end=start + timedelta(days=calendar.monthrange(year, month)[1]))
+
+    @classmethod
+    def of(cls, moment: datetime) -> BillingPeriod:
+        """时刻（按 UTC，不带时区视为 UTC）所在的账期."""
+        day = (moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment.astimezone(UTC)).date()
+        return cls.parse(f"{day.year:04d}-{day.month:02d}")
+
+    @property
+    def label(self) -> str:
+        return f"{self.start.year:04d}-{self.start.month:02d}"
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days
+
+    @property
+    def opens_at(self) -> datetime:
+        """账期开始时刻（UTC）."""
+        return datetime.combine(self.start, datetime.min.time(), tzinfo=UTC)
+
+    @property
+    def ends_at(self) -> datetime:
+        """下一账期开始时刻（UTC），时刻区间 [opens_at, ends_at) 为开区间."""
+        return datetime.combine(self.end, datetime.min.time(), tzinfo=UTC)
+
+    @property
+    def closes_at(self) -> datetime:
+        """账期结束时刻（UTC），用于按账期末解析生效报价."""
+        return self.ends_at - timedelta(microseconds=1)
+
+    def contains(self, value: date) -> bool:
+        return self.start <= value < self.end
+
+
+@dataclass(slots=True)
+class InventorySnapshot:
+    """客户某日库存快照（体积 m³ / 重量 kg）."""
+
+    customer_id: int
+    snapshot_date: date
+    volume_cbm: float
+    weight_kg: float
+
+
+@dataclass(slots=True)
+class StorageAccumulator:
+    """单个客户在一个账期内的库存累计，按日合并（同日多条快照求和），最多保留账期天数条记录."""
+
+    customer_id: int
+    period: BillingPeriod
+    record_count: int = 0
+    _daily: dict[date, list[float]] = field(default_factory=dict)
+
+    def add(self, snapshot: InventorySnapshot) -> None:
+        bucket = self._daily.get(snapshot.snapshot_date)
+        if bucket is None:
+            self._daily[snapshot.snapshot_date] = [snapshot.volume_cbm, snapshot.weight_kg]
+        else:
+            bucket[0] += snapshot.volume_cbm
+            bucket[1] += snapshot.weight_kg
+        self.record_count += 1
+
+    @property
+    def snapshot_days(self) -> int:
+        return len(self._daily)
+
+    def daily_quantities(self, measure: str) -> list[float]:
+        index = 0 if measure == "volume" else 1
+        return [values[index] for values in self._daily.values() if values[index] > 0]
+
+    def monthly_average(self, measure: str) -> float:
+        """账期日均量：缺失日按 0 计入，即总量 / 账期天数."""
+        index = 0 if measure == "volume" else 1
+        return sum(values[index] for values in self._daily.values()) / self.period.days
+
+    def to_usage(self, book: CompiledPriceBook) -> list[UsageSeries]:
+        """按报价单中的仓储规则生成用量：日单位逐日计价，月单位按日均量计价."""
+        usage: list[UsageSeries] = []
+        for rule in book.rules.values():
+            if rule.category is not RuleCategory.STORAGE or rule.support_only:
+                continue
+            if rule.unit in DAILY_UNITS:
+                quantities = self.daily_quantities(DAILY_UNITS[rule.unit])
+            elif rule.unit in MONTHLY_UNITS:
+                average = self.monthly_average(MONTHLY_UNITS[rule.unit])
+                quantities = [average] if average > 0 else []
+            else:
+                continue
+            if quantities:
+                usage.append(UsageSeries(charge_code=rule.charge_code, unit=rule.unit, quantities=quantities))
+        return usage
+
+
+@dataclass(slots=True)
+class StorageAccrual:
+    """客户账期仓储费计提结果；quote_id 为空表示未解析到生效报价，error 记录计价失败原因."""
+
+    customer_id: int
+    period: str
+    quote_id: int | None
+    record_count: int
+    snapshot_days: int
+    result: RatingResult = field(default_factory=RatingResult)
+    error: str | None = None
+
+
+class StorageAggregator:
+    """按客户分组的流式累计器.
+
+    输入须按 customer_id 升序（同一客户的快照连续出现）。每喂入一批数据，
+    返回已经完整的客户累计；当前批次最后一个客户可能跨批次，保留到下一批或 ``drain``。
+    """
+
+    def __init__(self, period: BillingPeriod) -> None:
+        self._period = period
+        self._pending: dict[int, StorageAccumulator] = {}
+        self._last_customer_id: int | None = None
+        self.skipped = 0
+
+    def feed(self, snapshots: Iterable[InventorySnapshot]) -> list[StorageAccumulator]:
+        period = self._period
+        pending = self._pending
+        last_customer_id = self._last_customer_id
+        for snapshot in snapshots:
+            if not period.contains(snapshot.snapshot_date):
+                self.skipped += 1
+                continue
+            customer_id = snapshot.customer_id
+            if customer_id != last_customer_id:
+                if last_customer_id is not None and customer_id < last_customer_id:
+                    raise BillingDomainError("inventory snapshots must be sorted by customer_id")
+                pending[customer_id] = StorageAccumulator(customer_id=customer_id, period=period)
+                last_customer_id = customer_id
+            pending[customer_id].add(snapshot)
+        self._last_customer_id = last_customer_id
+
+        completed = [acc for customer_id, acc in pending.items() if customer_id != last_customer_id]
+        self._pending = {last_customer_id: pending[last_customer_id]} if last_customer_id in pending else {}
+        return completed
+
+    def drain(self) -> list[StorageAccumulator]:
+        completed = list(self._pending.values())
+        self._pending = {}
+        return completed
+
+
+def rate_storage(book: CompiledPriceBook, accumulator: StorageAccumulator) -> RatingResult:
+    return RatingEngine(book).rate(accumulator.to_usage(book))
@@ -0,0 +1,20 @@
+"""Domain layer for carrier services and tariffs."""
+
+from .payload import TARIFF_PAYLOAD_VERSION, TariffRow, encode_tariff_payload, expand_tariff_payload
+from .rate_card import RateCard, RateCardError, RateCardRow, parse_rate_card
+from .tariff import Parcel, TariffLookup, TariffLookupError, TariffMatch
+
+__all__ = [
+    "TARIFF_PAYLOAD_VERSION",
+    "TariffRow",
+    "encode_tariff_payload",
+    "expand_tariff_payload",
+    "Parcel",
+    "RateCard",
+    "RateCardError",
+    "RateCardRow",
+    "parse_rate_card",
+    "TariffLookup",
+    "TariffLookupError",
+    "TariffMatch",
+]
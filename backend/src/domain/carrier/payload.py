@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Protocol
+
+# 当前写入的快照 payload 版本；无 ``format_version`` 字段的旧快照按 v1 读取
+TARIFF_PAYLOAD_VERSION = 2
+BAND_FIELDS = ("girth_max_cm", "weight_max_kg", "volume_max_cm3")
+
+type BandKey = tuple[float | None, ...]
+
+
+class TariffRow(Protocol):
+    @property
+    def girth_max_cm(self) -> int | None: ...
+
+    @property
+    def weight_max_kg(self) -> float | None: ...
+
+    @property
+    def volume_max_cm3(self) -> int | None: ...
+
+    @property
+    def price_amount(self) -> int: ...
+
+
+def encode_tariff_payload(
+    currency: str,
+    groups: Sequence[tuple[Sequence[str], Sequence[TariffRow]]],
+    region_names: Mapping[str, str],
+) -> dict[str, Any]:
+    """按 (分组区域, 分组价格档) 列表生成 v2 快照 payload.
+
+    v2 把各分组的价格档合并为一张尺寸档表：``metric_axis`` 每个维度一列、按档对齐（未使用的维度省略，
+    空上限为 null）；``price_sets`` 为与档对齐的价格数组（null 表示不提供该档），内容相同的分组共用一组；
+    ``price_set_index`` 与 ``geo_axis`` 对齐，给出每个区域使用的价格组。
+    体积随「价格组 × 档数」增长，而不是 v1 的「区域 × 档数」。
+    同一分组内尺寸档重复且价格不同时抛出 ``ValueError``（无法确定该档价格）。
+    """
+    bands: dict[BandKey, None] = {}
+    for _, rows in groups:
+        for row in rows:
+            bands.setdefault(_band_key(row), None)
+    ordered = sorted(bands, key=lambda band: tuple(_upper(value) for value in band))
+    band_index = {band: index for index, band in enumerate(ordered)}
+    used = [dim for dim in range(len(BAND_FIELDS)) if any(band[dim] is not None for band in ordered)]
+
+    price_sets: list[list[int | None]] = []
+    set_index: dict[tuple[int | None, ...], int] = {}
+    geo_axis: list[dict[str, str]] = []
+    price_set_index: list[int] = []
+    for region_codes, rows in groups:
+        prices: list[int | None] = [None] * len(ordered)
+        for row in rows:
+            band = _band_key(row)
+            position = band_index[band]
+            current = prices[position]
+            if current is None:
+                prices[position] = row.price_amount
+            elif current != row.price_amount:
+                raise ValueError(f"conflicting prices {current} and {row.price_amount} for size band {band}")
+        key = tuple(prices)
+        index = set_index.get(key)
+        if index is None:
+            index = set_index[key] = len(price_sets)
+            price_sets.append(prices)
+        for code in region_codes:
+            geo_axis.append({"code": code, "name": region_names.get(code, "")})
+            price_set_index.append(index)
+
+    return {
+        "format_version": TARIFF_PAYLOAD_VERSION,
+        "currency": currency,
+        "geo_axis": geo_axis,
+        "metric_axis": {BAND_FIELDS[dim]: [band[dim] for band in ordered] for dim in used},
+        "price_sets": price_sets,
+        "price_set_index": price_set_index,
+    }
+
+
+def iter_region_row_sets(payload: Mapping[str, Any]) -> Iterator[tuple[list[str], list[dict[str, Any]]]]:
+    """逐个价格组产出 (使用该组的区域编码, v1 形式的价格行)，兼容 v1 / v2 payload.
+
+    v1 每个 ``matrix`` 条目产出一次；v2 每个 ``price_sets`` 条目产出一次。
+    """
+    if payload.get("format_version", 1) == 1:
+        for entry in payload.get("matrix") or []:
+            yield [entry["region_code"]], list(entry.get("rows") or [])
+        return
+
+    axis = payload.get("metric_axis") or {}
+    columns = [(name, axis[name]) for name in BAND_FIELDS if name in axis]
+    regions: list[list[str]] = [[] for _ in payload.get("price_sets") or []]
+    for item, index in zip(payload.get("geo_axis") or [], payload.get("price_set_index") or [], strict=True):
+        regions[index].append(item["code"])
+    for region_codes, prices in zip(regions, payload.get("price_sets") or [], strict=True):
+        rows = [
+            {**{name: column[position] for name, column in columns}, "price_amount": price}
+            for position, price in enumerate(prices)
+            if price is not None
+        ]
+        yield region_codes, rows
+
+
+def expand_tariff_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """把任意版本的 payload 展开为 v1 结构（逐区域 ``matrix``），用于接口展示."""
+    if payload.get("format_version", 1) == 1:
+        return dict(payload)
+    by_region: dict[str, list[dict[str, Any]]] = {}
+    for region_codes, rows in iter_region_row_sets(payload):
+        for code in region_codes:
+            by_region[code] = rows
+    axis = payload.get("metric_axis") or {}
+    return {
+        "currency": payload.get("currency"),
+        "geo_axis": payload.get("geo_axis") or [],
+        "metric_axis": {
+            name: sorted({value for value in values if value is not None}) for name, values in axis.items()
+        },
+        "matrix": [
+            {"region_code": item["code"], "rows": by_region[item["code"]]} for item in payload.get("geo_axis") or []
+        ],
+        "generated_at": payload.get("generated_at"),
+    }
+
+
+def _band_key(row: TariffRow) -> BandKey:
+    return (row.girth_max_cm, row.weight_max_kg, row.volume_max_cm3)
+
+
+def _upper(value: float | None) -> float:
+    return math.inf if value is None else float(value)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import csv
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+# 表头中的尺寸档列（忽略大小写与下划线），其余列均视为覆盖分组编码
+BAND_COLUMNS = {
+    "girthmaxcm": "girth_max_cm",
+    "weightmaxkg": "weight_max_kg",
+    "volumemaxcm3": "volume_max_cm3",
+}
+MAX_REPORTED_ERRORS = 50
+
+
+class RateCardError(ValueError):
+    """运价表解析 / 校验失败，``errors`` 为逐单元格的错误列表."""
+
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+        shown = "; ".join(errors[:MAX_REPORTED_ERRORS])
+        more = len(errors) - MAX_REPORTED_ERRORS
+        super().__init__(f"invalid rate card: {shown}" + (f" (and {more} more)" if more > 0 else ""))
+
+
+@dataclass(slots=True, frozen=True)
+class RateCardRow:
+    girth_max_cm: int | None
+    weight_max_kg: float | None
+    volume_max_cm3: int | None
+    price_amount: int
+
+
+@dataclass(slots=True, frozen=True)
+class RateCard:
+    """整张运价表：分组编码（按列顺序）→ 该分组的价格档."""
+
+    group_codes: tuple[str, ...]
+    rows: Mapping[str, tuple[RateCardRow, ...]]
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+
+def parse_rate_card(lines: Iterable[str]) -> RateCard:
+    """解析「尺寸档 × 分组」矩阵（CSV 或 Excel 另存的 CSV / TSV），一次遍历收集全部错误.
+
+    首行为表头：``girthMaxCm`` / ``weightMaxKg`` / ``volumeMaxCm3`` 中至少一列为尺寸档，其余列为分组编码；
+    之后每行一个尺寸档，单元格为该分组的价格（最小货币单位），留空表示该分组不提供此档。
+    """
+    iterator = iter(lines)
+    header_line = next(iterator, "").lstrip("﻿")
+    delimiter = "\t" if "\t" in header_line else ","
+    reader = csv.reader([header_line], delimiter=delimiter)
+    header = [cell.strip() for cell in next(reader, [])]
+
+    errors: list[str] = []
+    band_index: dict[str, int] = {}
+    group_index: list[tuple[int, str]] = []
+    for index, name in enumerate(header):
+        field = BAND_COLUMNS.get(name.replace("_", "").lower())
+        if field is not None:
+            if field in band_index:
+                errors.append(f"duplicate column {name!r}")
+            band_index[field] = index
+        elif name:
+            if any(code == name for _, code in group_index):
+                errors.append(f"duplicate geo group column {name!r}")
+            group_index.append((index, name))
+    if not band_index:
+        errors.append("header has no size band column (girthMaxCm / weightMaxKg / volumeMaxCm3)")
+    if not group_index:
+        errors.append("header has no geo group column")
+    if errors:
+        raise RateCardError(errors)
+
+    rows: dict[str, list[RateCardRow]] = {code: [] for _, code in group_index}
+    seen_bands: dict[tuple[int | None, float | None, int | None], int] = {}
+    body = csv.reader(iterator, delimiter=delimiter)
+    for record in body:
+        line_num = body.line_num + 1
+        if not any(cell.strip() for cell in record):
+            continue
+        cells = record + [""] * (len(header) - len(record))
+        reported = len(errors)
+        girth = _parse_cell(cells, band_index.get("girth_max_cm"), int, line_num, header, errors)
+        weight = _parse_cell(cells, band_index.get("weight_max_kg"), float, line_num, header, errors)
+        volume = _parse_cell(cells, band_index.get("volume_max_cm3"), int, line_num, header, errors)
+        if girth is None and weight is None and volume is None:
+            if len(errors) == reported:
+                errors.append(f"line {line_num}: size band has no limits")
+            continue
+        band = (girth, weight, volume)
+        if band in seen_bands:
+            errors.append(f"line {line_num}: duplicate size band (first seen on line {seen_bands[band]})")
+            continue
+        seen_bands[band] = line_num
+        for index, code in group_index:
+            price = _parse_cell(cells, index, int, line_num, header, errors)
+            if price is not None:
+                rows[code].append(RateCardRow(girth, weight, volume, price))
+
+    for code, group_rows in rows.items():
+        if not group_rows:
+            errors.append(f"geo group column {code!r} has no prices")
+    if errors:
+        raise RateCardError(errors)
+    return RateCard(
+        group_codes=tuple(code for _, code in group_index),
+        rows={code: tuple(group_rows) for code, group_rows in rows.items()},
+    )
+
+
+def _parse_cell[T: (int, float)](
+    cells: list[str],
+    index: int | None,
+    kind: type[T],
+    line_num: int,
+    header: list[str],
+    errors: list[str],
+) -> T | None:
+    if index is None:
+        return None
+    raw = cells[index].strip().replace(",", "")
+    if not raw:
+        return None
+    try:
+        value = kind(raw)
+    except ValueError:
+        errors.append(f"line {line_num}, column {header[index]!r}: {cells[index]!r} is not a valid number")
+        return None
+    if not math.isfinite(value) or value < 0:
+        errors.append(f"line {line_num}, column {header[index]!r}: value must be a non-negative number")
+        return None
+    return value
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .payload import iter_region_row_sets
+
+# 矩阵维度：(payload 字段, 包裹属性)
+DIMENSIONS = (
+    ("girth_max_cm", "girth_cm"),
+    ("weight_max_kg", "weight_kg"),
+    ("volume_max_cm3", "volume_cm3"),
+)
+
+RowBounds = tuple[float | None, float | None, float | None]
+
+
+class TariffLookupError(ValueError):
+    """运费查询失败（区域未覆盖、尺寸超限、缺少维度等）."""
+
+
+@dataclass(slots=True, frozen=True)
+class Parcel:
+    """待计价包裹，未使用的维度可为空."""
+
+    girth_cm: float | None = None
+    weight_kg: float | None = None
+    volume_cm3: float | None = None
+
+    @classmethod
+    def from_dimensions(
+        cls,
+        *,
+        length_cm: float | None,
+        width_cm: float | None,
+        height_cm: float | None,
+        weight_kg: float | None,
+    ) -> Parcel:
+        """由长宽高推导三边合计与体积，任一边缺失时两者均为空."""
+        if length_cm is None or width_cm is None or height_cm is None:
+            return cls(weight_kg=weight_kg)
+        return cls(
+            girth_cm=length_cm + width_cm + height_cm,
+            weight_kg=weight_kg,
+            volume_cm3=length_cm * width_cm * height_cm,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class TariffMatch:
+    region_code: str
+    currency: str
+    price_amount: int
+    girth_max_cm: float | None
+    weight_max_kg: float | None
+    volume_max_cm3: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class _RegionTable:
+    """单个区域的编译结果.
+
+    行按 (girth, weight, volume) 上限升序排列，``lookups`` 为各启用维度的 (维度下标, 上限数组)，空上限记为 +inf。
+    若各列均单调不减，满足某一维度的行是一段后缀，命中行即各维度 bisect 结果的最大值；
+    否则退化为顺序扫描。
+    """
+
+    lookups: tuple[tuple[int, tuple[float, ...]], ...]
+    prices: tuple[int, ...]
+    bounds: tuple[RowBounds, ...]
+    monotone: bool
+
+    @classmethod
+    def compile(cls, rows: Sequence[Mapping[str, Any]]) -> _RegionTable:
+        parsed: list[tuple[RowBounds, int]] = []
+        for row in rows:
+            bounds: RowBounds = (row.get("girth_max_cm"), row.get("weight_max_kg"), row.get("volume_max_cm3"))
+            parsed.append((bounds, int(row["price_amount"])))
+        parsed.sort(key=lambda item: tuple(_upper(value) for value in item[0]))
+
+        lookups = tuple(
+            (idx, tuple(_upper(bounds[idx]) for bounds, _ in parsed))
+            for idx in range(len(DIMENSIONS))
+            if any(bounds[idx] is not None for bounds, _ in parsed)
+        )
+        monotone = all(all(a <= b for a, b in zip(column, column[1:], strict=False)) for _, column in lookups)
+        return cls(
+            lookups=lookups,
+            prices=tuple(price for _, price in parsed),
+            bounds=tuple(bounds for bounds, _ in parsed),
+            monotone=monotone,
+        )
+
+    def find(self, values: tuple[float | None, float | None, float | None]) -> int | None:
+        """返回首个各维度上限均不小于包裹尺寸的行下标，values 为 (girth, weight, volume)."""
+        size = len(self.prices)
+        index = 0
+        for dim, column in self.lookups:
+            value = values[dim]
+            if value is None:
+                raise TariffLookupError(f"{DIMENSIONS[dim][1]} is required by tariff")
+            if self.monotone:
+                index = bisect_left(column, value, index)
+                if index == size:
+                    return None
+        if self.monotone:
+            return index
+        for index in range(size):
+            if all(column[index] >= values[dim] for dim, column in self.lookups):  # type: ignore[operator]
+                return index
+        return None
+
+
+def _upper(value: float | None) -> float:
+    return math.inf if value is None else float(value)
+
+
+class TariffLookup:
+    """运费快照查询器：把快照 payload 编译为按区域的有序数组，查询为二分查找.
+
+    内容相同的区域行共享同一份编译结果。实例不可变，可在协程间共享。
+    """
+
+    def __init__(self, currency: str, tables: Mapping[str, _RegionTable]) -> None:
+        self._currency = currency
+        self._tables = MappingProxyType(dict(tables))
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> TariffLookup:
+        compiled: dict[tuple[tuple[Any, ...], ...], _RegionTable] = {}
+        tables: dict[str, _RegionTable] = {}
+        for region_codes, rows in iter_region_row_sets(payload):
+            key = tuple(
+                (row.get("girth_max_cm"), row.get("weight_max_kg"), row.get("volume_max_cm3"), row["price_amount"])
+                for row in rows
+            )
+            table = compiled.get(key)
+            if table is None:
+                table = compiled[key] = _RegionTable.compile(rows)
+            for code in region_codes:
+                tables[code] = table
+        return cls(currency=str(payload.get("currency") or "JPY"), tables=tables)
+
+    @property
+    def currency(self) -> str:
+        return self._currency
+
+    @property
+    def region_codes(self) -> list[str]:
+        return list(self._tables)
+
+    def price(self, region_code: str, parcel: Parcel, *, ancestors: Sequence[str] = ()) -> int:
+        _, table, index = self._locate(region_code, parcel, ancestors)
+        return table.prices[index]
+
+    def quote(self, region_code: str, parcel: Parcel, *, ancestors: Sequence[str] = ()) -> TariffMatch:
+        """``region_code`` 未直接覆盖时按 ``ancestors``（由近及远）取最近的已覆盖区域，``region_code`` 返回该区域."""
+        covered, table, index = self._locate(region_code, parcel, ancestors)
+        girth_max_cm, weight_max_kg, volume_max_cm3 = table.bounds[index]
+        return TariffMatch(
+            region_code=covered,
+            currency=self._currency,
+            price_amount=table.prices[index],
+            girth_max_cm=girth_max_cm,
+            weight_max_kg=weight_max_kg,
+            volume_max_cm3=volume_max_cm3,
+        )
+
+    def _locate(self, region_code: str, parcel: Parcel, ancestors: Sequence[str]) -> tuple[str, _RegionTable, int]:
+        # 运费表只登记分组自身的区域编码；市区町村等下级区域沿祖先链取最近的已覆盖区域
+        covered = region_code
+        table = self._tables.get(region_code)
+        if table is None:
+            for covered in ancestors:
+                table = self._tables.get(covered)
+                if table is not None:
+                    break
+            else:
+                raise TariffLookupError(f"region {region_code} is not covered by tariff")
+        index = table.find((parcel.girth_cm, parcel.weight_kg, parcel.volume_cm3))
+        if index is None:
+            raise TariffLookupError(f"parcel exceeds tariff limits for region {covered}")
+        return covered, table, index
@@ -0,0 +1,15 @@
+"""Domain layer for administrative regions."""
+
+from .entities import LEVEL_DEPTH, GeoGroupRef, RegionNode
+from .postal import PostalRegionIndex, PostalResolution, normalize_postal_code
+from .tree import RegionTree
+
+__all__ = [
+    "LEVEL_DEPTH",
+    "GeoGroupRef",
+    "PostalRegionIndex",
+    "PostalResolution",
+    "RegionNode",
+    "RegionTree",
+    "normalize_postal_code",
+]
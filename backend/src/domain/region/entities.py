@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# 行政层级由浅到深，前缀相同时取更深的区域
+LEVEL_DEPTH = {"COUNTRY": 0, "PREFECTURE": 1, "CITY": 2, "DISTRICT": 3, "TOWN": 4}
+
+
+@dataclass(slots=True, frozen=True)
+class RegionNode:
+    region_code: str
+    name: str
+    level: str
+    parent_code: str | None = None
+    postal_code_prefix: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class GeoGroupRef:
+    """运输服务虚拟区域分组命中结果；region_code 为分组中实际命中的（祖先）区域."""
+
+    carrier_service_id: int
+    group_id: int
+    group_code: str
+    region_code: str
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import unicodedata
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from src.domain.region.entities import LEVEL_DEPTH, GeoGroupRef, RegionNode
+from src.domain.region.tree import RegionTree
+
+_EMPTY_GROUPS: Mapping[int, GeoGroupRef] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
+class PostalResolution:
+    postal_code: str
+    region: RegionNode
+    geo_groups: Mapping[int, GeoGroupRef] = field(default_factory=lambda: _EMPTY_GROUPS)
+
+
+def normalize_postal_code(value: str) -> str:
+    """全角转半角并去掉 〒、连字符和空白，仅保留数字."""
+    return "".join(ch for ch in unicodedata.normalize("NFKC", value) if ch.isdigit())
+
+
+class PostalRegionIndex:
+    """邮编最长前缀索引.
+
+    按前缀长度分桶（``{长度: {前缀: 区域}}``），查询从最长桶向下尝试，最多 7 次字典查找。
+    命中区域的运输服务分组取自 :class:`RegionTree` 预先合并的覆盖映射。
+    实例构建后只读，刷新时整体替换。
+    """
+
+    def __init__(
+        self,
+        regions: Iterable[RegionNode],
+        geo_groups: Iterable[GeoGroupRef] = (),
+    ) -> None:
+        self.tree = RegionTree(regions, geo_groups)
+
+        buckets: dict[int, dict[str, RegionNode]] = {}
+        for region in self.tree:
+            prefix = normalize_postal_code(region.postal_code_prefix or "")
+            if not prefix:
+                continue
+            bucket = buckets.setdefault(len(prefix), {})
+            current = bucket.get(prefix)
+            if current is None or _deeper(region, current):
+                bucket[prefix] = region
+        self._lengths = tuple(sorted(buckets, reverse=True))
+        self._buckets = buckets
+
+    @property
+    def region_count(self) -> int:
+        return len(self.tree)
+
+    @property
+    def prefix_count(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def lookup(self, postal_code: str) -> RegionNode | None:
+        """返回最长前缀命中的区域，postal_code 需已规范化为纯数字."""
+        size = len(postal_code)
+        buckets = self._buckets
+        for length in self._lengths:
+            if length > size:
+                continue
+            region = buckets[length].get(postal_code[:length])
+            if region is not None:
+                return region
+        return None
+
+    def resolve(self, postal_code: str) -> PostalResolution | None:
+        normalized = normalize_postal_code(postal_code)
+        region = self.lookup(normalized) if normalized else None
+        if region is None:
+            return None
+        return PostalResolution(
+            postal_code=normalized,
+            region=region,
+            geo_groups=self.tree.coverage(region.region_code),
+        )
+
+    def ancestors(self, region_code: str) -> list[RegionNode]:
+        """自身到根的区域链."""
+        return self.tree.ancestors(region_code)
+
+
+def _deeper(candidate: RegionNode, current: RegionNode) -> bool:
+    candidate_depth = LEVEL_DEPTH.get(candidate.level, 0)
+    current_depth = LEVEL_DEPTH.get(current.level, 0)
+    if candidate_depth != current_depth:
+        return candidate_depth > current_depth
+    return candidate.region_code < current.region_code
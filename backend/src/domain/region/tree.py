@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+
+from src.domain.region.entities import GeoGroupRef, RegionNode
+
+_EMPTY_GROUPS: Mapping[int, GeoGroupRef] = MappingProxyType({})
+
+
+class RegionTree:
+    """进程内区域层级树（COUNTRY → PREFECTURE → CITY → DISTRICT → TOWN，按 parent_code 连接）.
+
+    节点按先序遍历编号存放在紧凑数组中：``_parent`` 为父节点下标（根为 -1），
+    子树对应先序区间 ``[i, _end[i])``，因此祖先链为 O(depth)，祖先判定为 O(1)，子树展开为切片。
+    父级缺失的区域视为根；成环的父级链在环上任一点断开。
+    每个节点预先合并自身及祖先的 ``{carrier_service_id: GeoGroupRef}``，最近的直接映射优先。
+    实例构建后只读，刷新时整体替换。
+    """
+
+    def __init__(self, regions: Iterable[RegionNode], geo_groups: Iterable[GeoGroupRef] = ()) -> None:
+        by_code: dict[str, RegionNode] = {}
+        for region in regions:
+            by_code[region.region_code] = region
+
+        children: dict[str | None, list[str]] = {}
+        for code in sorted(by_code):
+            parent_code = by_code[code].parent_code
+            children.setdefault(parent_code if parent_code in by_code else None, []).append(code)
+
+        nodes: list[RegionNode] = []
+        index: dict[str, int] = {}
+        parent = array("i")
+        depth = array("i")
+        end = array("i")
+
+        def visit(root_code: str, root_parent: int) -> None:
+            # 迭代先序遍历，出栈时回填子树结束位置
+            stack: list[tuple[str, int, bool]] = [(root_code, root_parent, False)]
+            while stack:
+                code, parent_idx, done = stack.pop()
+                if done:
+                    end[index[code]] = len(nodes)
+                    continue
+                idx = len(nodes)
+                index[code] = idx
+                nodes.append(by_code[code])
+                parent.append(parent_idx)
+                depth.append(depth[parent_idx] + 1 if parent_idx >= 0 else 0)
+                end.append(idx + 1)
+                stack.append((code, parent_idx, True))
+                for child in reversed(children.get(code, ())):
+                    if child not in index:
+                        stack.append((child, idx, False))
+
+        for code in children.get(None, ()):
+            visit(code, -1)
+        for code in sorted(by_code):
+            if code not in index:
+                visit(code, -1)
+
+        self._nodes = nodes
+        self._index = index
+        self._parent = parent
+        self._depth = depth
+        self._end = end
+
+        direct: dict[int, dict[int, GeoGroupRef]] = {}
+        for ref in geo_groups:
+            idx = index.get(ref.region_code, -1)
+            if idx >= 0:
+                direct.setdefault(idx, {})[ref.carrier_service_id] = ref
+        self._direct = direct
+        # 先序保证父节点先于子节点，无直接映射的节点与父级共享同一份映射
+        coverage: list[Mapping[int, GeoGroupRef]] = []
+        for idx in range(len(nodes)):
+            inherited = coverage[parent[idx]] if parent[idx] >= 0 else _EMPTY_GROUPS
+            own = direct.get(idx)
+            coverage.append(MappingProxyType({**inherited, **own}) if own else inherited)
+        self._coverage = coverage
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[RegionNode]:
+        return iter(self._nodes)
+
+    def __contains__(self, region_code: object) -> bool:
+        return region_code in self._index
+
+    def get(self, region_code: str) -> RegionNode | None:
+        idx = self._index.get(region_code)
+        return self._nodes[idx] if idx is not None else None
+
+    def depth(self, region_code: str) -> int | None:
+        idx = self._index.get(region_code)
+        return self._depth[idx] if idx is not None else None
+
+    def missing(self, region_codes: Iterable[str]) -> list[str]:
+        index = self._index
+        return [code for code in region_codes if code not in index]
+
+    def ancestors(self, region_code: str, *, include_self: bool = True) -> list[RegionNode]:
+        """自身（可选）到根的区域链."""
+        idx = self._index.get(region_code, -1)
+        if idx < 0:
+            return []
+        nodes = self._nodes
+        parent = self._parent
+        chain: list[RegionNode] = []
+        if not include_self:
+            idx = parent[idx]
+        while idx >= 0:
+            chain.append(nodes[idx])
+            idx = parent[idx]
+        return chain
+
+    def is_ancestor(self, ancestor_code: str, region_code: str) -> bool:
+        """ancestor_code 是否为 region_code 本身或其祖先."""
+        ancestor = self._index.get(ancestor_code)
+        idx = self._index.get(region_code)
+        if ancestor is None or idx is None:
+            return False
+        return ancestor <= idx < self._end[ancestor]
+
+    def children(self, region_code: str) -> list[RegionNode]:
+        idx = self._index.get(region_code)
+        if idx is None:
+            return []
+        result: list[RegionNode] = []
+        child = idx + 1
+        end = self._end[idx]
+        while child < end:
+            result.append(self._nodes[child])
+            child = self._end[child]
+        return result
+
+    def descendants(
+        self,
+        region_code: str,
+        *,
+        level: str | None = None,
+        include_self: bool = False,
+    ) -> list[RegionNode]:
+        """子树内全部区域（先序），可按层级过滤."""
+        idx = self._index.get(region_code)
+        if idx is None:
+            return []
+        start = idx if include_self else idx + 1
+        subtree = self._nodes[start : self._end[idx]]
+        if level is None:
+            return subtree
+        return [node for node in subtree if node.level == level]
+
+    def subtree_size(self, region_code: str) -> int:
+        idx = self._index.get(region_code)
+        return self._end[idx] - idx if idx is not None else 0
+
+    def coverage(self, region_code: str) -> Mapping[int, GeoGroupRef]:
+        """覆盖该区域的全部运输服务分组（沿祖先链最近的分配优先）."""
+        idx = self._index.get(region_code)
+        return self._coverage[idx] if idx is not None else _EMPTY_GROUPS
+
+    def covering_group(self, region_code: str, carrier_service_id: int) -> GeoGroupRef | None:
+        """沿父级向上查找最近分配了该运输服务分组的区域，O(depth)."""
+        idx = self._index.get(region_code, -1)
+        direct = self._direct
+        parent = self._parent
+        while idx >= 0:
+            own = direct.get(idx)
+            if own is not None:
+                ref = own.get(carrier_service_id)
+                if ref is not None:
+                    return ref
+            idx = parent[idx]
+        return None
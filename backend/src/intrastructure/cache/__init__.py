@@ -1 +1 @@
-"""Cache backends (Redis)."""
+"""Cache backends (Redis / in-process)."""
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.intrastructure.cache.redis import get_redis_client
+from src.intrastructure.database.models import BillingQuote
+from src.shared.config import settings
+from src.shared.logger.factories import infra_logger
+
+logger = infra_logger.bind(component="effective_quote_cache")
+
+
+@dataclass(slots=True)
+class EffectiveQuoteCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+_stats = EffectiveQuoteCacheStats()
+
+
+def get_effective_quote_cache_stats() -> EffectiveQuoteCacheStats:
+    """当前进程的缓存计数快照."""
+    return EffectiveQuoteCacheStats(
+        hits=_stats.hits,
+        misses=_stats.misses,
+        invalidations=_stats.invalidations,
+        errors=_stats.errors,
+    )
+
+
+@dataclass(slots=True)
+class EffectiveQuoteLookup:
+    """缓存查询结果.
+
+    ``versions`` 记录查询时各业务域的版本号，回填缓存时沿用，
+    避免查询期间发生的失效被旧数据覆盖。
+    """
+
+    versions: dict[str, int] = field(default_factory=dict)
+    hit: bool = False
+    business_domain: str | None = None
+    quote: BillingQuote | None = None
+
+
+class EffectiveQuoteCache:
+    """客户生效报价 Redis 缓存.
+
+    键为 ``{prefix}:{business_domain}:v{version}:{customer_id}``，值为报价单快照（无生效报价时缓存空值）。
+    模板或客户组成员变更时递增业务域版本号，旧版本键随 TTL 自然过期。
+    Redis 异常只记录日志，不影响主流程。
+    """
+
+    def __init__(self, redis: Redis | None = None) -> None:
+        self._redis = redis or get_redis_client()
+        conf = settings.billing
+        self._prefix = conf.QUOTE_CACHE_PREFIX
+        self._ttl_seconds = conf.QUOTE_CACHE_TTL_SECONDS
+
+    def _version_key(self, business_domain: str) -> str:
+        return f"{self._prefix}:{business_domain.lower()}:version"
+
+    def _entry_key(self, business_domain: str, version: int, customer_id: int) -> str:
+        return f"{self._prefix}:{business_domain.lower()}:v{version}:{customer_id}"
+
+    async def get(self, customer_id: int, business_domains: list[str]) -> EffectiveQuoteLookup:
+        lookup = EffectiveQuoteLookup()
+        if not business_domains:
+            return lookup
+        try:
+            raw_versions = await self._redis.mget([self._version_key(domain) for domain in business_domains])
+            lookup.versions = {
+                domain.lower(): int(raw or 0) for domain, raw in zip(business_domains, raw_versions, strict=True)
+            }
+            keys = [self._entry_key(domain, version, customer_id) for domain, version in lookup.versions.items()]
+            values = await self._redis.mget(keys)
+        except RedisError:
+            _stats.errors += 1
+            logger.warning("effective quote cache read failed", customer_id=customer_id, exc_info=True)
+            return EffectiveQuoteLookup()
+
+        for domain, raw in zip(lookup.versions, values, strict=True):
+            if raw is None:
+                continue
+            data = json.loads(raw)
+            lookup.hit = True
+            lookup.business_domain = domain
+            lookup.quote = _deserialize_quote(data["quote"]) if data.get("quote") else None
+            _stats.hits += 1
+            return lookup
+        _stats.misses += 1
+        return lookup
+
+    async def set(
+        self,
+        customer_id: int,
+        business_domain: str,
+        quote: BillingQuote | None,
+        *,
+        version: int | None = None,
+    ) -> None:
+        domain = business_domain.lower()
+        try:
+            if version is None:
+                version = int(await self._redis.get(self._version_key(domain)) or 0)
+            payload = json.dumps({"quote": _serialize_quote(quote) if quote is not None else None})
+            await self._redis.set(self._entry_key(domain, version, customer_id), payload, ex=self._ttl_for(quote))
+        except RedisError:
+            _stats.errors += 1
+            logger.warning("effective quote cache write failed", customer_id=customer_id, exc_info=True)
+
+    async def invalidate_domain(self, business_domain: str) -> None:
+        try:
+            version = await self._redis.incr(self._version_key(business_domain))
+        except RedisError:
+            _stats.errors += 1
+            logger.error("effective quote cache invalidation failed", business_domain=business_domain, exc_info=True)
+            return
+        _stats.invalidations += 1
+        logger.info("effective quote cache invalidated", business_domain=business_domain, version=version)
+
+    def _ttl_for(self, quote: BillingQuote | None) -> int:
+        ttl = self._ttl_seconds
+        if quote is not None and quote.expire_date is not None:
+            remaining = int((quote.expire_date - datetime.now(UTC)).total_seconds())
+            ttl = min(ttl, remaining)
+        return max(ttl, 1)
+
+
+def _serialize_quote(quote: BillingQuote) -> dict[str, Any]:
+    return {
+        "id": quote.id,
+        "quoteCode": quote.quote_code,
+        "templateId": quote.template_id,
+        "scopeType": quote.scope_type,
+        "scopePriority": quote.scope_priority,
+        "customerId": quote.customer_id,
+        "customerGroupId": quote.customer_group_id,
+        "businessDomain": quote.business_domain,
+        "status": quote.status,
+        "effectiveDate": quote.effective_date.isoformat(),
+        "expireDate": quote.expire_date.isoformat() if quote.expire_date else None,
+        "payload": quote.payload,
+        "createdAt": quote.created_at.isoformat(),
+        "updatedAt": quote.updated_at.isoformat(),
+    }
+
+
+def _deserialize_quote(data: dict[str, Any]) -> BillingQuote:
+    """还原为游离态 ORM 对象，仅用于只读展示，不可加入 Session."""
+    expire_date = data.get("expireDate")
+    return BillingQuote(
+        id=data["id"],
+        quote_code=data["quoteCode"],
+        template_id=data["templateId"],
+        scope_type=data["scopeType"],
+        scope_priority=data["scopePriority"],
+        customer_id=data.get("customerId"),
+        customer_group_id=data.get("customerGroupId"),
+        business_domain=data["businessDomain"],
+        status=data["status"],
+        effective_date=datetime.fromisoformat(data["effectiveDate"]),
+        expire_date=datetime.fromisoformat(expire_date) if expire_date else None,
+        payload=data["payload"],
+        created_at=datetime.fromisoformat(data["createdAt"]),
+        updated_at=datetime.fromisoformat(data["updatedAt"]),
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+
+from src.domain.region import PostalRegionIndex, RegionTree
+from src.intrastructure.database.postgres import postgres_db
+from src.intrastructure.repositories import CarrierRepository, RegionRepository
+from src.shared.config import settings
+from src.shared.logger.factories import infra_logger
+
+logger = infra_logger.bind(component="postal_region_index")
+
+
+class PostalRegionIndexHolder:
+    """持有当前邮编索引（含区域层级树），启动时构建并按间隔后台刷新.
+
+    刷新在新对象上完成后整体替换引用，查询方无需加锁；刷新失败保留旧索引。
+    区域或分组映射变更后调用 ``request_refresh`` 提前唤醒后台刷新。
+    """
+
+    def __init__(self, refresh_seconds: int) -> None:
+        self._refresh_seconds = refresh_seconds
+        self._index = PostalRegionIndex(())
+        self._loaded_at: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def index(self) -> PostalRegionIndex:
+        return self._index
+
+    @property
+    def tree(self) -> RegionTree:
+        return self._index.tree
+
+    @property
+    def loaded_at(self) -> datetime | None:
+        return self._loaded_at
+
+    async def refresh(self) -> PostalRegionIndex:
+        async with self._lock:
+            started = time.perf_counter()
+            async with postgres_db.session() as session:
+                regions = await RegionRepository(session).list_nodes()
+                geo_groups = await CarrierRepository(session).list_active_geo_group_regions()
+            index = PostalRegionIndex(regions, geo_groups)
+            self._index = index
+            self._loaded_at = datetime.now(UTC)
+        logger.info(
+            "postal region index refreshed",
+            regions=index.region_count,
+            prefixes=index.prefix_count,
+            geo_group_regions=len(geo_groups),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        return index
+
+    async def ensure_loaded(self) -> PostalRegionIndex:
+        if self._loaded_at is None:
+            return await self.refresh()
+        return self._index
+
+    async def ensure_tree(self) -> RegionTree:
+        return (await self.ensure_loaded()).tree
+
+    def request_refresh(self) -> None:
+        """标记索引过期；后台任务未运行时下次 ``ensure_loaded`` 重新加载."""
+        if self._task is None:
+            self._loaded_at = None
+        else:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        await self.refresh()
+        if self._refresh_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="postal-region-index-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._refresh_seconds)
+            self._wakeup.clear()
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("postal region index refresh failed")
+
+
+postal_region_index = PostalRegionIndexHolder(refresh_seconds=settings.region.POSTAL_INDEX_REFRESH_SECONDS)
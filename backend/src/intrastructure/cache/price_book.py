@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.billing.rating import CompiledPriceBook
+from src.shared.config import settings
+from src.shared.logger.factories import infra_logger
+
+logger = infra_logger.bind(component="price_book_cache")
+
+
+@dataclass(slots=True)
+class PriceBookCacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": self.size, "maxsize": self.maxsize}
+
+
+class PriceBookCache:
+    """进程内报价单价目表 LRU 缓存.
+
+    以 ``(quote_id, updated_at)`` 判定命中：同一报价单只保留最新版本，
+    ``updated_at`` 变化即视为失效并重新编译。价目表不可变，可在协程间安全共享。
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[int, CompiledPriceBook] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, quote_id: int, updated_at: datetime) -> CompiledPriceBook | None:
+        book = self._entries.get(quote_id)
+        if book is None or book.updated_at != updated_at:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(quote_id)
+        self._hits += 1
+        return book
+
+    def put(self, book: CompiledPriceBook) -> None:
+        if book.quote_id is None:
+            raise ValueError("price book without quote_id cannot be cached")
+        self._entries[book.quote_id] = book
+        self._entries.move_to_end(book.quote_id)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        logger.debug("price book cached", quote_id=book.quote_id, rule_count=len(book.rules))
+
+    def invalidate(self, quote_id: int) -> None:
+        self._entries.pop(quote_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> PriceBookCacheStats:
+        return PriceBookCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            maxsize=self._maxsize,
+        )
+
+
+price_book_cache = PriceBookCache(maxsize=settings.billing.PRICE_BOOK_CACHE_SIZE)
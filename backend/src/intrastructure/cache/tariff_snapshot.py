@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Row
+
+from src.domain.carrier import TariffLookup
+from src.intrastructure.database.models import CarrierServiceTariffSnapshot
+from src.intrastructure.repositories import CarrierRepository
+from src.shared.config import settings
+from src.shared.logger.factories import infra_logger
+from src.shared.utils import ensure_utc
+
+logger = infra_logger.bind(component="tariff_snapshot_cache")
+
+type SnapshotKey = tuple[str, str]
+# (快照数, ACTIVE 快照数, max(version), max(updated_at))：任一变化即重新读取该服务的快照头
+type SnapshotToken = tuple[int, int, int, datetime]
+
+
+@dataclass(slots=True, frozen=True)
+class TariffSnapshotHeader:
+    """快照元数据（不含 payload）."""
+
+    id: int
+    version: int
+    carrier_id: int
+    service_id: int
+    carrier_code: str
+    service_code: str
+    effective_from: datetime | None
+    effective_to: datetime | None
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, snapshot: CarrierServiceTariffSnapshot) -> TariffSnapshotHeader:
+        return cls(
+            id=snapshot.id,
+            version=snapshot.version,
+            carrier_id=snapshot.carrier_id,
+            service_id=snapshot.service_id,
+            carrier_code=snapshot.carrier_code,
+            service_code=snapshot.service_code,
+            effective_from=snapshot.effective_from,
+            effective_to=snapshot.effective_to,
+            updated_at=snapshot.updated_at,
+        )
+
+    def effective_at(self, at: datetime) -> bool:
+        return (self.effective_from is None or self.effective_from <= at) and (
+            self.effective_to is None or self.effective_to > at
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CachedTariffSnapshot:
+    header: TariffSnapshotHeader
+    lookup: TariffLookup
+
+
+@dataclass(slots=True)
+class TariffSnapshotCacheStats:
+    hits: int
+    misses: int
+    refreshes: int
+    services: int
+    size: int
+    maxsize: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "services": self.services,
+            "size": self.size,
+            "maxsize": self.maxsize,
+        }
+
+
+class TariffSnapshotCache:
+    """进程内运费快照缓存，按 ``(carrier_code, service_code)`` 保存 ACTIVE 快照头与已解码的查价表.
+
+    每次查询先执行一条聚合 SQL 取各服务的快照数与 ``max(version)`` / ``max(updated_at)``（走
+    ``idx_carrier_tariff_snapshot_lookup``，不读取 payload）；与缓存一致时直接在内存中按
+    ``effective_from`` / ``effective_to`` 选出指定时刻生效的最新版本，仅在版本变化时重新读取快照头，
+    仅在快照首次使用时读取并解码 JSONB payload。已解码的查价表按 ``(id, updated_at)`` LRU 淘汰，
+    不可变，可在协程间安全共享。
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._tokens: dict[SnapshotKey, SnapshotToken] = {}
+        self._headers: dict[SnapshotKey, tuple[TariffSnapshotHeader, ...]] = {}
+        self._lookups: OrderedDict[tuple[int, datetime], TariffLookup] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    async def get_effective(
+        self,
+        repo: CarrierRepository,
+        at: datetime,
+        *,
+        carrier_id: int,
+        service_id: int,
+    ) -> CachedTariffSnapshot | None:
+        """指定运输服务在 ``at`` 时刻生效的最新快照；不带时区的 ``at`` 按 UTC 处理."""
+        at = ensure_utc(at)
+        rows = await repo.list_tariff_snapshot_versions(carrier_id=carrier_id, service_id=service_id)
+        keys = await self._sync(repo, rows)
+        chosen = self._pick(keys, at, carrier_id=carrier_id, service_id=service_id)
+        loaded = await self._load(repo, chosen)
+        return loaded[0] if loaded else None
+
+    async def list_effective(self, repo: CarrierRepository, at: datetime) -> list[CachedTariffSnapshot]:
+        """所有 ACTIVE 服务商/运输服务在 ``at`` 时刻生效的最新快照（每个服务一条）."""
+        at = ensure_utc(at)
+        rows = await repo.list_tariff_snapshot_versions(active_services_only=True)
+        keys = await self._sync(repo, rows)
+        return await self._load(repo, self._pick(keys, at))
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self._headers.clear()
+        self._lookups.clear()
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    def stats(self) -> TariffSnapshotCacheStats:
+        return TariffSnapshotCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            services=len(self._headers),
+            size=len(self._lookups),
+            maxsize=self._maxsize,
+        )
+
+    async def _sync(
+        self, repo: CarrierRepository, rows: Iterable[Row[str, str, int, int, int, datetime]]
+    ) -> list[SnapshotKey]:
+        keys: list[SnapshotKey] = []
+        stale: dict[SnapshotKey, SnapshotToken] = {}
+        for carrier_code, service_code, count, active_count, max_version, max_updated_at in rows:
+            key = (carrier_code, service_code)
+            keys.append(key)
+            token = (count, active_count, max_version, max_updated_at)
+            if self._tokens.get(key) != token:
+                stale[key] = token
+        if not stale:
+            return keys
+
+        # 先取版本再取快照头：期间写入的新版本只会让下次检查再刷新一次，不会漏掉
+        grouped: dict[SnapshotKey, list[TariffSnapshotHeader]] = {key: [] for key in stale}
+        for snapshot in await repo.list_tariff_snapshot_headers(list(stale)):
+            grouped[(snapshot.carrier_code, snapshot.service_code)].append(TariffSnapshotHeader.from_model(snapshot))
+        for key, token in stale.items():
+            live = {(header.id, header.updated_at) for header in grouped[key]}
+            for header in self._headers.get(key, ()):
+                if (header.id, header.updated_at) not in live:
+                    self._lookups.pop((header.id, header.updated_at), None)
+            self._headers[key] = tuple(grouped[key])
+            self._tokens[key] = token
+        self._refreshes += len(stale)
+        logger.debug("tariff snapshot headers refreshed", services=len(stale))
+        return keys
+
+    def _pick(
+        self,
+        keys: Iterable[SnapshotKey],
+        at: datetime,
+        *,
+        carrier_id: int | None = None,
+        service_id: int | None = None,
+    ) -> list[TariffSnapshotHeader]:
+        chosen: dict[int, TariffSnapshotHeader] = {}
+        for key in keys:
+            # 快照头按版本倒序，每个服务编码取第一条生效的
+            for header in self._headers.get(key, ()):
+                if carrier_id is not None and header.carrier_id != carrier_id:
+                    continue
+                if service_id is not None and header.service_id != service_id:
+                    continue
+                if not header.effective_at(at):
+                    continue
+                current = chosen.get(header.service_id)
+                if current is None or header.version > current.version:
+                    chosen[header.service_id] = header
+                break
+        return [chosen[sid] for sid in sorted(chosen)]
+
+    async def _load(
+        self, repo: CarrierRepository, headers: Sequence[TariffSnapshotHeader]
+    ) -> list[CachedTariffSnapshot]:
+        missing = [header.id for header in headers if (header.id, header.updated_at) not in self._lookups]
+        payloads = await repo.get_tariff_snapshot_payloads(missing)
+        result: list[CachedTariffSnapshot] = []
+        for header in headers:
+            entry = (header.id, header.updated_at)
+            lookup = self._lookups.get(entry)
+            if lookup is not None:
+                self._hits += 1
+                self._lookups.move_to_end(entry)
+            else:
+                payload = payloads.get(header.id)
+                if payload is None:
+                    # 版本检查之后被删除，下次检查时会刷新快照头
+                    continue
+                self._misses += 1
+                lookup = TariffLookup.from_payload(payload)
+                self._lookups[entry] = lookup
+                while len(self._lookups) > self._maxsize:
+                    self._lookups.popitem(last=False)
+                logger.debug("tariff snapshot decoded", snapshot_id=header.id, version=header.version)
+            result.append(CachedTariffSnapshot(header=header, lookup=lookup))
+        return result
+
+
+tariff_snapshot_cache = TariffSnapshotCache(maxsize=settings.billing.TARIFF_SNAPSHOT_CACHE_SIZE)
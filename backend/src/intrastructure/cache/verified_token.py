@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.shared.config import settings
+from src.shared.schemas.auth import TokenClaims
+
+
+@dataclass(slots=True)
+class VerifiedTokenCacheStats:
+    hits: int
+    misses: int
+    expired: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "size": self.size,
+            "maxsize": self.maxsize,
+            "hitRatio": round(self.hit_ratio, 4),
+        }
+
+
+class VerifiedTokenCache:
+    """进程内已验签 JWT 的 LRU 缓存.
+
+    以 token 的 SHA-256 摘要为键（不在内存中保留原始 token），缓存验签并校验后的 ``TokenClaims``，
+    到 token 自身的 ``exp`` 即失效；无 ``exp`` 的 token 不缓存。校验失败的 token 不缓存。
+    同步依赖在线程池中执行，读写加锁。
+    """
+
+    def __init__(self, maxsize: int = 4096, clock: Callable[[], float] = time.time) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> TokenClaims | None:
+        key = self._key(token)
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                self._misses += 1
+                return None
+            if claims.exp is None or claims.exp <= self._clock():
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return claims
+
+    def put(self, token: str, claims: TokenClaims) -> None:
+        if claims.exp is None or claims.exp <= self._clock():
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._expired = 0
+
+    def stats(self) -> VerifiedTokenCacheStats:
+        with self._lock:
+            return VerifiedTokenCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+
+verified_token_cache: VerifiedTokenCache | None = (
+    VerifiedTokenCache(maxsize=settings.jwt.VERIFIED_CACHE_SIZE) if settings.jwt.VERIFIED_CACHE_SIZE > 0 else None
+)
@@ -1,7 +1,7 @@
 """Database models organized per domain."""
 
 from .base import Base
-from .billing import BillingQuote, BillingTemplate, BillingTemplateRule
+from .billing import BillingQuote, BillingTemplate, BillingTemplateRule, CustomerEffectiveQuote
 from .carrier import (
     Carrier,
     CarrierService,
@@ -17,8 +17,11 @@ from .carrier import (
 from .company import Company
 from .customer import Customer, CustomerGroup, CustomerGroupMember, CustomerStatus
 from .domain import BusinessDomain
+from .inventory import InventoryDailySnapshot
+from .invoice import BillRun, BillRunPartition, Invoice, InvoiceLine
 from .region import Region, RegionLevel
 from .sync import ExternalSystemSync, SyncStatus
+from .usage import UsageEvent
 
 __all__ = [
     "Base",
@@ -38,6 +41,7 @@ __all__ = [
     "CustomerGroup",
     "CustomerGroupMember",
     "CustomerStatus",
+    "InventoryDailySnapshot",
     "Region",
     "RegionLevel",
     "ExternalSystemSync",
@@ -45,4 +49,10 @@ __all__ = [
     "BillingTemplate",
     "BillingTemplateRule",
     "BillingQuote",
+    "CustomerEffectiveQuote",
+    "BillRun",
+    "BillRunPartition",
+    "Invoice",
+    "InvoiceLine",
+    "UsageEvent",
 ]
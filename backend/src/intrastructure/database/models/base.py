@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -10,6 +10,11 @@ class Base(DeclarativeBase):
     """Declarative base for project models."""
 
 
+def trgm_index(name: str, column: str) -> Index:
+    """pg_trgm GIN 索引，支持 ``ILIKE '%kw%'`` 走索引（依赖 pg_trgm 扩展）."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
 class AuditMixin:
     """统一审计信息 + 软删除字段."""
 
@@ -6,26 +6,37 @@ from typing import TYPE_CHECKING, TypedDict
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
+    PrimaryKeyConstraint,
     SmallInteger,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSTZRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.billing.entities import QuoteStatus
 
-from .base import AuditMixin, Base
+from .base import AuditMixin, Base, trgm_index
 
 if TYPE_CHECKING:
     from .customer import Customer, CustomerGroup
     from .domain import BusinessDomain
 
 
+# 截止时间早于生效时间（生效前即被替代）时为空区间
+APPLIED_RANGE_EXPRESSION = (
+    "tstzrange(effective_date, CASE WHEN least(expire_date, superseded_at) < effective_date "
+    "THEN effective_date ELSE least(expire_date, superseded_at) END, '[)')"
+)
+
+
 class TemplateRuleTierRecord(TypedDict):
     """JSON structure stored for tier definition."""
 
@@ -81,6 +92,14 @@ class BillingTemplate(AuditMixin, Base):
         Index("idx_billing_template_type", "template_type"),
         Index("idx_billing_template_customer", "customer_id"),
         Index("idx_billing_template_group_id", "customer_group_id"),
+        Index(
+            "idx_billing_template_type_domain",
+            "template_type",
+            text("lower(business_domain)"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        trgm_index("idx_billing_template_name_trgm", "template_name"),
+        trgm_index("idx_billing_template_code_trgm", "template_code"),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
@@ -137,6 +156,36 @@ class BillingQuote(AuditMixin, Base):
         Index("idx_billing_quotes_template_id", "template_id"),
         Index("idx_billing_quotes_customer", "customer_id"),
         Index("idx_billing_quotes_group", "customer_group_id"),
+        Index(
+            "idx_billing_quotes_resolve",
+            "business_domain",
+            "scope_type",
+            "status",
+            "effective_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 历史解析：按作用域键 + 实际生效区间检索（依赖 btree_gist 扩展）
+        Index(
+            "idx_billing_quotes_customer_range",
+            "customer_id",
+            "applied_range",
+            postgresql_using="gist",
+            postgresql_where=text("customer_id IS NOT NULL"),
+        ),
+        Index(
+            "idx_billing_quotes_group_range",
+            "customer_group_id",
+            "applied_range",
+            postgresql_using="gist",
+            postgresql_where=text("customer_group_id IS NOT NULL"),
+        ),
+        Index(
+            "idx_billing_quotes_global_range",
+            "business_domain",
+            "applied_range",
+            postgresql_using="gist",
+            postgresql_where=text("customer_id IS NULL AND customer_group_id IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
@@ -152,8 +201,39 @@ class BillingQuote(AuditMixin, Base):
     )
     effective_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expire_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    superseded_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), comment="被新报价单替代（失效）的时间"
+    )
+    # [effective_date, min(expire_date, superseded_at))，上界为空表示不限
+    applied_range: Mapped[Range[datetime]] = mapped_column(
+        TSTZRANGE,
+        Computed(APPLIED_RANGE_EXPRESSION, persisted=True),
+        comment="报价单实际生效区间",
+    )
     payload: Mapped[BillingQuotePayload] = mapped_column(JSONB, nullable=False)
     template: Mapped[BillingTemplate] = relationship(back_populates="quotes")
     business_domain_rel: Mapped[BusinessDomain] = relationship()
     customer: Mapped[Customer | None] = relationship()
     customer_group: Mapped[CustomerGroup | None] = relationship()
+
+
+class CustomerEffectiveQuote(Base):
+    """客户生效报价物化表（可选）：客户在 [valid_from, valid_to) 区间内命中的报价单.
+
+    由模板保存 / 删除、客户组成员变更与新建客户时按受影响客户集合整体重算（INSERT ... SELECT），
+    解析时按主键 (customer_id, valid_from) 取 ``valid_from <= now`` 的最后一段即可。
+    """
+
+    __tablename__ = "customer_effective_quotes"
+    __table_args__ = (
+        PrimaryKeyConstraint("customer_id", "valid_from", name="pk_customer_effective_quote"),
+        Index("idx_customer_effective_quotes_quote", "quote_id"),
+    )
+
+    customer_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("customers.id"), nullable=False, comment="客户ID")
+    valid_from: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="区间起点（含）")
+    valid_to: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), comment="区间终点（不含），空为不限")
+    quote_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("billing_quotes.id"), nullable=False, comment="命中的报价单ID"
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -18,7 +18,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import AuditMixin, Base
+from .base import AuditMixin, Base, trgm_index
 
 if TYPE_CHECKING:
     from .region import Region
@@ -50,7 +50,12 @@ class Carrier(AuditMixin, Base):
     """Transport carrier definition."""
 
     __tablename__ = "carriers"
-    __table_args__ = (UniqueConstraint("carrier_code", name="uq_carrier_code"),)
+    __table_args__ = (
+        UniqueConstraint("carrier_code", name="uq_carrier_code"),
+        trgm_index("idx_carriers_name_trgm", "carrier_name"),
+        trgm_index("idx_carriers_code_trgm", "carrier_code"),
+        trgm_index("idx_carriers_description_trgm", "description"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
     carrier_code: Mapped[str] = mapped_column(String(64), nullable=False, comment="服务商编码")
@@ -14,10 +14,11 @@ from sqlalchemy import (
     String,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import AuditMixin, Base
+from .base import AuditMixin, Base, trgm_index
 
 if TYPE_CHECKING:
     from .company import Company
@@ -31,7 +32,16 @@ class CustomerStatus(str, Enum):
 
 class Customer(AuditMixin, Base):
     __tablename__ = "customers"
-    __table_args__ = (UniqueConstraint("customer_name", "customer_code", name="uq_customer_name_code"),)
+    __table_args__ = (
+        UniqueConstraint("customer_name", "customer_code", name="uq_customer_name_code"),
+        trgm_index("idx_customers_name_trgm", "customer_name"),
+        trgm_index("idx_customers_code_trgm", "customer_code"),
+        Index(
+            "idx_customers_domain",
+            text("lower(business_domain)"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     customer_name: Mapped[str] = mapped_column(String(128), nullable=False)
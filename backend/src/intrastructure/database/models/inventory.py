@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Numeric, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class InventoryDailySnapshot(Base):
+    """客户每日库存快照，仓储费计提的数据来源（只追加，不做软删除）."""
+
+    __tablename__ = "inventory_daily_snapshots"
+    __table_args__ = (
+        # 同时作为按 (customer_id, snapshot_date) 游标分页的索引
+        UniqueConstraint("customer_id", "snapshot_date", name="uq_inventory_snapshot_customer_date"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
+    customer_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("customers.id"), nullable=False, comment="客户ID")
+    business_domain: Mapped[str] = mapped_column(
+        String(64), ForeignKey("business_domains.code"), nullable=False, comment="业务域"
+    )
+    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False, comment="快照日期")
+    volume_cbm: Mapped[Decimal] = mapped_column(Numeric(14, 4), nullable=False, comment="在库体积（m³）")
+    weight_kg: Mapped[Decimal] = mapped_column(Numeric(14, 3), nullable=False, comment="在库重量（kg）")
+    source: Mapped[str] = mapped_column(String(32), nullable=False, comment="数据来源（WMS/CSV 等）")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.billing.invoice import BillRunPartitionStatus, BillRunStatus
+
+from .base import Base
+
+
+class BillRun(Base):
+    """账期出账批次，每个账期一条；中断后重跑同一账期会续跑未完成的分区."""
+
+    __tablename__ = "bill_runs"
+    __table_args__ = (UniqueConstraint("period", name="uq_bill_run_period"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
+    period: Mapped[str] = mapped_column(String(7), nullable=False, comment="账期（YYYY-MM）")
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, default=BillRunStatus.RUNNING.value, comment="RUNNING/COMPLETED/FAILED"
+    )
+    partition_count: Mapped[int] = mapped_column(Integer, nullable=False, comment="客户分区数")
+    customer_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="已出账客户数")
+    invoice_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="已写入账单数")
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="计价失败账单数")
+    total_amount: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="账单总金额")
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+class BillRunPartition(Base):
+    """出账分区：按客户 ID 闭区间 [first_customer_id, last_customer_id] 切分，``cursor_customer_id`` 为检查点.
+
+    每批客户的账单与检查点在同一事务内提交，续跑时从检查点之后的客户开始。
+    """
+
+    __tablename__ = "bill_run_partitions"
+    __table_args__ = (PrimaryKeyConstraint("bill_run_id", "partition_no", name="pk_bill_run_partition"),)
+
+    bill_run_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("bill_runs.id"), nullable=False)
+    partition_no: Mapped[int] = mapped_column(Integer, nullable=False, comment="分区序号（从 0 开始）")
+    first_customer_id: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="首个客户ID（含）")
+    last_customer_id: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="最后客户ID（含）")
+    cursor_customer_id: Mapped[int | None] = mapped_column(BigInteger, comment="已提交的最后一个客户ID")
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=BillRunPartitionStatus.PENDING.value,
+        comment="PENDING/RUNNING/COMPLETED/FAILED",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="执行次数")
+    customer_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    invoice_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_amount: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, comment="最近一次失败原因")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class Invoice(Base):
+    """客户账期账单头，(period, customer_id) 唯一."""
+
+    __tablename__ = "invoices"
+    __table_args__ = (
+        UniqueConstraint("invoice_no", name="uq_invoice_no"),
+        UniqueConstraint("period", "customer_id", name="uq_invoice_period_customer"),
+        Index("idx_invoices_bill_run", "bill_run_id"),
+        Index("idx_invoices_customer", "customer_id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
+    invoice_no: Mapped[str] = mapped_column(String(32), nullable=False, comment="账单号")
+    bill_run_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("bill_runs.id"), nullable=False)
+    period: Mapped[str] = mapped_column(String(7), nullable=False, comment="账期（YYYY-MM）")
+    customer_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("customers.id"), nullable=False, comment="客户ID")
+    business_domain: Mapped[str] = mapped_column(
+        String(64), ForeignKey("business_domains.code"), nullable=False, comment="业务域"
+    )
+    quote_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("billing_quotes.id"), comment="计价报价单ID")
+    status: Mapped[str] = mapped_column(String(16), nullable=False, comment="ISSUED/FAILED")
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_amount: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="账单金额")
+    error: Mapped[str | None] = mapped_column(Text, comment="计价失败原因")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class InvoiceLine(Base):
+    """账单明细：每个收费项一行."""
+
+    __tablename__ = "invoice_lines"
+    __table_args__ = (UniqueConstraint("invoice_id", "line_no", name="uq_invoice_line_no"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
+    invoice_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("invoices.id"), nullable=False)
+    line_no: Mapped[int] = mapped_column(Integer, nullable=False, comment="行号（从 1 开始）")
+    charge_code: Mapped[str] = mapped_column(String(64), nullable=False)
+    charge_name: Mapped[str] = mapped_column(String(128), nullable=False)
+    category: Mapped[str] = mapped_column(String(32), nullable=False)
+    unit: Mapped[str] = mapped_column(String(32), nullable=False)
+    record_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    quantity: Mapped[Decimal] = mapped_column(Numeric(20, 4), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -6,7 +6,7 @@ from sqlalchemy import BigInteger, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .base import AuditMixin, Base
+from .base import AuditMixin, Base, trgm_index
 
 
 class RegionLevel(str, Enum):
@@ -25,6 +25,8 @@ class Region(AuditMixin, Base):
         UniqueConstraint("region_code", name="uq_regions_region_code"),
         Index("idx_regions_parent_code", "parent_code"),
         Index("idx_regions_country_level", "country_code", "level"),
+        trgm_index("idx_regions_name_trgm", "name"),
+        trgm_index("idx_regions_code_trgm", "region_code"),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class UsageEvent(Base):
+    """计费用量事件（SCAN 渠道的仓内扫描等），只追加，按业务域内的幂等键去重."""
+
+    __tablename__ = "usage_events"
+    __table_args__ = (
+        # 幂等键由各业务域的上报方生成，只在业务域内唯一
+        UniqueConstraint("business_domain", "idempotency_key", name="uq_usage_event_domain_idempotency_key"),
+        # 出账按客户与账期读取
+        Index("idx_usage_events_customer_occurred", "customer_id", "occurred_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment="主键")
+    idempotency_key: Mapped[str] = mapped_column(String(128), nullable=False, comment="幂等键（由上报方生成）")
+    customer_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("customers.id"), nullable=False, comment="客户ID")
+    business_domain: Mapped[str] = mapped_column(
+        String(64), ForeignKey("business_domains.code"), nullable=False, comment="业务域"
+    )
+    charge_code: Mapped[str] = mapped_column(String(64), nullable=False, comment="收费项编码")
+    unit: Mapped[str] = mapped_column(String(32), nullable=False, comment="计量单位")
+    quantity: Mapped[Decimal] = mapped_column(Numeric(20, 4), nullable=False, comment="用量")
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="发生时间")
+    reference: Mapped[str | None] = mapped_column(String(128), comment="业务单号（运单/出库单等）")
+    source: Mapped[str] = mapped_column(String(32), nullable=False, comment="数据来源（WMS/PDA 等）")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
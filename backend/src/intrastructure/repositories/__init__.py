@@ -1,19 +1,35 @@
 """Infrastructure repositories for domain aggregates."""
 
-from .billing_quote_repository import BillingQuoteRepository
+from .bill_run_repository import BillRunRepository
+from .billing_quote_repository import BillingQuoteRepository, QuoteScopeRef
 from .billing_template_repository import BillingTemplateRepository
 from .carrier_repository import CarrierRepository
 from .company_repository import CompanyRepository
+from .customer_effective_quote_repository import CustomerEffectiveQuoteRepository
 from .customer_group_repository import CustomerGroupRepository
 from .customer_repository import CustomerRepository
+from .inventory_snapshot_repository import InventorySnapshotRepository, iter_inventory_csv_chunks
+from .invoice_repository import InvoiceRepository
+from .pagination import InvalidCursorError, Page, TotalMode
 from .region_repository import RegionRepository
+from .usage_event_repository import UsageEventRepository
 
 __all__ = [
     "CarrierRepository",
     "CompanyRepository",
     "CustomerRepository",
     "CustomerGroupRepository",
+    "CustomerEffectiveQuoteRepository",
     "BillingTemplateRepository",
     "BillingQuoteRepository",
+    "QuoteScopeRef",
+    "BillRunRepository",
+    "InvoiceRepository",
+    "UsageEventRepository",
     "RegionRepository",
+    "InventorySnapshotRepository",
+    "iter_inventory_csv_chunks",
+    "InvalidCursorError",
+    "Page",
+    "TotalMode",
 ]
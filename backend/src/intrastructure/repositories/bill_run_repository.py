@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.billing.invoice import BillRunPartitionStatus, BillRunStatus, InvoiceStatus
+from src.intrastructure.database.models import BillRun, BillRunPartition, Invoice
+
+# pg_try_advisory_lock(classid, objid) 的 classid，objid 为 hashtext(账期)
+BILL_RUN_LOCK_CLASS = 4_201
+
+
+class BillRunRepository:
+    """出账批次与分区检查点."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def try_lock_period(self, period: str) -> bool:
+        """会话级咨询锁，防止同一账期被多个进程同时出账.
+
+        锁随连接而非事务持有，需以 ``unlock_period`` 显式释放；连接断开（进程退出）时自动释放。
+        """
+        stmt = select(func.pg_try_advisory_lock(BILL_RUN_LOCK_CLASS, func.hashtext(period)))
+        return bool((await self._session.execute(stmt)).scalar_one())
+
+    async def unlock_period(self, period: str) -> None:
+        stmt = select(func.pg_advisory_unlock(BILL_RUN_LOCK_CLASS, func.hashtext(period)))
+        await self._session.execute(stmt)
+
+    async def get_by_id(self, run_id: int) -> BillRun | None:
+        return await self._session.get(BillRun, run_id)
+
+    async def get_by_period(self, period: str) -> BillRun | None:
+        result = await self._session.execute(select(BillRun).where(BillRun.period == period))
+        return result.scalar_one_or_none()
+
+    async def create(self, *, period: str, bounds: Sequence[tuple[int, int]]) -> BillRun:
+        run = BillRun(period=period, status=BillRunStatus.RUNNING.value, partition_count=len(bounds))
+        self._session.add(run)
+        await self._session.flush()
+        if bounds:
+            await self._session.execute(
+                insert(BillRunPartition),
+                [
+                    {
+                        "bill_run_id": run.id,
+                        "partition_no": partition_no,
+                        "first_customer_id": first_id,
+                        "last_customer_id": last_id,
+                        "status": BillRunPartitionStatus.PENDING.value,
+                    }
+                    for partition_no, (first_id, last_id) in enumerate(bounds)
+                ],
+            )
+        return run
+
+    async def reopen(self, run: BillRun) -> int:
+        """续跑：批次回到 RUNNING，未完成（含上次崩溃时停在 RUNNING）的分区回到 PENDING，检查点保留."""
+        run.status = BillRunStatus.RUNNING.value
+        run.finished_at = None
+        stmt = (
+            update(BillRunPartition)
+            .where(
+                BillRunPartition.bill_run_id == run.id,
+                BillRunPartition.status != BillRunPartitionStatus.COMPLETED.value,
+            )
+            .values(status=BillRunPartitionStatus.PENDING.value)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    async def list_partition_nos(self, run_id: int, status: BillRunPartitionStatus) -> list[int]:
+        stmt = (
+            select(BillRunPartition.partition_no)
+            .where(BillRunPartition.bill_run_id == run_id, BillRunPartition.status == status.value)
+            .order_by(BillRunPartition.partition_no)
+        )
+        return list((await self._session.execute(stmt)).scalars().all())
+
+    async def get_partition(self, run_id: int, partition_no: int) -> BillRunPartition | None:
+        return await self._session.get(BillRunPartition, (run_id, partition_no), populate_existing=True)
+
+    async def start_partition(self, run_id: int, partition_no: int) -> BillRunPartition | None:
+        """PENDING → RUNNING 并返回分区；已被其他执行者领取时返回 None."""
+        stmt = (
+            update(BillRunPartition)
+            .where(
+                BillRunPartition.bill_run_id == run_id,
+                BillRunPartition.partition_no == partition_no,
+                BillRunPartition.status == BillRunPartitionStatus.PENDING.value,
+            )
+            .values(
+                status=BillRunPartitionStatus.RUNNING.value,
+                attempts=BillRunPartition.attempts + 1,
+                error=None,
+            )
+            .returning(BillRunPartition)
+        )
+        return (await self._session.execute(stmt)).scalar_one_or_none()
+
+    async def checkpoint(
+        self,
+        run_id: int,
+        partition_no: int,
+        *,
+        cursor_customer_id: int,
+        customers: int,
+        invoices: int,
+        failed: int,
+        amount: int,
+    ) -> None:
+        """与本批账单同一事务提交，记录已完成的最后一个客户并累加统计."""
+        stmt = (
+            update(BillRunPartition)
+            .where(BillRunPartition.bill_run_id == run_id, BillRunPartition.partition_no == partition_no)
+            .values(
+                cursor_customer_id=cursor_customer_id,
+                customer_count=BillRunPartition.customer_count + customers,
+                invoice_count=BillRunPartition.invoice_count + invoices,
+                failed_count=BillRunPartition.failed_count + failed,
+                total_amount=BillRunPartition.total_amount + amount,
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def finish_partition(
+        self,
+        run_id: int,
+        partition_no: int,
+        status: BillRunPartitionStatus,
+        error: str | None = None,
+    ) -> None:
+        stmt = (
+            update(BillRunPartition)
+            .where(BillRunPartition.bill_run_id == run_id, BillRunPartition.partition_no == partition_no)
+            .values(status=status.value, error=error)
+        )
+        await self._session.execute(stmt)
+
+    async def summarize(self, run: BillRun) -> BillRun:
+        """汇总批次结果：客户数取自分区，账单统计取自账期内账单（含重算后的 FAILED 账单）.
+
+        全部分区完成且没有 FAILED 账单时批次为 COMPLETED，否则为 FAILED，可重跑续跑与重算.
+        """
+        partitions = select(
+            func.count().filter(BillRunPartition.status != BillRunPartitionStatus.COMPLETED.value),
+            func.coalesce(func.sum(BillRunPartition.customer_count), 0),
+        ).where(BillRunPartition.bill_run_id == run.id)
+        unfinished, customers = (await self._session.execute(partitions)).one()
+        invoices = select(
+            func.count(),
+            func.count().filter(Invoice.status == InvoiceStatus.FAILED.value),
+            func.coalesce(func.sum(Invoice.total_amount), 0),
+        ).where(Invoice.period == run.period)
+        invoice_count, failed, amount = (await self._session.execute(invoices)).one()
+        run.status = (BillRunStatus.FAILED if unfinished or failed else BillRunStatus.COMPLETED).value
+        run.customer_count = int(customers)
+        run.invoice_count = int(invoice_count)
+        run.failed_count = int(failed)
+        run.total_amount = int(amount)
+        run.finished_at = datetime.now(UTC)
+        await self._session.flush()
+        return run
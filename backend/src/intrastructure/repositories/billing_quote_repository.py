@@ -1,14 +1,43 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Select,
+    and_,
+    bindparam,
+    func,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.domain.billing.entities import QuoteScope, QuoteStatus
 from src.intrastructure.database.models import BillingQuote
+from src.intrastructure.database.models.billing import BillingQuotePayload
+from src.intrastructure.repositories.pagination import Page, TotalMode, paginate
+from src.intrastructure.repositories.quote_candidates import candidate_priority, candidate_targets, quote_candidates
+from src.intrastructure.repositories.streaming import EXPORT_BATCH_SIZE, stream_chunks
+
+# 批量解析时单条 SQL 覆盖的客户数
+RESOLVE_BATCH_SIZE = 10_000
+
+
+@dataclass(slots=True, frozen=True)
+class QuoteScopeRef:
+    """报价单作用域：GLOBAL 不带 ID，CUSTOMER / GROUP 分别带 customer_id / customer_group_id."""
+
+    scope_type: QuoteScope
+    business_domain: str
+    customer_id: int | None = None
+    customer_group_id: int | None = None
 
 
 class BillingQuoteRepository:
@@ -30,6 +59,37 @@ class BillingQuoteRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_revision(self, quote_id: int) -> tuple[str, datetime] | None:
+        """仅读取 (business_domain, updated_at)，用于价目表缓存命中判断，不加载 payload."""
+        stmt = select(BillingQuote.business_domain, BillingQuote.updated_at).where(
+            BillingQuote.id == quote_id, BillingQuote.is_deleted.is_(False)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row.business_domain, row.updated_at
+
+    async def get_payload(self, quote_id: int) -> tuple[BillingQuotePayload, datetime] | None:
+        stmt = select(BillingQuote.payload, BillingQuote.updated_at).where(
+            BillingQuote.id == quote_id, BillingQuote.is_deleted.is_(False)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row.payload, row.updated_at
+
+    async def get_payloads(self, quote_ids: Sequence[int]) -> dict[int, tuple[BillingQuotePayload, datetime]]:
+        """批量读取 {quote_id: (payload, updated_at)}，供批处理一次性编译价目表."""
+        if not quote_ids:
+            return {}
+        stmt = select(BillingQuote.id, BillingQuote.payload, BillingQuote.updated_at).where(
+            BillingQuote.id.in_(set(quote_ids)), BillingQuote.is_deleted.is_(False)
+        )
+        result = await self._session.execute(stmt)
+        return {row.id: (row.payload, row.updated_at) for row in result}
+
     async def search(
         self,
         *,
@@ -40,82 +100,133 @@ class BillingQuoteRepository:
         status: QuoteStatus | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[BillingQuote], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[BillingQuote]:
         if not business_domains:
-            return [], 0
+            return Page()
 
-        base_condition = BillingQuote.is_deleted.is_(False)
-        stmt = select(BillingQuote).where(base_condition)
-        count_stmt = select(func.count()).select_from(BillingQuote).where(base_condition)
+        conditions = self._search_conditions(
+            business_domains=business_domains,
+            template_id=template_id,
+            customer_id=customer_id,
+            customer_group_id=customer_group_id,
+            status=status,
+        )
+        stmt = select(BillingQuote).where(*conditions)
+        count_stmt = select(func.count()).select_from(BillingQuote).where(*conditions)
 
-        stmt = stmt.where(BillingQuote.business_domain.in_(business_domains))
-        count_stmt = count_stmt.where(BillingQuote.business_domain.in_(business_domains))
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=BillingQuote.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
 
-        if template_id is not None:
-            stmt = stmt.where(BillingQuote.template_id == template_id)
-            count_stmt = count_stmt.where(BillingQuote.template_id == template_id)
+    async def iter_export_chunks(
+        self,
+        *,
+        business_domains: Sequence[str],
+        template_id: int | None,
+        customer_id: int | None,
+        customer_group_id: int | None,
+        status: QuoteStatus | None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[BillingQuote]]:
+        """与 ``search`` 相同的过滤条件，按 id 升序经服务端游标分批读取全部报价单."""
+        if not business_domains:
+            return
+        conditions = self._search_conditions(
+            business_domains=business_domains,
+            template_id=template_id,
+            customer_id=customer_id,
+            customer_group_id=customer_group_id,
+            status=status,
+        )
+        stmt = select(BillingQuote).where(*conditions).order_by(BillingQuote.id.asc())
+        async for chunk in stream_chunks(self._session, stmt, batch_size=batch_size):
+            yield chunk
 
+    @staticmethod
+    def _search_conditions(
+        *,
+        business_domains: Sequence[str],
+        template_id: int | None,
+        customer_id: int | None,
+        customer_group_id: int | None,
+        status: QuoteStatus | None,
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = [
+            BillingQuote.is_deleted.is_(False),
+            BillingQuote.business_domain.in_(business_domains),
+        ]
+        if template_id is not None:
+            conditions.append(BillingQuote.template_id == template_id)
         if customer_id is not None:
-            stmt = stmt.where(BillingQuote.customer_id == customer_id)
-            count_stmt = count_stmt.where(BillingQuote.customer_id == customer_id)
-
+            conditions.append(BillingQuote.customer_id == customer_id)
         if customer_group_id is not None:
-            stmt = stmt.where(BillingQuote.customer_group_id == customer_group_id)
-            count_stmt = count_stmt.where(BillingQuote.customer_group_id == customer_group_id)
-
+            conditions.append(BillingQuote.customer_group_id == customer_group_id)
         if status is not None:
-            stmt = stmt.where(BillingQuote.status == status.value)
-            count_stmt = count_stmt.where(BillingQuote.status == status.value)
+            conditions.append(BillingQuote.status == status.value)
+        return conditions
 
-        stmt = stmt.order_by(BillingQuote.id.desc()).offset(offset).limit(limit)
-        result = await self._session.execute(stmt)
-        total_result = await self._session.execute(count_stmt)
-        return list(result.scalars().all()), int(total_result.scalar_one())
+    async def deactivate_scope_quotes(self, scopes: Sequence[QuoteScopeRef]) -> list[int]:
+        """一条 ``UPDATE ... RETURNING id`` 把给定作用域的 ACTIVE 报价单标记为 INACTIVE，返回被更新的报价单 ID.
 
-    async def deactivate_scope_quotes(
-        self,
-        *,
-        scope_type: QuoteScope,
-        business_domain: str,
-        customer_id: int | None = None,
-        customer_group_id: int | None = None,
-    ) -> None:
-        stmt = select(BillingQuote).where(
-            BillingQuote.scope_type == scope_type.value,
-            BillingQuote.business_domain == business_domain,
-            BillingQuote.status == QuoteStatus.ACTIVE.value,
-            BillingQuote.is_deleted.is_(False),
-        )
-        if scope_type is QuoteScope.CUSTOMER:
-            stmt = stmt.where(BillingQuote.customer_id == customer_id)
-        elif scope_type is QuoteScope.GROUP:
-            stmt = stmt.where(BillingQuote.customer_group_id == customer_group_id)
-        else:
-            stmt = stmt.where(
-                BillingQuote.customer_id.is_(None),
-                BillingQuote.customer_group_id.is_(None),
+        作用域按 (scope_type, business_domain) 合并为 ``customer_id IN (...)`` / ``customer_group_id IN (...)``
+        条件，语句数与作用域数量无关。
+        """
+        if not scopes:
+            return []
+        targets: dict[tuple[QuoteScope, str], set[int]] = {}
+        for scope in scopes:
+            ids = targets.setdefault((scope.scope_type, scope.business_domain), set())
+            if scope.scope_type is QuoteScope.CUSTOMER and scope.customer_id is not None:
+                ids.add(scope.customer_id)
+            elif scope.scope_type is QuoteScope.GROUP and scope.customer_group_id is not None:
+                ids.add(scope.customer_group_id)
+
+        scope_conditions: list[ColumnElement[bool]] = []
+        for (scope_type, business_domain), ids in targets.items():
+            target: ColumnElement[bool]
+            if scope_type is QuoteScope.CUSTOMER:
+                target = BillingQuote.customer_id.in_(sorted(ids))
+            elif scope_type is QuoteScope.GROUP:
+                target = BillingQuote.customer_group_id.in_(sorted(ids))
+            else:
+                target = and_(BillingQuote.customer_id.is_(None), BillingQuote.customer_group_id.is_(None))
+            scope_conditions.append(
+                and_(
+                    BillingQuote.scope_type == scope_type.value,
+                    BillingQuote.business_domain == business_domain,
+                    target,
+                )
             )
-        result = await self._session.execute(stmt)
-        quotes = list(result.scalars().all())
-        if not quotes:
-            return
-        for quote in quotes:
-            quote.status = QuoteStatus.INACTIVE.value
-        await self._session.flush()
+        return await self._deactivate(or_(*scope_conditions))
 
-    async def deactivate_by_template(self, template_id: int) -> None:
-        stmt = select(BillingQuote).where(
-            BillingQuote.template_id == template_id,
-            BillingQuote.status == QuoteStatus.ACTIVE.value,
-            BillingQuote.is_deleted.is_(False),
+    async def deactivate_by_template(self, template_id: int) -> list[int]:
+        """一条 ``UPDATE ... RETURNING id`` 失效模板的全部 ACTIVE 报价单."""
+        return await self._deactivate(BillingQuote.template_id == template_id)
+
+    async def _deactivate(self, condition: ColumnElement[bool]) -> list[int]:
+        # 不把报价单加载进会话；已在会话中的对象按返回的 ID 同步状态
+        stmt = (
+            update(BillingQuote)
+            .where(
+                condition,
+                BillingQuote.status == QuoteStatus.ACTIVE.value,
+                BillingQuote.is_deleted.is_(False),
+            )
+            .values(status=QuoteStatus.INACTIVE.value, superseded_at=func.now())
+            .returning(BillingQuote.id)
+            .execution_options(synchronize_session="fetch")
         )
         result = await self._session.execute(stmt)
-        quotes = list(result.scalars().all())
-        if not quotes:
-            return
-        for quote in quotes:
-            quote.status = QuoteStatus.INACTIVE.value
-        await self._session.flush()
+        return list(result.scalars().all())
 
     async def find_active_quote(
         self,
@@ -157,3 +268,156 @@ class BillingQuoteRepository:
         stmt = stmt.order_by(BillingQuote.updated_at.desc()).limit(1)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def resolve_effective_quote(
+        self,
+        *,
+        customer_id: int,
+        now: datetime,
+    ) -> tuple[str, BillingQuote | None] | None:
+        """单条 SQL 解析客户生效报价单.
+
+        优先级：客户 → 客户组（按 assigned_at 倒序）→ 全局，同级取 updated_at 最新；与批量解析共用同一条候选语句。
+        返回 (客户 business_domain, 报价单)，客户不存在时返回 None。
+        """
+        result = await self._session.execute(_single_resolve_stmt(), {"customer_ids": [customer_id], "now": now})
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def resolve_effective_quote_ids(
+        self,
+        *,
+        customer_ids: Sequence[int],
+        business_domains: Sequence[str],
+        now: datetime,
+    ) -> dict[int, int | None]:
+        """批量解析客户生效报价单 ID.
+
+        按 RESOLVE_BATCH_SIZE 分批，每批一条 SQL（DISTINCT ON 取每个客户优先级最高的候选）。
+        返回 {customer_id: quote_id}，不存在/已删除/无权限业务域的客户不出现在结果中。
+        """
+        resolved: dict[int, int | None] = {}
+        if not customer_ids or not business_domains:
+            return resolved
+        unique_ids = list(dict.fromkeys(customer_ids))
+        for start in range(0, len(unique_ids), RESOLVE_BATCH_SIZE):
+            chunk = unique_ids[start : start + RESOLVE_BATCH_SIZE]
+            stmt = _build_batch_resolve_stmt(chunk, business_domains, _effective_conditions(now))
+            result = await self._session.execute(stmt)
+            resolved.update({row.customer_id: row.quote_id for row in result})
+        return resolved
+
+    async def resolve_quote_at(
+        self,
+        *,
+        customer_id: int,
+        at: datetime,
+    ) -> tuple[str, BillingQuote | None] | None:
+        """历史解析：客户在 ``at`` 时刻实际执行的报价单，用于重算历史账期.
+
+        按 ``applied_range @> at`` 匹配（含已失效报价单在被替代前的区间），各作用域分支走
+        idx_billing_quotes_customer_range / group_range / global_range GiST 索引；优先级与实时解析一致。
+        客户组成员按当前关系计算。返回值与 ``resolve_effective_quote`` 一致。
+        """
+        winner = _build_batch_resolve_stmt([customer_id], None, _applied_conditions(at), recorded_before=at).subquery(
+            "resolved"
+        )
+        stmt = select(winner.c.business_domain, BillingQuote).outerjoin(
+            BillingQuote, BillingQuote.id == winner.c.quote_id
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def resolve_quote_ids_at(
+        self,
+        *,
+        customer_ids: Sequence[int],
+        business_domains: Sequence[str],
+        at: datetime,
+    ) -> dict[int, int | None]:
+        """``resolve_quote_at`` 的批量版本，返回值与 ``resolve_effective_quote_ids`` 一致."""
+        resolved: dict[int, int | None] = {}
+        if not customer_ids or not business_domains:
+            return resolved
+        unique_ids = list(dict.fromkeys(customer_ids))
+        conditions = _applied_conditions(at)
+        for start in range(0, len(unique_ids), RESOLVE_BATCH_SIZE):
+            chunk = unique_ids[start : start + RESOLVE_BATCH_SIZE]
+            stmt = _build_batch_resolve_stmt(chunk, business_domains, conditions, recorded_before=at)
+            result = await self._session.execute(stmt)
+            resolved.update({row.customer_id: row.quote_id for row in result})
+        return resolved
+
+
+def _effective_conditions(now: datetime | ColumnElement[datetime]) -> tuple[ColumnElement[bool], ...]:
+    return (
+        BillingQuote.status == QuoteStatus.ACTIVE.value,
+        BillingQuote.is_deleted.is_(False),
+        BillingQuote.effective_date <= now,
+        or_(BillingQuote.expire_date.is_(None), BillingQuote.expire_date > now),
+    )
+
+
+@cache
+def _single_resolve_stmt() -> Select[str, BillingQuote]:
+    """单客户实时解析语句只构建一次（构造语句的耗时远高于执行），执行时绑定 ``customer_ids`` / ``now``."""
+    targets = candidate_targets([])
+    now = bindparam("now", type_=DateTime(timezone=True))
+    candidates = quote_candidates(targets, _effective_conditions(now)).subquery("candidates")
+    winner = (
+        select(candidates.c.quote_id)
+        .order_by(*candidate_priority(candidates), candidates.c.updated_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return select(targets.c.business_domain, BillingQuote).outerjoin(BillingQuote, BillingQuote.id == winner)
+
+
+def _applied_conditions(at: datetime) -> tuple[ColumnElement[bool], ...]:
+    # 不看 status：已失效的报价单在被替代前的区间内仍然有效
+    return (
+        BillingQuote.is_deleted.is_(False),
+        BillingQuote.applied_range.contains(at),
+    )
+
+
+def _build_batch_resolve_stmt(
+    customer_ids: Sequence[int],
+    business_domains: Sequence[str] | None,
+    effective: tuple[ColumnElement[bool], ...],
+    *,
+    recorded_before: datetime | None = None,
+) -> Select[tuple[int, str, int | None]]:
+    """每个客户优先级最高的候选报价单；``business_domains`` 为 None 时不按业务域过滤.
+
+    ``recorded_before`` 用于历史解析：同级多条候选（补录的报价单生效日期早于被替代的旧报价单失效时间）时，
+    优先取当时已存在的报价单，即当时实际执行的报价。
+    """
+    targets = candidate_targets(customer_ids, business_domains)
+    candidates = quote_candidates(targets, effective).subquery("candidates")
+    ordering = [candidates.c.customer_id, *candidate_priority(candidates)]
+    if recorded_before is None:
+        ordering.append(candidates.c.updated_at.desc())
+    else:
+        # 失效会刷新 updated_at，历史解析改按创建时间取同级最新
+        ordering.extend(
+            [
+                (candidates.c.created_at <= recorded_before).desc(),
+                candidates.c.created_at.desc(),
+                candidates.c.quote_id.desc(),
+            ]
+        )
+    winners = (
+        select(candidates.c.customer_id, candidates.c.quote_id)
+        .distinct(candidates.c.customer_id)
+        .order_by(*ordering)
+        .subquery("winners")
+    )
+    return select(targets.c.customer_id, targets.c.business_domain, winners.c.quote_id).outerjoin(
+        winners, winners.c.customer_id == targets.c.customer_id
+    )
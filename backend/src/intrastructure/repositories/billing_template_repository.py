@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.domain.billing.entities import TemplateType
 from src.intrastructure.database.models import BillingTemplate
+from src.intrastructure.repositories.pagination import Page, TotalMode, paginate
+from src.intrastructure.repositories.search import keyword_condition
 
 
 class BillingTemplateRepository:
@@ -57,9 +59,11 @@ class BillingTemplateRepository:
         customer_group_id: int | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[BillingTemplate], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[BillingTemplate]:
         if not business_domains:
-            return [], 0
+            return Page()
 
         base_condition = BillingTemplate.is_deleted.is_(False)
         stmt = select(BillingTemplate).where(base_condition)
@@ -68,16 +72,13 @@ class BillingTemplateRepository:
         stmt = stmt.where(BillingTemplate.template_type == template_type.value)
         count_stmt = count_stmt.where(BillingTemplate.template_type == template_type.value)
 
+        # 由 idx_billing_template_type_domain 函数索引 (template_type, lower(business_domain)) 覆盖
         normalized_domains = [domain.lower() for domain in business_domains]
         stmt = stmt.where(func.lower(BillingTemplate.business_domain).in_(normalized_domains))
         count_stmt = count_stmt.where(func.lower(BillingTemplate.business_domain).in_(normalized_domains))
 
         if keyword:
-            like = f"%{keyword}%"
-            condition = or_(
-                BillingTemplate.template_name.ilike(like),
-                BillingTemplate.template_code.ilike(like),
-            )
+            condition = keyword_condition(keyword, BillingTemplate.template_name, BillingTemplate.template_code)
             stmt = stmt.where(condition)
             count_stmt = count_stmt.where(condition)
 
@@ -89,7 +90,13 @@ class BillingTemplateRepository:
             stmt = stmt.where(BillingTemplate.customer_group_id == customer_group_id)
             count_stmt = count_stmt.where(BillingTemplate.customer_group_id == customer_group_id)
 
-        stmt = stmt.order_by(BillingTemplate.id.desc()).offset(offset).limit(limit)
-        result = await self._session.execute(stmt)
-        total_result = await self._session.execute(count_stmt)
-        return list(result.scalars().all()), int(total_result.scalar_one())
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=BillingTemplate.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
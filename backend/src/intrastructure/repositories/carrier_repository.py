@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
+from src.domain.region import GeoGroupRef
 from src.intrastructure.database.models import (
     Carrier,
     CarrierService,
@@ -15,9 +18,16 @@ from src.intrastructure.database.models import (
     CarrierServiceStatus,
     CarrierServiceTariff,
     CarrierServiceTariffSnapshot,
+    CarrierServiceTariffSnapshotStatus,
     CarrierStatus,
     Region,
 )
+from src.intrastructure.repositories.pagination import Page, TotalMode, paginate
+from src.intrastructure.repositories.search import keyword_condition
+from src.intrastructure.repositories.streaming import EXPORT_BATCH_SIZE, stream_chunks
+
+# 多行 INSERT 每条语句的行数（asyncpg 单条语句最多 32767 个参数）
+TARIFF_INSERT_BATCH_SIZE = 1000
 
 
 class CarrierRepository:
@@ -54,28 +64,28 @@ class CarrierRepository:
         status: CarrierStatus | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Carrier], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[Carrier]:
         stmt = select(Carrier).where(Carrier.is_deleted.is_(False))
         count_stmt = select(func.count()).select_from(Carrier).where(Carrier.is_deleted.is_(False))
         if keyword:
-            like = f"%{keyword}%"
-            stmt = stmt.where(
-                (Carrier.carrier_name.ilike(like))
-                | (Carrier.carrier_code.ilike(like))
-                | (Carrier.description.ilike(like))
-            )
-            count_stmt = count_stmt.where(
-                (Carrier.carrier_name.ilike(like))
-                | (Carrier.carrier_code.ilike(like))
-                | (Carrier.description.ilike(like))
-            )
+            condition = keyword_condition(keyword, Carrier.carrier_name, Carrier.carrier_code, Carrier.description)
+            stmt = stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
         if status:
             stmt = stmt.where(Carrier.status == status)
             count_stmt = count_stmt.where(Carrier.status == status)
-        stmt = stmt.order_by(Carrier.id.desc()).offset(offset).limit(limit)
-        result = await self._session.execute(stmt)
-        total = await self._session.execute(count_stmt)
-        return list(result.scalars().all()), int(total.scalar_one())
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=Carrier.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
 
     # ------------------------------------------------------------------ Services
     async def add_service(self, service: CarrierService) -> CarrierService:
@@ -107,7 +117,9 @@ class CarrierRepository:
         status: CarrierServiceStatus | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[CarrierService], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[CarrierService]:
         stmt = select(CarrierService).where(
             CarrierService.carrier_id == carrier_id,
             CarrierService.is_deleted.is_(False),
@@ -123,10 +135,16 @@ class CarrierRepository:
         if status:
             stmt = stmt.where(CarrierService.status == status)
             count_stmt = count_stmt.where(CarrierService.status == status)
-        stmt = stmt.order_by(CarrierService.id.desc()).offset(offset).limit(limit)
-        result = await self._session.execute(stmt)
-        total = await self._session.execute(count_stmt)
-        return list(result.scalars().all()), int(total.scalar_one())
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=CarrierService.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
 
     # ------------------------------------------------------------------ Geo Groups
     async def add_geo_group(self, group: CarrierServiceGeoGroup) -> CarrierServiceGeoGroup:
@@ -194,6 +212,33 @@ class CarrierRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_active_geo_group_regions(self) -> list[GeoGroupRef]:
+        """所有 ACTIVE 分组的区域映射，用于邮编 → 分组解析."""
+        stmt = (
+            select(
+                CarrierServiceGeoGroup.carrier_service_id,
+                CarrierServiceGeoGroup.id,
+                CarrierServiceGeoGroup.group_code,
+                CarrierServiceGeoGroupRegion.region_code,
+            )
+            .join(CarrierServiceGeoGroupRegion, CarrierServiceGeoGroupRegion.group_id == CarrierServiceGeoGroup.id)
+            .where(
+                CarrierServiceGeoGroup.status == CarrierServiceGeoGroupStatus.ACTIVE.value,
+                CarrierServiceGeoGroup.is_deleted.is_(False),
+                CarrierServiceGeoGroupRegion.is_deleted.is_(False),
+            )
+        )
+        result = await self._session.execute(stmt)
+        return [
+            GeoGroupRef(
+                carrier_service_id=row.carrier_service_id,
+                group_id=row.id,
+                group_code=row.group_code,
+                region_code=row.region_code,
+            )
+            for row in result
+        ]
+
     # ------------------------------------------------------------------ Tariffs
     async def replace_tariffs(
         self,
@@ -211,6 +256,17 @@ class CarrierRepository:
         await self._session.flush()
         return list(tariffs)
 
+    async def replace_service_tariffs(self, service_id: int, rows: Sequence[dict[str, Any]]) -> int:
+        """整体替换服务的全部运费行：一条 DELETE + 多行 INSERT（每条最多 ``TARIFF_INSERT_BATCH_SIZE`` 行）."""
+        await self._session.execute(
+            delete(CarrierServiceTariff).where(CarrierServiceTariff.carrier_service_id == service_id)
+        )
+        for start in range(0, len(rows), TARIFF_INSERT_BATCH_SIZE):
+            await self._session.execute(
+                insert(CarrierServiceTariff).values(list(rows[start : start + TARIFF_INSERT_BATCH_SIZE]))
+            )
+        return len(rows)
+
     async def list_tariffs(self, service_id: int, geo_group_id: int) -> list[CarrierServiceTariff]:
         stmt = (
             select(CarrierServiceTariff)
@@ -245,6 +301,46 @@ class CarrierRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def iter_tariff_export_chunks(
+        self,
+        carrier_id: int,
+        *,
+        service_id: int | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """承运商（可限定服务）的全部运费行，附带承运商/服务/分组编码，经服务端游标分批读取.
+
+        每行含 carrier_code、service_code、geo_group_code、currency 与各维度上限、price_amount。
+        """
+        tariff = CarrierServiceTariff
+        stmt = (
+            select(
+                Carrier.carrier_code,
+                CarrierService.service_code,
+                CarrierServiceGeoGroup.group_code.label("geo_group_code"),
+                tariff.currency,
+                tariff.weight_max_kg,
+                tariff.volume_max_cm3,
+                tariff.girth_max_cm,
+                tariff.price_amount,
+            )
+            .join(CarrierService, CarrierService.id == tariff.carrier_service_id)
+            .join(Carrier, Carrier.id == CarrierService.carrier_id)
+            .join(CarrierServiceGeoGroup, CarrierServiceGeoGroup.id == tariff.geo_group_id)
+            .where(CarrierService.carrier_id == carrier_id, tariff.is_deleted.is_(False))
+            .order_by(
+                tariff.carrier_service_id.asc(),
+                tariff.geo_group_id.asc(),
+                tariff.weight_max_kg.asc(),
+                tariff.volume_max_cm3.asc(),
+                tariff.girth_max_cm.asc(),
+            )
+        )
+        if service_id is not None:
+            stmt = stmt.where(tariff.carrier_service_id == service_id)
+        async for chunk in stream_chunks(self._session, stmt, batch_size=batch_size, scalars=False):
+            yield chunk
+
     async def get_latest_tariff_snapshot_version(self, carrier_id: int, service_id: int) -> int:
         stmt = select(func.max(CarrierServiceTariffSnapshot.version)).where(
             CarrierServiceTariffSnapshot.carrier_id == carrier_id,
@@ -258,3 +354,76 @@ class CarrierRepository:
         self._session.add(snapshot)
         await self._session.flush()
         return snapshot
+
+    async def list_tariff_snapshot_versions(
+        self,
+        *,
+        carrier_id: int | None = None,
+        service_id: int | None = None,
+        carrier_code: str | None = None,
+        service_code: str | None = None,
+        active_services_only: bool = False,
+    ) -> list[Row[str, str, int, int, int, datetime]]:
+        """按 (carrier_code, service_code) 汇总快照的版本信息，不读取 payload，用作进程内快照缓存的版本检查.
+
+        返回 (总数, ACTIVE 数, max(version), max(updated_at))：新增版本、状态变更（含未更新 updated_at 的
+        直接 SQL 修改）与删除都会改变结果。
+        """
+        snapshot = CarrierServiceTariffSnapshot
+        stmt = select(
+            snapshot.carrier_code,
+            snapshot.service_code,
+            func.count(),
+            func.count().filter(
+                snapshot.status == CarrierServiceTariffSnapshotStatus.ACTIVE.value,
+                snapshot.is_deleted.is_(False),
+            ),
+            func.max(snapshot.version),
+            func.max(snapshot.updated_at),
+        ).group_by(snapshot.carrier_code, snapshot.service_code)
+        if carrier_id is not None:
+            stmt = stmt.where(snapshot.carrier_id == carrier_id)
+        if service_id is not None:
+            stmt = stmt.where(snapshot.service_id == service_id)
+        if carrier_code is not None:
+            stmt = stmt.where(snapshot.carrier_code == carrier_code)
+        if service_code is not None:
+            stmt = stmt.where(snapshot.service_code == service_code)
+        if active_services_only:
+            stmt = (
+                stmt.join(CarrierService, CarrierService.id == snapshot.service_id)
+                .join(Carrier, Carrier.id == snapshot.carrier_id)
+                .where(
+                    Carrier.status == CarrierStatus.ACTIVE.value,
+                    Carrier.is_deleted.is_(False),
+                    CarrierService.status == CarrierServiceStatus.ACTIVE.value,
+                    CarrierService.is_deleted.is_(False),
+                )
+            )
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def list_tariff_snapshot_headers(self, keys: Sequence[tuple[str, str]]) -> list[CarrierServiceTariffSnapshot]:
+        """指定 (carrier_code, service_code) 的全部 ACTIVE 快照（不加载 payload），按版本倒序."""
+        if not keys:
+            return []
+        snapshot = CarrierServiceTariffSnapshot
+        stmt = (
+            select(snapshot)
+            .options(defer(snapshot.payload))
+            .where(
+                tuple_(snapshot.carrier_code, snapshot.service_code).in_(keys),
+                snapshot.status == CarrierServiceTariffSnapshotStatus.ACTIVE.value,
+                snapshot.is_deleted.is_(False),
+            )
+            .order_by(snapshot.carrier_code, snapshot.service_code, snapshot.version.desc())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_tariff_snapshot_payloads(self, snapshot_ids: Sequence[int]) -> dict[int, dict[str, object]]:
+        if not snapshot_ids:
+            return {}
+        snapshot = CarrierServiceTariffSnapshot
+        result = await self._session.execute(select(snapshot.id, snapshot.payload).where(snapshot.id.in_(snapshot_ids)))
+        return dict(result.tuples().all())
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    BindParameter,
+    ScalarSelect,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    or_,
+    select,
+    union,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.billing.entities import QuoteScope, QuoteStatus
+from src.intrastructure.database.models import BillingQuote, Customer, CustomerEffectiveQuote, CustomerGroupMember
+from src.intrastructure.repositories.quote_candidates import candidate_priority, candidate_targets, quote_candidates
+
+
+class CustomerEffectiveQuoteRepository:
+    """客户生效报价物化表（``customer_effective_quotes``）的重算与查询.
+
+    重算按受影响的客户集合进行：先取客户 ID，删除其旧区间，再用一条 INSERT ... SELECT 按报价单的
+    effective_date / expire_date 切分时间轴，每段取与实时解析相同优先级（客户 → 客户组按 assigned_at 倒序
+    → 全局，同级 updated_at 最新）的报价单。语句数与客户数量无关。
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def refresh_customers(self, customer_ids: Sequence[int]) -> int:
+        return await self._refresh(list(dict.fromkeys(customer_ids)))
+
+    async def refresh_group(self, group_id: int) -> int:
+        """客户组成员变更后重算：当前成员 + 物化结果仍指向该组报价单的原成员."""
+        stmt = union(
+            select(CustomerGroupMember.customer_id).where(CustomerGroupMember.group_id == group_id),
+            select(CustomerEffectiveQuote.customer_id)
+            .join(BillingQuote, BillingQuote.id == CustomerEffectiveQuote.quote_id)
+            .where(BillingQuote.customer_group_id == group_id),
+        )
+        return await self._refresh(list((await self._session.execute(stmt)).scalars()))
+
+    async def refresh_for_quotes(self, quote_ids: Sequence[int]) -> int:
+        """报价单新增 / 失效后重算：报价单作用域内的客户 + 物化结果指向这些报价单的客户.
+
+        GROUP 报价单展开为组成员，GLOBAL 报价单展开为同业务域的全部客户。
+        """
+        if not quote_ids:
+            return 0
+        quotes = (
+            select(
+                BillingQuote.scope_type,
+                BillingQuote.customer_id,
+                BillingQuote.customer_group_id,
+                BillingQuote.business_domain,
+            )
+            .where(BillingQuote.id == any_(_id_array("quote_ids", quote_ids)))
+            .cte("changed_quotes")
+        )
+        stmt = union(
+            select(CustomerEffectiveQuote.customer_id).where(
+                CustomerEffectiveQuote.quote_id == any_(_id_array("quote_ids", quote_ids))
+            ),
+            select(quotes.c.customer_id).where(quotes.c.scope_type == QuoteScope.CUSTOMER.value),
+            select(CustomerGroupMember.customer_id)
+            .join(quotes, quotes.c.customer_group_id == CustomerGroupMember.group_id)
+            .where(quotes.c.scope_type == QuoteScope.GROUP.value),
+            select(Customer.id)
+            .join(quotes, quotes.c.business_domain == Customer.business_domain)
+            .where(quotes.c.scope_type == QuoteScope.GLOBAL.value),
+        )
+        return await self._refresh(list((await self._session.execute(stmt)).scalars()))
+
+    async def resolve(self, *, customer_id: int, now: datetime) -> tuple[str, BillingQuote | None] | None:
+        """按主键区间查询客户在 ``now`` 命中的报价单，返回值与 ``resolve_effective_quote`` 一致."""
+        stmt = (
+            select(Customer.business_domain, BillingQuote)
+            .outerjoin(BillingQuote, BillingQuote.id == _current_quote_id(now))
+            .where(Customer.id == customer_id, Customer.is_deleted.is_(False))
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def resolve_ids(
+        self,
+        *,
+        customer_ids: Sequence[int],
+        business_domains: Sequence[str],
+        now: datetime,
+    ) -> dict[int, int | None]:
+        """批量版本，返回值与 ``resolve_effective_quote_ids`` 一致."""
+        if not customer_ids or not business_domains:
+            return {}
+        stmt = select(Customer.id, _current_quote_id(now)).where(
+            Customer.id == any_(_id_array("customer_ids", list(dict.fromkeys(customer_ids)))),
+            Customer.is_deleted.is_(False),
+            func.lower(Customer.business_domain).in_(business_domains),
+        )
+        result = await self._session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def _refresh(self, customer_ids: list[int]) -> int:
+        if not customer_ids:
+            return 0
+        await self._session.execute(
+            delete(CustomerEffectiveQuote).where(
+                CustomerEffectiveQuote.customer_id == any_(_id_array("customer_ids", customer_ids))
+            )
+        )
+        stmt = insert(CustomerEffectiveQuote).from_select(
+            ["customer_id", "valid_from", "valid_to", "quote_id"], _build_intervals_stmt(customer_ids)
+        )
+        # 并发重算同一客户时以后提交者为准
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CustomerEffectiveQuote.customer_id, CustomerEffectiveQuote.valid_from],
+            set_={
+                "valid_to": stmt.excluded.valid_to,
+                "quote_id": stmt.excluded.quote_id,
+                "refreshed_at": func.now(),
+            },
+        )
+        result = await self._session.execute(stmt)
+        return int(getattr(result, "rowcount", 0) or 0)
+
+
+def _id_array(name: str, ids: Sequence[int]) -> BindParameter[Any]:
+    return bindparam(name, list(ids), type_=ARRAY(BigInteger))
+
+
+def _current_quote_id(now: datetime) -> ScalarSelect[int]:
+    # 与外层 Customer 关联；区间互不重叠，主键倒序扫描 valid_from <= now 的第一段即为当前区间
+    return (
+        select(CustomerEffectiveQuote.quote_id)
+        .where(
+            CustomerEffectiveQuote.customer_id == Customer.id,
+            CustomerEffectiveQuote.valid_from <= now,
+            or_(CustomerEffectiveQuote.valid_to.is_(None), CustomerEffectiveQuote.valid_to > now),
+        )
+        .order_by(CustomerEffectiveQuote.valid_from.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def _build_intervals_stmt(customer_ids: Sequence[int]) -> Select[tuple[int, datetime, datetime | None, int]]:
+    active = (BillingQuote.status == QuoteStatus.ACTIVE.value, BillingQuote.is_deleted.is_(False))
+    candidates = quote_candidates(candidate_targets(customer_ids), active).cte("candidates")
+
+    # 每个客户的候选报价单起止时间即为时间轴切分点，相邻切分点构成一段区间
+    points = union(
+        select(candidates.c.customer_id, candidates.c.effective_date.label("at")),
+        select(candidates.c.customer_id, candidates.c.expire_date).where(candidates.c.expire_date.is_not(None)),
+    ).subquery("points")
+    bounds = select(
+        points.c.customer_id,
+        points.c.at.label("valid_from"),
+        func.lead(points.c.at).over(partition_by=points.c.customer_id, order_by=points.c.at).label("valid_to"),
+    ).subquery("bounds")
+    return (
+        select(bounds.c.customer_id, bounds.c.valid_from, bounds.c.valid_to, candidates.c.quote_id)
+        .select_from(bounds)
+        .join(
+            candidates,
+            and_(
+                candidates.c.customer_id == bounds.c.customer_id,
+                candidates.c.effective_date <= bounds.c.valid_from,
+                or_(candidates.c.expire_date.is_(None), candidates.c.expire_date > bounds.c.valid_from),
+            ),
+        )
+        .distinct(bounds.c.customer_id, bounds.c.valid_from)
+        .order_by(
+            bounds.c.customer_id,
+            bounds.c.valid_from,
+            *candidate_priority(candidates),
+            candidates.c.updated_at.desc(),
+        )
+    )
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import func, or_, select
+from collections.abc import AsyncIterator, Sequence
+
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.intrastructure.database.models import Customer, CustomerGroupMember, CustomerStatus
+from src.intrastructure.repositories.pagination import Page, TotalMode, paginate
+from src.intrastructure.repositories.search import keyword_condition
+from src.intrastructure.repositories.streaming import EXPORT_BATCH_SIZE, stream_chunks
 
 
 class CustomerRepository:
@@ -58,28 +63,103 @@ class CustomerRepository:
         source: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Customer], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[Customer]:
+        if not business_domains:
+            return Page()
+        conditions = self._search_conditions(
+            keyword=keyword, business_domains=business_domains, status=status, source=source
+        )
+        stmt = select(Customer).where(*conditions)
+        count_stmt = select(func.count()).select_from(Customer).where(*conditions)
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=Customer.id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
+
+    async def iter_export_chunks(
+        self,
+        *,
+        keyword: str | None,
+        business_domains: list[str],
+        status: CustomerStatus | None,
+        source: str | None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Customer]]:
+        """与 ``search`` 相同的过滤条件，按 id 升序经服务端游标分批读取全部客户."""
         if not business_domains:
-            return [], 0
-        stmt = select(Customer).where(Customer.is_deleted.is_(False))
-        count_stmt = select(func.count()).select_from(Customer).where(Customer.is_deleted.is_(False))
-        stmt = stmt.where(Customer.business_domain.in_(business_domains))
-        count_stmt = count_stmt.where(Customer.business_domain.in_(business_domains))
+            return
+        conditions = self._search_conditions(
+            keyword=keyword, business_domains=business_domains, status=status, source=source
+        )
+        stmt = select(Customer).where(*conditions).order_by(Customer.id.asc())
+        async for chunk in stream_chunks(self._session, stmt, batch_size=batch_size):
+            yield chunk
+
+    @staticmethod
+    def _search_conditions(
+        *,
+        keyword: str | None,
+        business_domains: list[str],
+        status: CustomerStatus | None,
+        source: str | None,
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = [
+            Customer.is_deleted.is_(False),
+            Customer.business_domain.in_(business_domains),
+        ]
         if keyword:
-            like = f"%{keyword}%"
-            condition = or_(Customer.customer_name.ilike(like), Customer.customer_code.ilike(like))
-            stmt = stmt.where(condition)
-            count_stmt = count_stmt.where(condition)
+            conditions.append(keyword_condition(keyword, Customer.customer_name, Customer.customer_code))
         if status:
-            stmt = stmt.where(Customer.status == status)
-            count_stmt = count_stmt.where(Customer.status == status)
+            conditions.append(Customer.status == status)
         if source:
-            stmt = stmt.where(Customer.source == source)
-            count_stmt = count_stmt.where(Customer.source == source)
-        stmt = stmt.order_by(Customer.id.desc()).offset(offset).limit(limit)
+            conditions.append(Customer.source == source)
+        return conditions
+
+    async def partition_active_ids(self, partitions: int) -> list[tuple[int, int]]:
+        """将 ACTIVE 客户按 ID 等量切分为至多 ``partitions`` 段，返回各段 [首个 ID, 最后 ID]."""
+        numbered = (
+            select(Customer.id, func.ntile(partitions).over(order_by=Customer.id).label("bucket"))
+            .where(*_active_conditions())
+            .subquery("numbered")
+        )
+        stmt = (
+            select(func.min(numbered.c.id), func.max(numbered.c.id))
+            .group_by(numbered.c.bucket)
+            .order_by(numbered.c.bucket)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def list_active_in_range(self, *, first_id: int, last_id: int, limit: int) -> list[tuple[int, str]]:
+        """按 ID 升序读取 [first_id, last_id] 内的 ACTIVE 客户 (id, business_domain)."""
+        stmt = (
+            select(Customer.id, Customer.business_domain)
+            .where(*_active_conditions(), Customer.id >= first_id, Customer.id <= last_id)
+            .order_by(Customer.id)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_domains(self, customer_ids: Sequence[int], business_domains: list[str]) -> dict[int, str]:
+        """批量取未删除客户的业务域，限定在 ``business_domains`` 内；不存在或无权限的客户不返回."""
+        if not customer_ids:
+            return {}
+        stmt = select(Customer.id, Customer.business_domain).where(
+            Customer.id.in_(customer_ids),
+            Customer.is_deleted.is_(False),
+            func.lower(Customer.business_domain).in_(business_domains),
+        )
         result = await self._session.execute(stmt)
-        total_result = await self._session.execute(count_stmt)
-        return list(result.scalars().all()), int(total_result.scalar_one())
+        return dict(result.tuples().all())
 
     async def update_status(self, customer_id: int, status: CustomerStatus, operator: str | None = None) -> None:
         customer = await self.get_by_id(customer_id)
@@ -103,3 +183,7 @@ class CustomerRepository:
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+
+def _active_conditions() -> tuple[ColumnElement[bool], ...]:
+    return (Customer.is_deleted.is_(False), Customer.status == CustomerStatus.ACTIVE)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+from collections.abc import AsyncIterator, Sequence
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.billing.entities import BillingDomainError
+from src.domain.billing.storage import InventorySnapshot
+from src.intrastructure.database.models import InventoryDailySnapshot
+
+CSV_COLUMNS = frozenset({"customer_id", "snapshot_date", "volume_cbm", "weight_kg"})
+
+
+class InventorySnapshotRepository:
+    """Read-only repository for daily inventory snapshots."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def iter_period_chunks(
+        self,
+        *,
+        start: date,
+        end: date,
+        business_domains: list[str],
+        chunk_size: int,
+        first_customer_id: int | None = None,
+        last_customer_id: int | None = None,
+        customer_ids: Sequence[int] | None = None,
+    ) -> AsyncIterator[list[InventorySnapshot]]:
+        """按 (customer_id, snapshot_date) 游标分页读取 [start, end) 内的快照.
+
+        每页一条 SQL，走唯一索引，输出按客户有序，内存只占一页。可用 ``first_customer_id`` /
+        ``last_customer_id`` 限定客户 ID 闭区间，或用 ``customer_ids`` 限定为不连续的客户列表。
+        """
+        model = InventoryDailySnapshot
+        base = (
+            select(model.customer_id, model.snapshot_date, model.volume_cbm, model.weight_kg)
+            .where(
+                model.snapshot_date >= start,
+                model.snapshot_date < end,
+                func.lower(model.business_domain).in_(business_domains),
+            )
+            .order_by(model.customer_id, model.snapshot_date)
+            .limit(chunk_size)
+        )
+        if first_customer_id is not None:
+            base = base.where(model.customer_id >= first_customer_id)
+        if last_customer_id is not None:
+            base = base.where(model.customer_id <= last_customer_id)
+        if customer_ids is not None:
+            base = base.where(model.customer_id.in_(customer_ids))
+        cursor: tuple[int, date] | None = None
+        while True:
+            stmt = base if cursor is None else base.where(tuple_(model.customer_id, model.snapshot_date) > cursor)
+            rows = (await self._session.execute(stmt)).all()
+            if not rows:
+                return
+            yield [
+                InventorySnapshot(
+                    customer_id=row.customer_id,
+                    snapshot_date=row.snapshot_date,
+                    volume_cbm=float(row.volume_cbm),
+                    weight_kg=float(row.weight_kg),
+                )
+                for row in rows
+            ]
+            if len(rows) < chunk_size:
+                return
+            cursor = (rows[-1].customer_id, rows[-1].snapshot_date)
+
+
+async def iter_inventory_csv_chunks(path: Path, *, chunk_size: int) -> AsyncIterator[list[InventorySnapshot]]:
+    """分批读取库存快照 CSV（表头 customer_id,snapshot_date,volume_cbm,weight_kg），须按 customer_id 排序.
+
+    文件读取放到线程中执行，避免阻塞事件循环；内存只占一批。
+    """
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        missing = CSV_COLUMNS - set(reader.fieldnames or ())
+        if missing:
+            raise BillingDomainError(f"inventory csv missing columns: {', '.join(sorted(missing))}")
+
+        def read_chunk() -> list[InventorySnapshot]:
+            chunk: list[InventorySnapshot] = []
+            for row in islice(reader, chunk_size):
+                try:
+                    chunk.append(
+                        InventorySnapshot(
+                            customer_id=int(row["customer_id"]),
+                            snapshot_date=date.fromisoformat(row["snapshot_date"]),
+                            volume_cbm=float(row["volume_cbm"]),
+                            weight_kg=float(row["weight_kg"]),
+                        )
+                    )
+                except (TypeError, ValueError) as exc:
+                    raise BillingDomainError(f"invalid inventory csv row {reader.line_num}: {exc}") from exc
+            return chunk
+
+        while chunk := await asyncio.to_thread(read_chunk):
+            yield chunk
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.billing.invoice import InvoiceDraft, InvoiceStatus, invoice_number
+from src.domain.billing.storage import BillingPeriod
+from src.intrastructure.database.models import Invoice, InvoiceLine
+
+
+class InvoiceRepository:
+    """Repository for invoices."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_drafts(self, *, bill_run_id: int, period: BillingPeriod, drafts: Sequence[InvoiceDraft]) -> list[int]:
+        """批量写入账单头与明细，返回本次写入账单的客户 ID.
+
+        账单头为一条 ``INSERT ... ON CONFLICT (period, customer_id) DO UPDATE ... WHERE status = 'FAILED'
+        RETURNING``，以参数列表执行：由 SQLAlchemy insertmanyvalues 按页拼成多行 VALUES，批大小不受
+        asyncpg 单条语句 32767 个参数的限制。已有 ISSUED 账单的客户跳过，重复执行同一批不会产生重复账单；
+        已有 FAILED 账单的客户以本次计价结果覆盖，并替换其明细。
+        """
+        if not drafts:
+            return []
+        insert_stmt = pg_insert(Invoice)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[Invoice.period, Invoice.customer_id],
+            set_={
+                "bill_run_id": insert_stmt.excluded.bill_run_id,
+                "business_domain": insert_stmt.excluded.business_domain,
+                "quote_id": insert_stmt.excluded.quote_id,
+                "status": insert_stmt.excluded.status,
+                "line_count": insert_stmt.excluded.line_count,
+                "total_amount": insert_stmt.excluded.total_amount,
+                "error": insert_stmt.excluded.error,
+            },
+            where=Invoice.status == InvoiceStatus.FAILED.value,
+        ).returning(Invoice.id, Invoice.customer_id)
+        rows = [
+            {
+                "invoice_no": invoice_number(period, draft.customer_id),
+                "bill_run_id": bill_run_id,
+                "period": period.label,
+                "customer_id": draft.customer_id,
+                "business_domain": draft.business_domain,
+                "quote_id": draft.quote_id,
+                "status": draft.status.value,
+                "line_count": len(draft.result.lines),
+                "total_amount": draft.result.total_amount,
+                "error": draft.error,
+            }
+            for draft in drafts
+        ]
+        result = await self._session.execute(stmt, rows)
+        invoice_ids = {customer_id: invoice_id for invoice_id, customer_id in result.tuples()}
+        if invoice_ids:
+            # 覆盖 FAILED 账单时清掉旧明细；新账单没有明细，删除为空操作
+            await self._session.execute(delete(InvoiceLine).where(InvoiceLine.invoice_id.in_(invoice_ids.values())))
+        lines = [
+            {
+                "invoice_id": invoice_ids[draft.customer_id],
+                "line_no": line_no,
+                "charge_code": line.charge_code,
+                "charge_name": line.charge_name,
+                "category": line.category.value,
+                "unit": line.unit.value,
+                "record_count": line.record_count,
+                "quantity": line.quantity,
+                "amount": line.amount,
+            }
+            for draft in drafts
+            if draft.customer_id in invoice_ids
+            for line_no, line in enumerate(draft.result.lines, start=1)
+        ]
+        if lines:
+            await self._session.execute(insert(InvoiceLine), lines)
+        return list(invoice_ids)
+
+    async def list_failed_customers(
+        self, period: BillingPeriod, *, after_customer_id: int | None, limit: int
+    ) -> list[tuple[int, str]]:
+        """按客户 ID 升序读取账期内 FAILED 账单的 (customer_id, business_domain)."""
+        stmt = (
+            select(Invoice.customer_id, Invoice.business_domain)
+            .where(Invoice.period == period.label, Invoice.status == InvoiceStatus.FAILED.value)
+            .order_by(Invoice.customer_id)
+            .limit(limit)
+        )
+        if after_customer_id is not None:
+            stmt = stmt.where(Invoice.customer_id > after_customer_id)
+        result = await self._session.execute(stmt)
+        return list(result.tuples().all())
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class InvalidCursorError(ValueError):
+    """游标无法解析或与排序键类型不符."""
+
+
+class TotalMode(StrEnum):
+    """列表总数策略：exact 精确计数，estimate 取执行计划估算行数，none 不返回总数."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+@dataclass(slots=True)
+class Page[T]:
+    """分页结果；next_cursor 为空表示没有下一页，total 为空表示未计数."""
+
+    items: list[T] = field(default_factory=list)
+    total: int | None = 0
+    next_cursor: str | None = None
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + str(compiler.process(element.statement, **kw))
+
+
+def encode_cursor(value: int | str) -> str:
+    raw = json.dumps([value], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, expected: type[Any]) -> Any:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("invalid cursor") from exc
+    if not isinstance(data, list) or len(data) != 1:
+        raise InvalidCursorError("invalid cursor")
+    value = data[0]
+    if isinstance(value, bool) or not isinstance(value, expected):
+        raise InvalidCursorError("invalid cursor")
+    return value
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select[Any],
+    count_stmt: Select[Any],
+    *,
+    key: InstrumentedAttribute[Any],
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    descending: bool = True,
+    total_mode: TotalMode = TotalMode.EXACT,
+) -> Page[Any]:
+    """按唯一排序键分页.
+
+    传入 cursor 时改用 ``key < :last``（升序为 ``>``）定位，忽略 offset，深分页不再线性变慢；
+    多取一行判断是否有下一页，有则以本页最后一行的排序键生成 next_cursor。
+
+    总数按 ``total_mode`` 计算：exact 且无游标时在分页查询中附带 ``count(*) over()``，一次往返；
+    exact 且有游标时（窗口只能数到游标之后的行）在同一会话上另执行 count_stmt，不额外占用连接；
+    estimate 取 ``EXPLAIN`` 估算行数；none 不计数。已到最后一页时总数可直接推出，不再额外查询。
+    """
+    filtered = stmt
+    if cursor is not None:
+        last = decode_cursor(cursor, key.type.python_type)
+        stmt = stmt.where(key < last if descending else key > last)
+        offset = 0
+    page_stmt = stmt.order_by(key.desc() if descending else key.asc()).offset(offset).limit(limit + 1)
+
+    total: int | None = None
+    if total_mode is TotalMode.EXACT and cursor is None:
+        rows = (await session.execute(page_stmt.add_columns(func.count().over().label("total_count")))).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = int(rows[0][1])
+        elif offset == 0:
+            total = 0
+        else:
+            total = await _count(session, count_stmt)
+    elif total_mode is TotalMode.EXACT:
+        items = list((await session.execute(page_stmt)).scalars().all())
+        total = await _count(session, count_stmt)
+    else:
+        items = list((await session.execute(page_stmt)).scalars().all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(getattr(items[-1], key.key))
+
+    if total_mode is TotalMode.ESTIMATE:
+        if next_cursor is None and cursor is None and (items or offset == 0):
+            total = offset + len(items)
+        else:
+            estimate = await _estimate(session, filtered)
+            seen = len(items) + (1 if next_cursor else 0)
+            if cursor is not None:
+                total = max(estimate, seen)
+            elif items:
+                total = max(estimate, offset + seen)
+            else:
+                # offset 越过末尾：总数不超过 offset
+                total = min(estimate, offset)
+    return Page(items=items, total=total, next_cursor=next_cursor)
+
+
+async def _count(session: AsyncSession, count_stmt: Select[Any]) -> int:
+    result = await session.execute(count_stmt)
+    return int(result.scalar_one())
+
+
+async def _estimate(session: AsyncSession, stmt: Select[Any]) -> int:
+    """执行计划顶层节点的估算行数（基于 pg_class.reltuples 与列统计）."""
+    result = await session.execute(_Explain(stmt))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import (
+    CTE,
+    BigInteger,
+    ColumnElement,
+    CompoundSelect,
+    DateTime,
+    FromClause,
+    any_,
+    bindparam,
+    cast,
+    func,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.domain.billing.entities import QuoteScope
+from src.intrastructure.database.models import BillingQuote, Customer, CustomerGroupMember
+
+
+def candidate_targets(customer_ids: Sequence[int], business_domains: Sequence[str] | None = None) -> CTE:
+    """待解析客户 ``targets(customer_id, business_domain)``：未删除，``business_domains`` 为 None 时不按业务域过滤."""
+    conditions = [
+        Customer.id == any_(bindparam("customer_ids", list(customer_ids), type_=ARRAY(BigInteger))),
+        Customer.is_deleted.is_(False),
+    ]
+    if business_domains is not None:
+        conditions.append(func.lower(Customer.business_domain).in_(business_domains))
+    return (
+        select(Customer.id.label("customer_id"), Customer.business_domain.label("business_domain"))
+        .where(*conditions)
+        .cte("targets")
+    )
+
+
+def quote_candidates(targets: CTE, conditions: Sequence[ColumnElement[bool]]) -> CompoundSelect[Any]:
+    """``targets`` 中每个客户的候选报价单：客户 → 客户组 → 全局三个分支 UNION ALL.
+
+    各分支限定在客户所属业务域内，分别走 customer_id / customer_group_id / 业务域索引；``conditions`` 为
+    报价单的生效条件（实时、历史区间或物化重算的状态过滤）。输出列：customer_id, quote_id, scope_priority,
+    assigned_at（仅客户组分支）, created_at, updated_at, effective_date, expire_date；优先级排序由调用方决定。
+    """
+    no_assigned_at = cast(null(), DateTime(timezone=True))
+    customer_branch = (
+        select(
+            targets.c.customer_id,
+            BillingQuote.id.label("quote_id"),
+            BillingQuote.scope_priority.label("scope_priority"),
+            no_assigned_at.label("assigned_at"),
+            BillingQuote.created_at.label("created_at"),
+            BillingQuote.updated_at.label("updated_at"),
+            BillingQuote.effective_date.label("effective_date"),
+            BillingQuote.expire_date.label("expire_date"),
+        )
+        .join(BillingQuote, BillingQuote.customer_id == targets.c.customer_id)
+        .where(
+            *conditions,
+            BillingQuote.scope_type == QuoteScope.CUSTOMER.value,
+            BillingQuote.business_domain == targets.c.business_domain,
+        )
+    )
+    group_branch = (
+        select(
+            targets.c.customer_id,
+            BillingQuote.id,
+            BillingQuote.scope_priority,
+            CustomerGroupMember.assigned_at,
+            BillingQuote.created_at,
+            BillingQuote.updated_at,
+            BillingQuote.effective_date,
+            BillingQuote.expire_date,
+        )
+        .join(CustomerGroupMember, CustomerGroupMember.customer_id == targets.c.customer_id)
+        .join(BillingQuote, BillingQuote.customer_group_id == CustomerGroupMember.group_id)
+        .where(
+            *conditions,
+            CustomerGroupMember.is_deleted.is_(False),
+            BillingQuote.scope_type == QuoteScope.GROUP.value,
+            BillingQuote.business_domain == targets.c.business_domain,
+        )
+    )
+    global_branch = (
+        select(
+            targets.c.customer_id,
+            BillingQuote.id,
+            BillingQuote.scope_priority,
+            no_assigned_at,
+            BillingQuote.created_at,
+            BillingQuote.updated_at,
+            BillingQuote.effective_date,
+            BillingQuote.expire_date,
+        )
+        .join(BillingQuote, BillingQuote.business_domain == targets.c.business_domain)
+        .where(
+            *conditions,
+            BillingQuote.scope_type == QuoteScope.GLOBAL.value,
+            BillingQuote.customer_id.is_(None),
+            BillingQuote.customer_group_id.is_(None),
+        )
+    )
+    return union_all(customer_branch, group_branch, global_branch)
+
+
+def candidate_priority(candidates: FromClause) -> list[ColumnElement[Any]]:
+    """候选排序的优先级部分：作用域（客户 > 客户组 > 全局）→ 客户组按 assigned_at 倒序；同级取舍由调用方追加."""
+    return [candidates.c.scope_priority.desc(), candidates.c.assigned_at.desc().nulls_last()]
@@ -3,7 +3,10 @@ from __future__ import annotations
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.region import RegionNode
 from src.intrastructure.database.models import Region, RegionLevel
+from src.intrastructure.repositories.pagination import Page, TotalMode, paginate
+from src.intrastructure.repositories.search import keyword_condition
 
 
 class RegionRepository:
@@ -26,7 +29,9 @@ class RegionRepository:
         keyword: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Region], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> Page[Region]:
         stmt = select(Region).where(Region.is_deleted.is_(False))
         count_stmt = select(func.count()).select_from(Region).where(Region.is_deleted.is_(False))
 
@@ -40,11 +45,39 @@ class RegionRepository:
             stmt = stmt.where(Region.parent_code == parent_code)
             count_stmt = count_stmt.where(Region.parent_code == parent_code)
         if keyword:
-            like = f"%{keyword}%"
-            stmt = stmt.where(Region.name.ilike(like) | Region.region_code.ilike(like))
-            count_stmt = count_stmt.where(Region.name.ilike(like) | Region.region_code.ilike(like))
-
-        stmt = stmt.order_by(Region.region_code).offset(offset).limit(limit)
-        regions_result = await self._session.execute(stmt)
-        total_result = await self._session.execute(count_stmt)
-        return list(regions_result.scalars().all()), int(total_result.scalar_one())
+            condition = keyword_condition(keyword, Region.name, Region.region_code)
+            stmt = stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
+
+        return await paginate(
+            self._session,
+            stmt,
+            count_stmt,
+            key=Region.region_code,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
+            descending=False,
+        )
+
+    async def list_nodes(self) -> list[RegionNode]:
+        """读取全部区域的层级与邮编前缀，用于构建进程内索引（不加载 ORM 对象）."""
+        stmt = select(
+            Region.region_code,
+            Region.name,
+            Region.level,
+            Region.parent_code,
+            Region.postal_code_prefix,
+        ).where(Region.is_deleted.is_(False))
+        result = await self._session.execute(stmt)
+        return [
+            RegionNode(
+                region_code=row.region_code,
+                name=row.name,
+                level=row.level,
+                parent_code=row.parent_code,
+                postal_code_prefix=row.postal_code_prefix,
+            )
+            for row in result
+        ]
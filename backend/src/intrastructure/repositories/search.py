@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(keyword: str) -> str:
+    """转义 LIKE 通配符，关键字按字面匹配."""
+    return keyword.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", f"{LIKE_ESCAPE}%").replace("_", f"{LIKE_ESCAPE}_")
+
+
+def keyword_condition(keyword: str, *columns: InstrumentedAttribute[Any]) -> ColumnElement[bool]:
+    """多列包含匹配：``col ILIKE '%kw%'`` 的 OR 组合.
+
+    各列均建有 ``gin_trgm_ops`` 索引，规划器按列走 Bitmap Index Scan 后 BitmapOr，
+    不再顺序扫描全表；因此每列保持独立的 ILIKE 条件，不要拼接成表达式。pg_trgm 按 3 字符切分，
+    少于 3 个字符的关键字无法通过索引收窄，仍按同样的条件匹配（短编码、中日文名称需要可搜）。
+    """
+    pattern = f"%{escape_like(keyword.strip())}%"
+    return or_(*(column.ilike(pattern, escape=LIKE_ESCAPE) for column in columns))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 导出时每批从服务端游标读取的行数
+EXPORT_BATCH_SIZE = 1000
+
+
+async def stream_chunks(
+    session: AsyncSession,
+    stmt: Select[*tuple[Any, ...]],
+    *,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    scalars: bool = True,
+) -> AsyncIterator[Sequence[Any]]:
+    """以服务端游标（``yield_per``）分批读取查询结果，内存只占一批，与总行数无关.
+
+    ``scalars`` 为真时返回 ORM 实体，否则返回按列访问的 Row。调用方提前结束迭代
+    （例如客户端断开）时关闭游标。
+    """
+    stmt = stmt.execution_options(yield_per=batch_size)
+    result = await (session.stream_scalars(stmt) if scalars else session.stream(stmt))
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
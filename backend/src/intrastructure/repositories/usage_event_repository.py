@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.intrastructure.database.models import UsageEvent
+
+
+class UsageEventRepository:
+    """Append-only repository for usage events."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_many(self, rows: Sequence[dict[str, Any]]) -> set[tuple[str, str]]:
+        """``INSERT ... ON CONFLICT (business_domain, idempotency_key) DO NOTHING RETURNING``，返回实际写入的 (业务域, 幂等键).
+
+        以参数列表执行：语句只编译一次（走编译缓存），由 SQLAlchemy insertmanyvalues 按页拼成多行
+        VALUES 发送并汇总 RETURNING；业务域内已存在的幂等键跳过，重复上报同一批事件不会产生重复用量。
+        """
+        if not rows:
+            return set()
+        stmt = (
+            pg_insert(UsageEvent)
+            .on_conflict_do_nothing(index_elements=[UsageEvent.business_domain, UsageEvent.idempotency_key])
+            .returning(UsageEvent.business_domain, UsageEvent.idempotency_key)
+        )
+        result = await self._session.execute(stmt, list(rows))
+        return {(business_domain, idempotency_key) for business_domain, idempotency_key in result}
+
+    async def summarize_period(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        business_domains: list[str],
+        first_customer_id: int,
+        last_customer_id: int,
+        customer_ids: Sequence[int] | None = None,
+    ) -> list[tuple[int, str, str, float, int]]:
+        """汇总 [start, end) 内的用量事件：按 (customer_id, charge_code, unit, quantity) 分组计数，按客户有序.
+
+        走 ``(customer_id, occurred_at)`` 索引；同一收费项上报的数量通常只有少数几种取值，
+        返回行数远少于事件数。``customer_ids`` 用于限定为客户 ID 闭区间内不连续的客户列表。
+        """
+        model = UsageEvent
+        stmt = (
+            select(model.customer_id, model.charge_code, model.unit, model.quantity, func.count())
+            .where(
+                model.customer_id >= first_customer_id,
+                model.customer_id <= last_customer_id,
+                model.occurred_at >= start,
+                model.occurred_at < end,
+                func.lower(model.business_domain).in_(business_domains),
+            )
+            .group_by(model.customer_id, model.charge_code, model.unit, model.quantity)
+            .order_by(model.customer_id, model.charge_code, model.unit, model.quantity)
+        )
+        if customer_ids is not None:
+            stmt = stmt.where(model.customer_id.in_(customer_ids))
+        rows = (await self._session.execute(stmt)).tuples()
+        return [
+            (customer_id, charge_code, unit, float(quantity), count)
+            for customer_id, charge_code, unit, quantity, count in rows
+        ]
@@ -0,0 +1 @@
+"""Batch jobs run from the command line (``python -m src.jobs.<name>``)."""
@@ -0,0 +1,126 @@
+"""Monthly bill run: rate every ACTIVE customer for a period and write invoices.
+
+    python -m src.jobs.bill_run --period 2026-09 [--workers 4] [--partitions 16] [--batch-size 500]
+
+Customers are split into ID-range partitions that a pool of ``--workers`` coroutines processes, one
+Postgres session each. Every batch of customers commits its invoices together with the partition
+checkpoint, so re-running the same period after a crash resumes from the last committed customer.
+Exits with status 1 when any partition failed or any invoice is FAILED (no effective quote, rating
+error); run the command again to retry those partitions and re-rate the failed invoices.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from src.application.billing import (
+    CompleteBillRunUseCase,
+    PrepareBillRunCommand,
+    PrepareBillRunUseCase,
+    RetryFailedInvoicesCommand,
+    RetryFailedInvoicesUseCase,
+    RunBillPartitionCommand,
+    RunBillPartitionUseCase,
+)
+from src.domain.billing.entities import BillingDomainError
+from src.domain.billing.invoice import BillRunPartitionStatus, BillRunStatus
+from src.intrastructure.database.models import BillRun
+from src.intrastructure.database.postgres import postgres_db
+from src.intrastructure.repositories import BillRunRepository
+from src.shared.config import settings
+from src.shared.logger import setup_logging
+from src.shared.logger.factories import app_logger
+
+logger = app_logger.bind(component="bill_run")
+
+
+def max_workers() -> int:
+    """连接池上限减去持有账期锁的一条连接."""
+    return max(1, settings.postgres.POOL_SIZE + settings.postgres.MAX_OVERFLOW - 1)
+
+
+async def run_partitions(bill_run_id: int, partition_nos: list[int], *, workers: int, batch_size: int) -> None:
+    """固定数量的 worker 从队列领取分区，每个 worker 同时只占用一个会话（一条连接）."""
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for partition_no in partition_nos:
+        queue.put_nowait(partition_no)
+
+    async def worker() -> None:
+        while not queue.empty():
+            partition_no = queue.get_nowait()
+            cmd = RunBillPartitionCommand(bill_run_id=bill_run_id, partition_no=partition_no, batch_size=batch_size)
+            try:
+                async with postgres_db.session() as session:
+                    await RunBillPartitionUseCase(session).execute(cmd)
+            except Exception:
+                # 分区已标记为 FAILED，其余分区继续执行
+                logger.exception("bill run partition failed", bill_run_id=bill_run_id, partition_no=partition_no)
+
+    await asyncio.gather(*(worker() for _ in range(min(workers, len(partition_nos)))))
+
+
+async def bill_run(period: str, *, workers: int, partitions: int, batch_size: int) -> BillRun:
+    if workers > max_workers():
+        logger.warning("bill run workers capped by connection pool", requested=workers, workers=max_workers())
+        workers = max_workers()
+
+    # 账期锁为会话级锁，持锁连接以 autocommit 执行：整个出账期间不处于事务中，
+    # 不会被 idle_in_transaction_session_timeout 断开；进程退出或连接断开时锁自动释放
+    async with postgres_db.session() as lock_session:
+        await lock_session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        lock_repo = BillRunRepository(lock_session)
+        if not await lock_repo.try_lock_period(period):
+            raise BillingDomainError(f"bill run for {period} is already in progress")
+        try:
+            return await _bill_run_locked(period, workers=workers, partitions=partitions, batch_size=batch_size)
+        finally:
+            await lock_repo.unlock_period(period)
+
+
+async def _bill_run_locked(period: str, *, workers: int, partitions: int, batch_size: int) -> BillRun:
+    async with postgres_db.session() as session:
+        run = await PrepareBillRunUseCase(session).execute(PrepareBillRunCommand(period=period, partitions=partitions))
+        # 重跑时先重算上次留下的 FAILED 账单，已完成分区的客户不会再被分区出账读取
+        await RetryFailedInvoicesUseCase(session).execute(
+            RetryFailedInvoicesCommand(bill_run_id=run.id, batch_size=batch_size)
+        )
+        async with session.begin():
+            pending = await BillRunRepository(session).list_partition_nos(run.id, BillRunPartitionStatus.PENDING)
+    logger.info("bill run started", period=period, bill_run_id=run.id, partitions=len(pending), workers=workers)
+
+    await run_partitions(run.id, pending, workers=workers, batch_size=batch_size)
+
+    async with postgres_db.session() as session:
+        return await CompleteBillRunUseCase(session).execute(run.id)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--period", required=True, help="billing period, YYYY-MM")
+    parser.add_argument("--workers", type=int, default=settings.billing.BILL_RUN_WORKERS)
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=settings.billing.BILL_RUN_PARTITIONS,
+        help="customer partitions for a new run; a resumed run keeps its original partitions",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.billing.BILL_RUN_BATCH_SIZE)
+    args = parser.parse_args()
+
+    setup_logging()
+    await postgres_db.connect()
+    try:
+        run = await bill_run(args.period, workers=args.workers, partitions=args.partitions, batch_size=args.batch_size)
+    except BillingDomainError as exc:
+        logger.error("bill run rejected", period=args.period, error=str(exc))
+        sys.exit(2)
+    finally:
+        await postgres_db.dispose()
+    if run.status != BillRunStatus.COMPLETED.value:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
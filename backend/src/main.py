@@ -14,6 +14,7 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
+from src.intrastructure.cache.postal_region_index import postal_region_index
 from src.intrastructure.cache.redis import close_redis, init_redis
 from src.intrastructure.database.mysql_external import external_mysql_db
 from src.intrastructure.database.postgres import postgres_db
@@ -38,9 +39,12 @@ async def lifespan(app: FastAPI):
         await postgres_db.connect()
         await external_mysql_db.connect()
         await init_redis()
+        # 构建邮编 → 区域索引并启动定时刷新
+        await postal_region_index.start()
         yield
     finally:
         # 关闭时清理资源
+        await postal_region_index.stop()
         await external_mysql_db.dispose()
         await postgres_db.dispose()
         await close_redis()
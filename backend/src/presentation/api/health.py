@@ -2,6 +2,11 @@
 
 from fastapi import APIRouter
 
+from src.intrastructure.cache.effective_quote import get_effective_quote_cache_stats
+from src.intrastructure.cache.price_book import price_book_cache
+from src.intrastructure.cache.tariff_snapshot import tariff_snapshot_cache
+from src.intrastructure.cache.verified_token import verified_token_cache
+
 router = APIRouter()
 
 
@@ -9,3 +14,14 @@ router = APIRouter()
 async def health_check():
     """健康检查"""
     return {"status": "healthy", "message": "Warehouse Billing API 运行正常"}
+
+
+@router.get("/health/cache")
+async def cache_stats():
+    """当前进程的缓存命中统计"""
+    return {
+        "effectiveQuote": get_effective_quote_cache_stats().to_dict(),
+        "priceBook": price_book_cache.stats().to_dict(),
+        "tariffSnapshot": tariff_snapshot_cache.stats().to_dict(),
+        "verifiedToken": verified_token_cache.stats().to_dict() if verified_token_cache is not None else None,
+    }
@@ -13,6 +13,7 @@ v1_router.include_router(customers.group_router, tags=["CustomerGroups"])
 v1_router.include_router(customers.external_router, tags=["ExternalCompanies"])
 v1_router.include_router(billing_templates.router, tags=["BillingTemplates"])
 v1_router.include_router(billing_templates.quote_router, tags=["BillingQuotes"])
+v1_router.include_router(billing_templates.usage_router, tags=["BillingUsageEvents"])
 v1_router.include_router(carriers.router, tags=["Carriers"])
 v1_router.include_router(regions.router, tags=["Regions"])
 
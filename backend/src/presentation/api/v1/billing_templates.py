@@ -1,33 +1,49 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.application.billing.commands import (
     CreateBillingTemplateCommand,
+    ExportBillingQuotesCommand,
+    IngestUsageEventsCommand,
+    PreviewQuoteChargesCommand,
     QueryBillingQuotesCommand,
     QueryBillingTemplatesCommand,
+    ResolveCustomerQuotesBatchCommand,
     TemplateRuleInput,
     TemplateRuleTierInput,
     UpdateBillingTemplateCommand,
+    UsageEventInput,
+    UsageInput,
 )
 from src.application.billing.use_cases import (
     CreateBillingTemplateUseCase,
     DeleteBillingTemplateUseCase,
+    ExportBillingQuotesUseCase,
     GetBillingQuoteDetailUseCase,
     GetBillingTemplateDetailUseCase,
+    IngestUsageEventsUseCase,
+    PreviewQuoteChargesUseCase,
     QueryBillingQuotesUseCase,
     QueryBillingTemplatesUseCase,
+    ResolveCustomerQuotesBatchUseCase,
     UpdateBillingTemplateUseCase,
 )
-from src.domain.billing.entities import QuoteStatus, TemplateType
+from src.domain.billing.entities import BillingDomainError, QuoteStatus, TemplateType
+from src.intrastructure.repositories import InvalidCursorError, TotalMode
 from src.presentation.dependencies.auth import get_current_user
 from src.presentation.dependencies.billing import (
     get_billing_quote_detail_use_case,
     get_billing_template_detail_use_case,
     get_create_billing_template_use_case,
     get_delete_billing_template_use_case,
+    get_export_billing_quotes_use_case,
+    get_ingest_usage_events_use_case,
+    get_preview_quote_charges_use_case,
     get_query_billing_quotes_use_case,
     get_query_billing_templates_use_case,
+    get_resolve_customer_quotes_batch_use_case,
     get_update_billing_template_use_case,
 )
 from src.presentation.schema.billing import (
@@ -38,13 +54,23 @@ from src.presentation.schema.billing import (
     BillingTemplateListItemSchema,
     BillingTemplateListResponse,
     BillingTemplateUpdateSchema,
+    QuoteBatchResolveItemSchema,
+    QuoteBatchResolveRequest,
+    QuoteBatchResolveResponse,
+    QuotePreviewRequest,
+    QuotePreviewResponse,
+    UsageEventBatchRequest,
+    UsageEventBatchResponse,
+    UsageEventRejectedSchema,
 )
+from src.presentation.schema.export import ExportFormat, export_response
 from src.shared.error.app_error import AppError
 from src.shared.schemas.auth import CurrentUser
-from src.shared.schemas.response import SuccessResponse
+from src.shared.schemas.response import JSONBytesResponse, SuccessResponse, success_json
 
 router = APIRouter(prefix="/billing/templates", tags=["BillingTemplates"])
 quote_router = APIRouter(prefix="/billing/quotes", tags=["BillingQuotes"])
+usage_router = APIRouter(prefix="/billing/usage-events", tags=["BillingUsageEvents"])
 
 
 # ============================================================================
@@ -60,9 +86,11 @@ async def list_templates(
     customer_group_id: int | None = Query(None, alias="customerGroupId"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="totalMode"),
     # current_user: CurrentUser = Depends(get_current_user),
     use_case: QueryBillingTemplatesUseCase = Depends(get_query_billing_templates_use_case),
-) -> SuccessResponse[BillingTemplateListResponse]:
+) -> JSONBytesResponse:
     """列表计费模板."""
     cmd = QueryBillingTemplatesCommand(
         template_type=template_type,
@@ -71,14 +99,20 @@ async def list_templates(
         customer_group_id=customer_group_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
     )
-    result = await use_case.execute(cmd)
-
-    return SuccessResponse(
-        data=BillingTemplateListResponse(
-            items=[BillingTemplateListItemSchema.from_model(item) for item in result.items],
-            total=result.total,
-        )
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+
+    return success_json(
+        {
+            "items": BillingTemplateListItemSchema.dump_rows(result.items),
+            "total": result.total,
+            "nextCursor": result.next_cursor,
+        }
     )
 
 
@@ -225,9 +259,11 @@ async def list_quotes(
     status_filter: QuoteStatus | None = Query(None, alias="status"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="totalMode"),
     current_user: CurrentUser = Depends(get_current_user),
     use_case: QueryBillingQuotesUseCase = Depends(get_query_billing_quotes_use_case),
-) -> SuccessResponse[BillingQuoteListResponse]:
+) -> JSONBytesResponse:
     """列表报价单."""
     cmd = QueryBillingQuotesCommand(
         template_id=template_id,
@@ -236,13 +272,61 @@ async def list_quotes(
         status=status_filter,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
+    )
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+
+    return success_json(
+        {
+            "items": BillingQuoteSchema.dump_rows(result.items),
+            "total": result.total,
+            "nextCursor": result.next_cursor,
+        }
+    )
+
+
+@quote_router.get("/export", response_class=StreamingResponse)
+async def export_quotes(
+    template_id: int | None = Query(None, alias="templateId"),
+    customer_id: int | None = Query(None, alias="customerId"),
+    customer_group_id: int | None = Query(None, alias="customerGroupId"),
+    status_filter: QuoteStatus | None = Query(None, alias="status"),
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: ExportBillingQuotesUseCase = Depends(get_export_billing_quotes_use_case),
+) -> StreamingResponse:
+    """按列表过滤条件流式导出全部报价单（CSV / NDJSON）."""
+    cmd = ExportBillingQuotesCommand(
+        template_id=template_id,
+        customer_id=customer_id,
+        customer_group_id=customer_group_id,
+        status=status_filter,
     )
+    chunks = await use_case.execute(cmd)
+    return export_response(chunks, BillingQuoteSchema, export_format, filename="billing-quotes")
+
+
+@quote_router.post("/resolve:batch", response_model=SuccessResponse[QuoteBatchResolveResponse])
+async def resolve_quotes_batch(
+    payload: QuoteBatchResolveRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: ResolveCustomerQuotesBatchUseCase = Depends(get_resolve_customer_quotes_batch_use_case),
+) -> SuccessResponse[QuoteBatchResolveResponse]:
+    """批量解析客户生效报价单."""
+    cmd = ResolveCustomerQuotesBatchCommand(customer_ids=payload.customer_ids, as_of=payload.as_of)
     result = await use_case.execute(cmd)
 
     return SuccessResponse(
-        data=BillingQuoteListResponse(
-            items=[BillingQuoteSchema.from_model(item) for item in result.items],
-            total=result.total,
+        data=QuoteBatchResolveResponse(
+            items=[
+                QuoteBatchResolveItemSchema(customerId=customer_id, quoteId=quote_id)
+                for customer_id, quote_id in result.quote_ids.items()
+            ],
+            missingCustomerIds=result.missing_customer_ids,
         )
     )
 
@@ -259,3 +343,69 @@ async def get_quote_detail(
         raise AppError(message=f"Quote {quote_id} not found")
 
     return SuccessResponse(data=BillingQuoteSchema.from_model(quote))
+
+
+@quote_router.post("/{quote_id}/preview", response_model=SuccessResponse[QuotePreviewResponse])
+async def preview_quote_charges(
+    quote_id: int,
+    payload: QuotePreviewRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: PreviewQuoteChargesUseCase = Depends(get_preview_quote_charges_use_case),
+) -> SuccessResponse[QuotePreviewResponse]:
+    """按报价单试算用量费用."""
+    cmd = PreviewQuoteChargesCommand(
+        quote_id=quote_id,
+        usages=[
+            UsageInput(charge_code=item.charge_code, unit=item.unit, quantity=item.quantity) for item in payload.usages
+        ],
+    )
+    try:
+        result = await use_case.execute(cmd)
+    except BillingDomainError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    if result is None:
+        raise AppError(message=f"Quote {quote_id} not found")
+
+    return SuccessResponse(data=QuotePreviewResponse.from_result(quote_id, result))
+
+
+# ============================================================================
+# Usage Event Endpoints
+# ============================================================================
+
+
+@usage_router.post(":batch", response_model=SuccessResponse[UsageEventBatchResponse])
+async def ingest_usage_events(
+    payload: UsageEventBatchRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: IngestUsageEventsUseCase = Depends(get_ingest_usage_events_use_case),
+) -> SuccessResponse[UsageEventBatchResponse]:
+    """批量上报用量事件（SCAN 渠道），按幂等键去重."""
+    cmd = IngestUsageEventsCommand(
+        events=[
+            UsageEventInput(
+                idempotency_key=item.idempotency_key,
+                customer_id=item.customer_id,
+                charge_code=item.charge_code,
+                unit=item.unit,
+                quantity=item.quantity,
+                occurred_at=item.occurred_at,
+                reference=item.reference,
+            )
+            for item in payload.events
+        ],
+        source=payload.source,
+    )
+    result = await use_case.execute(cmd)
+
+    return SuccessResponse(
+        data=UsageEventBatchResponse(
+            received=result.received,
+            inserted=result.inserted,
+            duplicates=result.duplicates,
+            rejected=[
+                UsageEventRejectedSchema(index=item.index, idempotencyKey=item.idempotency_key, reason=item.reason)
+                for item in result.rejected
+            ],
+        )
+    )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
 from src.application.carrier.commands import (
     AssignGeoGroupRegionsCommand,
@@ -8,8 +11,13 @@ from src.application.carrier.commands import (
     CreateCarrierCommand,
     CreateCarrierServiceCommand,
     CreateGeoGroupCommand,
+    ExportCarrierTariffsCommand,
+    ImportCarrierServiceRateCardCommand,
+    ParcelInput,
     QueryCarriersCommand,
     QueryCarrierServicesCommand,
+    QuoteCarrierServiceCommand,
+    QuoteParcelsBatchCommand,
     SetCarrierServiceTariffsCommand,
     UpdateCarrierCommand,
     UpdateCarrierServiceCommand,
@@ -22,6 +30,7 @@ from src.application.carrier.exceptions import (
     CarrierServiceGeoGroupConflictError,
     CarrierServiceGeoGroupNotFoundError,
     CarrierServiceNotFoundError,
+    CarrierServiceTariffNotFoundError,
     RegionNotFoundError,
 )
 from src.application.carrier.use_cases import (
@@ -29,20 +38,26 @@ from src.application.carrier.use_cases import (
     CreateCarrierServiceUseCase,
     CreateCarrierUseCase,
     CreateGeoGroupUseCase,
+    ExportCarrierTariffsUseCase,
     GetCarrierDetailUseCase,
     GetCarrierServiceDetailUseCase,
     GetCarrierServiceTariffsUseCase,
     GetGeoGroupDetailUseCase,
+    ImportCarrierServiceRateCardUseCase,
     ListCarrierServiceTariffsUseCase,
     ListGeoGroupsUseCase,
     QueryCarrierServicesUseCase,
     QueryCarriersUseCase,
+    QuoteCarrierServiceUseCase,
+    QuoteParcelsBatchUseCase,
     SetCarrierServiceTariffsUseCase,
     UpdateCarrierServiceUseCase,
     UpdateCarrierUseCase,
     UpdateGeoGroupUseCase,
 )
+from src.domain.carrier import RateCardError, TariffLookupError
 from src.intrastructure.database.models import CarrierServiceStatus, CarrierStatus
+from src.intrastructure.repositories import InvalidCursorError, TotalMode
 from src.presentation.dependencies.auth import get_current_user
 from src.presentation.dependencies.carrier import (
     get_assign_geo_group_regions_use_case,
@@ -52,11 +67,15 @@ from src.presentation.dependencies.carrier import (
     get_create_carrier_service_use_case,
     get_create_carrier_use_case,
     get_create_geo_group_use_case,
+    get_export_carrier_tariffs_use_case,
     get_geo_group_detail_use_case,
+    get_import_carrier_service_rate_card_use_case,
     get_list_carrier_service_tariffs_use_case,
     get_list_geo_groups_use_case,
     get_query_carrier_services_use_case,
     get_query_carriers_use_case,
+    get_quote_carrier_service_use_case,
+    get_quote_parcels_batch_use_case,
     get_set_carrier_service_tariffs_use_case,
     get_update_carrier_service_use_case,
     get_update_carrier_use_case,
@@ -68,7 +87,10 @@ from src.presentation.schema.carrier import (
     CarrierSchema,
     CarrierServiceCreateSchema,
     CarrierServiceListResponse,
+    CarrierServiceQuoteRequest,
+    CarrierServiceQuoteSchema,
     CarrierServiceSchema,
+    CarrierServiceTariffExportSchema,
     CarrierServiceTariffGroupListResponse,
     CarrierServiceTariffGroupSchema,
     CarrierServiceTariffRowSchema,
@@ -81,10 +103,14 @@ from src.presentation.schema.carrier import (
     GeoGroupRegionUpdateSchema,
     GeoGroupSchema,
     GeoGroupUpdateSchema,
+    ParcelBatchQuoteRequest,
+    ParcelBatchQuoteResponse,
+    ParcelQuoteResultSchema,
 )
+from src.presentation.schema.export import ExportFormat, export_response
 from src.shared.error.app_error import AppError
 from src.shared.schemas.auth import CurrentUser
-from src.shared.schemas.response import SuccessResponse
+from src.shared.schemas.response import JSONBytesResponse, SuccessResponse, success_json
 
 router = APIRouter(prefix="/carriers", tags=["Carriers"])
 
@@ -113,6 +139,30 @@ async def create_carrier(
     return SuccessResponse(data=CarrierSchema.from_model(carrier))
 
 
+@router.post("/quote:batch", response_model=SuccessResponse[ParcelBatchQuoteResponse])
+async def quote_parcels_batch(
+    payload: ParcelBatchQuoteRequest,
+    use_case: QuoteParcelsBatchUseCase = Depends(get_quote_parcels_batch_use_case),
+) -> SuccessResponse[ParcelBatchQuoteResponse]:
+    cmd = QuoteParcelsBatchCommand(
+        parcels=[
+            ParcelInput(
+                region_code=item.region_code,
+                weight_kg=item.weight_kg,
+                length_cm=item.length_cm,
+                width_cm=item.width_cm,
+                height_cm=item.height_cm,
+                reference=item.reference,
+            )
+            for item in payload.parcels
+        ],
+        as_of=payload.as_of,
+    )
+    results = await use_case.execute(cmd)
+    items = [ParcelQuoteResultSchema.from_result(result) for result in results]
+    return SuccessResponse(data=ParcelBatchQuoteResponse(items=items))
+
+
 @router.put("/{carrier_id}", response_model=SuccessResponse[CarrierSchema])
 async def update_carrier(
     carrier_id: int,
@@ -143,12 +193,24 @@ async def list_carriers(
     status_filter: CarrierStatus | None = Query(default=None, alias="status"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    total_mode: TotalMode = Query(default=TotalMode.EXACT, alias="totalMode"),
     use_case: QueryCarriersUseCase = Depends(get_query_carriers_use_case),
-) -> SuccessResponse[CarrierListResponse]:
-    cmd = QueryCarriersCommand(keyword=keyword, status=status_filter, limit=limit, offset=offset)
-    result = await use_case.execute(cmd)
-    items = [CarrierSchema.from_model(carrier) for carrier in result.items]
-    return SuccessResponse(data=CarrierListResponse(total=result.total, items=items))
+) -> JSONBytesResponse:
+    cmd = QueryCarriersCommand(
+        keyword=keyword,
+        status=status_filter,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
+    )
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    items = CarrierSchema.dump_rows(result.items)
+    return success_json({"total": result.total, "items": items, "nextCursor": result.next_cursor})
 
 
 @router.get("/{carrier_id}", response_model=SuccessResponse[CarrierSchema])
@@ -249,11 +311,70 @@ async def upsert_carrier_service_tariffs(
         raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
     except CarrierServiceGeoGroupNotFoundError as exc:
         raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
-    except RegionNotFoundError as exc:
+    except (RegionNotFoundError, RateCardError) as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    return SuccessResponse(data=CarrierServiceTariffSnapshotSchema.from_model(snapshot))
+
+
+@router.post(
+    "/{carrier_id}/services/{service_id}/tariffs:import",
+    response_model=SuccessResponse[CarrierServiceTariffSnapshotSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_carrier_service_rate_card(
+    carrier_id: int,
+    service_id: int,
+    file: UploadFile = File(...),
+    currency: str = Form(default="JPY"),
+    effective_from: datetime | None = Form(default=None, alias="effectiveFrom"),
+    effective_to: datetime | None = Form(default=None, alias="effectiveTo"),
+    current_user: CurrentUser = Depends(get_current_user),
+    use_case: ImportCarrierServiceRateCardUseCase = Depends(get_import_carrier_service_rate_card_use_case),
+) -> SuccessResponse[CarrierServiceTariffSnapshotSchema]:
+    """整张运价表导入（CSV / TSV，UTF-8 或 Excel 默认的 Shift_JIS），替换服务全部运费并生成一个快照版本."""
+    cmd = ImportCarrierServiceRateCardCommand(
+        carrier_id=carrier_id,
+        service_id=service_id,
+        content=_decode_rate_card(await file.read()),
+        currency=currency,
+        effective_from=effective_from,
+        effective_to=effective_to,
+    )
+    try:
+        snapshot = await use_case.execute(cmd, operator=current_user.user_id)
+    except (CarrierNotFoundError, CarrierServiceNotFoundError, CarrierServiceGeoGroupNotFoundError) as exc:
+        raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
+    except RateCardError as exc:
         raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
     return SuccessResponse(data=CarrierServiceTariffSnapshotSchema.from_model(snapshot))
 
 
+def _decode_rate_card(data: bytes) -> str:
+    for encoding in ("utf-8-sig", "cp932"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise AppError(message="rate card must be UTF-8 or Shift_JIS encoded", code=status.HTTP_400_BAD_REQUEST)
+
+
+@router.get("/{carrier_id}/tariffs/export", response_class=StreamingResponse)
+async def export_carrier_tariffs(
+    carrier_id: int,
+    service_id: int | None = Query(default=None, alias="serviceId"),
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    use_case: ExportCarrierTariffsUseCase = Depends(get_export_carrier_tariffs_use_case),
+) -> StreamingResponse:
+    cmd = ExportCarrierTariffsCommand(carrier_id=carrier_id, service_id=service_id)
+    try:
+        chunks = await use_case.execute(cmd)
+    except (CarrierNotFoundError, CarrierServiceNotFoundError) as exc:
+        raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
+    return export_response(
+        chunks, CarrierServiceTariffExportSchema, export_format, filename=f"carrier-{carrier_id}-tariffs"
+    )
+
+
 @router.get(
     "/{carrier_id}/services/{service_id}/tariffs",
     response_model=SuccessResponse[CarrierServiceTariffGroupListResponse],
@@ -262,29 +383,50 @@ async def list_carrier_service_tariffs(
     carrier_id: int,
     service_id: int,
     use_case: ListCarrierServiceTariffsUseCase = Depends(get_list_carrier_service_tariffs_use_case),
-) -> SuccessResponse[CarrierServiceTariffGroupListResponse]:
+) -> JSONBytesResponse:
     try:
         result = await use_case.execute(carrier_id=carrier_id, service_id=service_id)
     except CarrierServiceNotFoundError as exc:
         raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
 
     items = [
-        CarrierServiceTariffGroupSchema(
-            geoGroupId=item.geo_group_id,
-            currency=item.currency,
-            rows=[
-                CarrierServiceTariffRowSchema(
-                    weightMaxKg=row.weight_max_kg,
-                    volumeMaxCm3=row.volume_max_cm3,
-                    girthMaxCm=row.girth_max_cm,
-                    priceAmount=row.price_amount,
-                )
-                for row in item.rows
-            ],
-        )
+        {
+            "geoGroupId": item.geo_group_id,
+            "currency": item.currency,
+            "rows": CarrierServiceTariffRowSchema.dump_rows(item.rows),
+        }
         for item in result.items
     ]
-    return SuccessResponse(data=CarrierServiceTariffGroupListResponse(items=items))
+    return success_json({"items": items})
+
+
+@router.post(
+    "/{carrier_id}/services/{service_id}/quote",
+    response_model=SuccessResponse[CarrierServiceQuoteSchema],
+)
+async def quote_carrier_service(
+    carrier_id: int,
+    service_id: int,
+    payload: CarrierServiceQuoteRequest,
+    use_case: QuoteCarrierServiceUseCase = Depends(get_quote_carrier_service_use_case),
+) -> SuccessResponse[CarrierServiceQuoteSchema]:
+    cmd = QuoteCarrierServiceCommand(
+        carrier_id=carrier_id,
+        service_id=service_id,
+        region_code=payload.region_code,
+        girth_cm=payload.girth_cm,
+        weight_kg=payload.weight_kg,
+        volume_cm3=payload.volume_cm3,
+        as_of=payload.as_of,
+    )
+    try:
+        result = await use_case.execute(cmd)
+    except CarrierServiceTariffNotFoundError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
+    except TariffLookupError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    data = CarrierServiceQuoteSchema.from_match(result.match, snapshot_id=result.snapshot_id, version=result.version)
+    return SuccessResponse(data=data)
 
 
 @router.get(
@@ -296,28 +438,19 @@ async def get_carrier_service_tariffs(
     service_id: int,
     group_id: int,
     use_case: GetCarrierServiceTariffsUseCase = Depends(get_carrier_service_tariffs_use_case),
-) -> SuccessResponse[CarrierServiceTariffGroupSchema]:
+) -> JSONBytesResponse:
     try:
         result = await use_case.execute(carrier_id=carrier_id, service_id=service_id, geo_group_id=group_id)
     except CarrierServiceNotFoundError as exc:
         raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
     except CarrierServiceGeoGroupNotFoundError as exc:
         raise AppError(message=str(exc), code=status.HTTP_404_NOT_FOUND) from exc
-    rows = [
-        CarrierServiceTariffRowSchema(
-            weightMaxKg=row.weight_max_kg,
-            volumeMaxCm3=row.volume_max_cm3,
-            girthMaxCm=row.girth_max_cm,
-            priceAmount=row.price_amount,
-        )
-        for row in result.rows
-    ]
-    return SuccessResponse(
-        data=CarrierServiceTariffGroupSchema(
-            geoGroupId=result.geo_group_id,
-            currency=result.currency,
-            rows=rows,
-        )
+    return success_json(
+        {
+            "geoGroupId": result.geo_group_id,
+            "currency": result.currency,
+            "rows": CarrierServiceTariffRowSchema.dump_rows(result.rows),
+        }
     )
 
 
@@ -330,17 +463,24 @@ async def list_carrier_services(
     status_filter: CarrierServiceStatus | None = Query(default=None, alias="status"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    total_mode: TotalMode = Query(default=TotalMode.EXACT, alias="totalMode"),
     use_case: QueryCarrierServicesUseCase = Depends(get_query_carrier_services_use_case),
-) -> SuccessResponse[CarrierServiceListResponse]:
+) -> JSONBytesResponse:
     cmd = QueryCarrierServicesCommand(
         carrier_id=carrier_id,
         status=status_filter,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
     )
-    result = await use_case.execute(cmd)
-    items = [CarrierServiceSchema.from_model(item) for item in result.items]
-    return SuccessResponse(data=CarrierServiceListResponse(total=result.total, items=items))
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    items = CarrierServiceSchema.dump_rows(result.items)
+    return success_json({"total": result.total, "items": items, "nextCursor": result.next_cursor})
 
 
 @router.get(
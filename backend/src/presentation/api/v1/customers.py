@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.application.billing.commands import ResolveCustomerQuoteCommand
 from src.application.billing.use_cases import ResolveCustomerQuoteUseCase
 from src.application.customer.commands import (
     CreateCompanyCommand,
     CreateCustomerCommand,
+    ExportCustomersCommand,
     QueryCustomersCommand,
     UpdateCustomerStatusCommand,
 )
@@ -18,6 +22,7 @@ from src.application.customer.group_commands import (
 )
 from src.application.customer.use_cases import (
     CreateCustomerUseCase,
+    ExportCustomersUseCase,
     GetCustomerDetailUseCase,
     GetCustomerGroupDetailUseCase,
     ManageCustomerGroupUseCase,
@@ -27,12 +32,14 @@ from src.application.customer.use_cases import (
     UpdateCustomerStatusUseCase,
 )
 from src.domain.customer import CustomerStatus
+from src.intrastructure.repositories import InvalidCursorError, TotalMode
 from src.presentation.dependencies.auth import get_current_user
 from src.presentation.dependencies.billing import get_resolve_customer_quote_use_case
 from src.presentation.dependencies.customer import (
     get_create_customer_use_case,
     get_customer_detail_use_case,
     get_customer_group_detail_use_case,
+    get_export_customers_use_case,
     get_manage_customer_group_use_case,
     get_query_customer_groups_use_case,
     get_query_customers_use_case,
@@ -54,9 +61,10 @@ from src.presentation.schema.customer import (
     ExternalCompanyListResponse,
     ExternalCompanyResponse,
 )
+from src.presentation.schema.export import ExportFormat, export_response
 from src.shared.error.app_error import AppError
 from src.shared.schemas.auth import CurrentUser
-from src.shared.schemas.response import SuccessResponse
+from src.shared.schemas.response import JSONBytesResponse, SuccessResponse, success_json
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 group_router = APIRouter(prefix="/customer-groups", tags=["CustomerGroups"])
@@ -105,8 +113,10 @@ async def list_customers(
     source: str | None = Query(default=None),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    total_mode: TotalMode = Query(default=TotalMode.EXACT, alias="totalMode"),
     use_case: QueryCustomersUseCase = Depends(get_query_customers_use_case),
-) -> SuccessResponse[CustomerListResponse]:
+) -> JSONBytesResponse:
     cmd = QueryCustomersCommand(
         keyword=keyword,
         business_domain="WAREHOUSE",
@@ -114,10 +124,33 @@ async def list_customers(
         source=source,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
     )
-    result = await use_case.execute(cmd)
-    items = [CustomerResponse.from_model(c) for c in result.customers]
-    return SuccessResponse(data=CustomerListResponse(total=result.total, items=items))
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    items = CustomerResponse.dump_rows(result.customers)
+    return success_json({"total": result.total, "items": items, "nextCursor": result.next_cursor})
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_customers(
+    keyword: str | None = Query(default=None),
+    status_filter: CustomerStatus | None = Query(default=None, alias="status"),
+    source: str | None = Query(default=None),
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    use_case: ExportCustomersUseCase = Depends(get_export_customers_use_case),
+) -> StreamingResponse:
+    cmd = ExportCustomersCommand(
+        keyword=keyword,
+        business_domain="WAREHOUSE",
+        status=status_filter,
+        source=source,
+    )
+    chunks = await use_case.execute(cmd)
+    return export_response(chunks, CustomerResponse, export_format, filename="customers")
 
 
 @router.get("/{customer_id}", response_model=SuccessResponse[CustomerDetailResponse])
@@ -134,11 +167,12 @@ async def get_customer_detail(
 @router.get("/{customer_id}/quote", response_model=SuccessResponse[BillingQuoteSchema])
 async def get_customer_effective_quote(
     customer_id: int,
+    as_of: datetime | None = Query(default=None, alias="asOf"),
     current_user: CurrentUser = Depends(get_current_user),
     use_case: ResolveCustomerQuoteUseCase = Depends(get_resolve_customer_quote_use_case),
 ) -> SuccessResponse[BillingQuoteSchema]:
-    """根据客户→客户组→全局优先级获取生效报价."""
-    cmd = ResolveCustomerQuoteCommand(customer_id=customer_id)
+    """根据客户→客户组→全局优先级获取生效报价，``asOf`` 为历史时刻时返回当时实际执行的报价."""
+    cmd = ResolveCustomerQuoteCommand(customer_id=customer_id, as_of=as_of)
     quote = await use_case.execute(cmd)
     if quote is None:
         raise AppError(
@@ -2,16 +2,42 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query, status
 
-from src.application.region.commands import QueryRegionsCommand
-from src.application.region.use_cases import GetRegionDetailUseCase, QueryRegionsUseCase
+from src.application.region.commands import (
+    QueryRegionDescendantsCommand,
+    QueryRegionsCommand,
+    ResolvePostalCodesCommand,
+)
+from src.application.region.use_cases import (
+    GetRegionAncestorsUseCase,
+    GetRegionCoverageUseCase,
+    GetRegionDetailUseCase,
+    ListRegionDescendantsUseCase,
+    QueryRegionsUseCase,
+    ResolvePostalCodesUseCase,
+)
 from src.intrastructure.database.models.region import RegionLevel
+from src.intrastructure.repositories import InvalidCursorError, TotalMode
 from src.presentation.dependencies.region import (
     get_query_regions_use_case,
+    get_region_ancestors_use_case,
+    get_region_coverage_use_case,
+    get_region_descendants_use_case,
     get_region_detail_use_case,
+    get_resolve_postal_codes_use_case,
+)
+from src.presentation.schema.region import (
+    GeoGroupRefSchema,
+    PostalCodeResolveItemSchema,
+    PostalCodeResolveRequest,
+    PostalCodeResolveResponse,
+    RegionCoverageResponse,
+    RegionListResponse,
+    RegionNodeListResponse,
+    RegionNodeSchema,
+    RegionSchema,
 )
-from src.presentation.schema.region import RegionListResponse, RegionSchema
 from src.shared.error.app_error import AppError
-from src.shared.schemas.response import SuccessResponse
+from src.shared.schemas.response import JSONBytesResponse, SuccessResponse, success_json
 
 router = APIRouter(prefix="/regions", tags=["Regions"])
 
@@ -24,8 +50,10 @@ async def list_regions(
     keyword: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    total_mode: TotalMode = Query(default=TotalMode.EXACT, alias="totalMode"),
     use_case: QueryRegionsUseCase = Depends(get_query_regions_use_case),
-) -> SuccessResponse[RegionListResponse]:
+) -> JSONBytesResponse:
     cmd = QueryRegionsCommand(
         country_code=country_code,
         level=level,
@@ -33,10 +61,26 @@ async def list_regions(
         keyword=keyword,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total_mode,
     )
-    result = await use_case.execute(cmd)
-    items = [RegionSchema.from_model(region) for region in result.items]
-    return SuccessResponse(data=RegionListResponse(total=result.total, items=items))
+    try:
+        result = await use_case.execute(cmd)
+    except InvalidCursorError as exc:
+        raise AppError(message=str(exc), code=status.HTTP_400_BAD_REQUEST) from exc
+    items = RegionSchema.dump_rows(result.items)
+    return success_json({"total": result.total, "items": items, "nextCursor": result.next_cursor})
+
+
+@router.post("/postal-codes:resolve", response_model=SuccessResponse[PostalCodeResolveResponse])
+async def resolve_postal_codes(
+    payload: PostalCodeResolveRequest,
+    use_case: ResolvePostalCodesUseCase = Depends(get_resolve_postal_codes_use_case),
+) -> SuccessResponse[PostalCodeResolveResponse]:
+    cmd = ResolvePostalCodesCommand(postal_codes=payload.postal_codes, carrier_service_id=payload.carrier_service_id)
+    results = await use_case.execute(cmd)
+    items = [PostalCodeResolveItemSchema.from_resolution(result.postal_code, result.resolution) for result in results]
+    return SuccessResponse(data=PostalCodeResolveResponse(items=items))
 
 
 @router.get("/{region_code}", response_model=SuccessResponse[RegionSchema])
@@ -48,3 +92,50 @@ async def get_region_detail(
     if region is None:
         raise AppError(message="Region not found", code=status.HTTP_404_NOT_FOUND)
     return SuccessResponse(data=RegionSchema.from_model(region))
+
+
+@router.get("/{region_code}/ancestors", response_model=SuccessResponse[RegionNodeListResponse])
+async def get_region_ancestors(
+    region_code: str,
+    use_case: GetRegionAncestorsUseCase = Depends(get_region_ancestors_use_case),
+) -> SuccessResponse[RegionNodeListResponse]:
+    nodes = await use_case.execute(region_code)
+    if nodes is None:
+        raise AppError(message="Region not found", code=status.HTTP_404_NOT_FOUND)
+    items = [RegionNodeSchema.from_node(node) for node in nodes]
+    return SuccessResponse(data=RegionNodeListResponse(total=len(items), items=items))
+
+
+@router.get("/{region_code}/descendants", response_model=SuccessResponse[RegionNodeListResponse])
+async def list_region_descendants(
+    region_code: str,
+    level: RegionLevel | None = Query(default=None),
+    include_self: bool = Query(default=False, alias="includeSelf"),
+    limit: int = Query(default=1000, ge=1, le=10_000),
+    offset: int = Query(default=0, ge=0),
+    use_case: ListRegionDescendantsUseCase = Depends(get_region_descendants_use_case),
+) -> JSONBytesResponse:
+    cmd = QueryRegionDescendantsCommand(
+        region_code=region_code,
+        level=level,
+        include_self=include_self,
+        limit=limit,
+        offset=offset,
+    )
+    result = await use_case.execute(cmd)
+    if result is None:
+        raise AppError(message="Region not found", code=status.HTTP_404_NOT_FOUND)
+    return success_json({"total": result.total, "items": RegionNodeSchema.dump_rows(result.items)})
+
+
+@router.get("/{region_code}/geo-groups", response_model=SuccessResponse[RegionCoverageResponse])
+async def get_region_coverage(
+    region_code: str,
+    carrier_service_id: int | None = Query(default=None, alias="carrierServiceId"),
+    use_case: GetRegionCoverageUseCase = Depends(get_region_coverage_use_case),
+) -> SuccessResponse[RegionCoverageResponse]:
+    refs = await use_case.execute(region_code, carrier_service_id)
+    if refs is None:
+        raise AppError(message="Region not found", code=status.HTTP_404_NOT_FOUND)
+    items = [GeoGroupRefSchema.from_ref(ref) for ref in refs]
+    return SuccessResponse(data=RegionCoverageResponse(regionCode=region_code, geoGroups=items))
@@ -6,10 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.billing.use_cases import (
     CreateBillingTemplateUseCase,
     DeleteBillingTemplateUseCase,
+    ExportBillingQuotesUseCase,
     GetBillingQuoteDetailUseCase,
     GetBillingTemplateDetailUseCase,
+    IngestUsageEventsUseCase,
+    PreviewQuoteChargesUseCase,
     QueryBillingQuotesUseCase,
     QueryBillingTemplatesUseCase,
+    ResolveCustomerQuotesBatchUseCase,
     ResolveCustomerQuoteUseCase,
     UpdateBillingTemplateUseCase,
 )
@@ -46,6 +50,12 @@ def get_query_billing_quotes_use_case(
     return QueryBillingQuotesUseCase(session=session)
 
 
+def get_export_billing_quotes_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> ExportBillingQuotesUseCase:
+    return ExportBillingQuotesUseCase(session=session)
+
+
 def get_billing_quote_detail_use_case(
     session: AsyncSession = Depends(get_postgres_session),
 ) -> GetBillingQuoteDetailUseCase:
@@ -58,7 +68,25 @@ def get_resolve_customer_quote_use_case(
     return ResolveCustomerQuoteUseCase(session=session)
 
 
+def get_resolve_customer_quotes_batch_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> ResolveCustomerQuotesBatchUseCase:
+    return ResolveCustomerQuotesBatchUseCase(session=session)
+
+
 def get_delete_billing_template_use_case(
     session: AsyncSession = Depends(get_postgres_session),
 ) -> DeleteBillingTemplateUseCase:
     return DeleteBillingTemplateUseCase(session=session)
+
+
+def get_preview_quote_charges_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> PreviewQuoteChargesUseCase:
+    return PreviewQuoteChargesUseCase(session=session)
+
+
+def get_ingest_usage_events_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> IngestUsageEventsUseCase:
+    return IngestUsageEventsUseCase(session=session)
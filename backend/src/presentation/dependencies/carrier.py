@@ -8,14 +8,18 @@ from src.application.carrier.use_cases import (
     CreateCarrierServiceUseCase,
     CreateCarrierUseCase,
     CreateGeoGroupUseCase,
+    ExportCarrierTariffsUseCase,
     GetCarrierDetailUseCase,
     GetCarrierServiceDetailUseCase,
     GetCarrierServiceTariffsUseCase,
     GetGeoGroupDetailUseCase,
+    ImportCarrierServiceRateCardUseCase,
     ListCarrierServiceTariffsUseCase,
     ListGeoGroupsUseCase,
     QueryCarrierServicesUseCase,
     QueryCarriersUseCase,
+    QuoteCarrierServiceUseCase,
+    QuoteParcelsBatchUseCase,
     SetCarrierServiceTariffsUseCase,
     UpdateCarrierServiceUseCase,
     UpdateCarrierUseCase,
@@ -40,6 +44,18 @@ def get_carrier_detail_use_case(session: AsyncSession = Depends(get_postgres_ses
     return GetCarrierDetailUseCase(session=session)
 
 
+def get_export_carrier_tariffs_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> ExportCarrierTariffsUseCase:
+    return ExportCarrierTariffsUseCase(session=session)
+
+
+def get_import_carrier_service_rate_card_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> ImportCarrierServiceRateCardUseCase:
+    return ImportCarrierServiceRateCardUseCase(session=session)
+
+
 def get_create_carrier_service_use_case(
     session: AsyncSession = Depends(get_postgres_session),
 ) -> CreateCarrierServiceUseCase:
@@ -102,3 +118,15 @@ def get_list_carrier_service_tariffs_use_case(
     session: AsyncSession = Depends(get_postgres_session),
 ) -> ListCarrierServiceTariffsUseCase:
     return ListCarrierServiceTariffsUseCase(session=session)
+
+
+def get_quote_carrier_service_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> QuoteCarrierServiceUseCase:
+    return QuoteCarrierServiceUseCase(session=session)
+
+
+def get_quote_parcels_batch_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> QuoteParcelsBatchUseCase:
+    return QuoteParcelsBatchUseCase(session=session)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.customer.use_cases import (
     CreateCustomerUseCase,
+    ExportCustomersUseCase,
     GetCustomerDetailUseCase,
     GetCustomerGroupDetailUseCase,
     ManageCustomerGroupUseCase,
@@ -29,6 +30,12 @@ def get_query_customers_use_case(
     return QueryCustomersUseCase(session=session)
 
 
+def get_export_customers_use_case(
+    session: AsyncSession = Depends(get_postgres_session),
+) -> ExportCustomersUseCase:
+    return ExportCustomersUseCase(session=session)
+
+
 def get_customer_detail_use_case(
     session: AsyncSession = Depends(get_postgres_session),
 ) -> GetCustomerDetailUseCase:
@@ -3,7 +3,14 @@ from __future__ import annotations
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.region.use_cases import GetRegionDetailUseCase, QueryRegionsUseCase
+from src.application.region.use_cases import (
+    GetRegionAncestorsUseCase,
+    GetRegionCoverageUseCase,
+    GetRegionDetailUseCase,
+    ListRegionDescendantsUseCase,
+    QueryRegionsUseCase,
+    ResolvePostalCodesUseCase,
+)
 from src.intrastructure.database.postgres import get_postgres_session
 
 
@@ -13,3 +20,19 @@ def get_query_regions_use_case(session: AsyncSession = Depends(get_postgres_sess
 
 def get_region_detail_use_case(session: AsyncSession = Depends(get_postgres_session)) -> GetRegionDetailUseCase:
     return GetRegionDetailUseCase(session=session)
+
+
+def get_resolve_postal_codes_use_case() -> ResolvePostalCodesUseCase:
+    return ResolvePostalCodesUseCase()
+
+
+def get_region_ancestors_use_case() -> GetRegionAncestorsUseCase:
+    return GetRegionAncestorsUseCase()
+
+
+def get_region_descendants_use_case() -> ListRegionDescendantsUseCase:
+    return ListRegionDescendantsUseCase()
+
+
+def get_region_coverage_use_case() -> GetRegionCoverageUseCase:
+    return GetRegionCoverageUseCase()
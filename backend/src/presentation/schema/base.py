@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from functools import cache
+from operator import attrgetter, itemgetter
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -10,3 +15,36 @@ def to_camel(string: str) -> str:
 
 class CamelModel(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    @classmethod
+    def dump_rows(cls, rows: Iterable[Any]) -> list[dict[str, Any]]:
+        """按字段名直接读取 ORM 行 / 领域对象属性，输出以别名为键的 dict，不构造模型、不做校验.
+
+        仅适用于字段与属性一一对应、无需转换的扁平 schema（列表项、价目行），
+        需要转换或嵌套的字段仍走 ``from_model``。
+        已加载的 ORM 行直接从实例 ``__dict__`` 取值，绕过属性描述符。
+        """
+        aliases, by_key, by_attr = _row_layout(cls)
+        result: list[dict[str, Any]] = []
+        for row in rows:
+            try:
+                values = by_key(row.__dict__)
+            except (AttributeError, KeyError):
+                # slots 对象或未加载 / 已过期的 ORM 属性，回退到属性访问
+                values = by_attr(row)
+            result.append(dict(zip(aliases, values, strict=True)))
+        return result
+
+
+type _RowGetter = Callable[[Any], tuple[Any, ...]]
+
+
+@cache
+def _row_layout(model: type[BaseModel]) -> tuple[tuple[str, ...], _RowGetter, _RowGetter]:
+    fields = model.model_fields
+    names = tuple(fields)
+    aliases = tuple(field.alias or name for name, field in fields.items())
+    if len(names) == 1:
+        key, attr = itemgetter(names[0]), attrgetter(names[0])
+        return aliases, lambda row: (key(row),), lambda row: (attr(row),)
+    return aliases, itemgetter(*names), attrgetter(*names)
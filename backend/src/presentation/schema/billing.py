@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 
-from pydantic import Field, model_validator
+from pydantic import AwareDatetime, Field, model_validator
 
 from src.domain.billing.entities import PricingMode, RuleCategory, RuleChannel, RuleUnit, TemplateType
+from src.domain.billing.rating import RatedLine, RatingResult
 from src.intrastructure.database.models import BillingQuote, BillingTemplate, BillingTemplateRule
 from src.intrastructure.database.models.billing import BillingQuotePayload, TemplateRuleTierRecord
 from src.presentation.schema.base import CamelModel
@@ -178,7 +180,8 @@ class BillingTemplateListResponse(CamelModel):
     """计费模板列表响应."""
 
     items: list[BillingTemplateListItemSchema]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 # ============================================================================
@@ -226,4 +229,126 @@ class BillingQuoteListResponse(CamelModel):
     """报价单列表响应."""
 
     items: list[BillingQuoteSchema]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+
+
+class QuoteBatchResolveRequest(CamelModel):
+    """批量解析客户生效报价请求."""
+
+    customer_ids: list[int] = Field(..., alias="customerIds", min_length=1, max_length=50_000)
+    as_of: datetime | None = Field(None, alias="asOf")
+
+
+class QuoteBatchResolveItemSchema(CamelModel):
+    customer_id: int = Field(..., alias="customerId")
+    quote_id: int | None = Field(None, alias="quoteId")
+
+
+class QuoteBatchResolveResponse(CamelModel):
+    """批量解析结果；items 与 missingCustomerIds 均按请求中 customerIds 的顺序（重复 ID 只保留首次）.
+
+    quoteId 为空表示客户无生效报价，missingCustomerIds 为不存在或无权限的客户。
+    """
+
+    items: list[QuoteBatchResolveItemSchema]
+    missing_customer_ids: list[int] = Field(default_factory=list, alias="missingCustomerIds")
+
+
+# ============================================================================
+# Quote Preview Schemas
+# ============================================================================
+
+
+class QuoteUsageItemSchema(CamelModel):
+    """试算用量."""
+
+    charge_code: str = Field(..., alias="chargeCode")
+    unit: RuleUnit
+    quantity: float = Field(..., ge=0)
+
+
+class QuotePreviewRequest(CamelModel):
+    """报价单试算请求."""
+
+    usages: list[QuoteUsageItemSchema] = Field(..., min_length=1)
+
+
+class QuotePreviewLineSchema(CamelModel):
+    """试算明细行."""
+
+    charge_code: str = Field(..., alias="chargeCode")
+    charge_name: str = Field(..., alias="chargeName")
+    category: RuleCategory
+    unit: RuleUnit
+    record_count: int = Field(..., alias="recordCount")
+    quantity: float
+    amount: int
+
+    @classmethod
+    def from_line(cls, line: RatedLine) -> QuotePreviewLineSchema:
+        return cls(
+            chargeCode=line.charge_code,
+            chargeName=line.charge_name,
+            category=line.category,
+            unit=line.unit,
+            recordCount=line.record_count,
+            quantity=line.quantity,
+            amount=line.amount,
+        )
+
+
+class QuotePreviewResponse(CamelModel):
+    """报价单试算结果."""
+
+    quote_id: int = Field(..., alias="quoteId")
+    lines: list[QuotePreviewLineSchema]
+    total_amount: int = Field(..., alias="totalAmount")
+
+    @classmethod
+    def from_result(cls, quote_id: int, result: RatingResult) -> QuotePreviewResponse:
+        return cls(
+            quoteId=quote_id,
+            lines=[QuotePreviewLineSchema.from_line(line) for line in result.lines],
+            totalAmount=result.total_amount,
+        )
+
+
+# ============================================================================
+# Usage Event Schemas
+# ============================================================================
+
+
+class UsageEventItemSchema(CamelModel):
+    """用量事件；idempotencyKey 由上报方生成、在业务域内唯一，重复上报同一事件时保持不变."""
+
+    idempotency_key: str = Field(..., alias="idempotencyKey", min_length=1, max_length=128)
+    customer_id: int = Field(..., alias="customerId")
+    charge_code: str = Field(..., alias="chargeCode", min_length=1, max_length=64)
+    unit: RuleUnit
+    # 与 usage_events.quantity NUMERIC(20, 4) 一致：超出精度的数量拒收而不是静默舍入
+    quantity: Decimal = Field(..., ge=0, max_digits=20, decimal_places=4)
+    occurred_at: AwareDatetime = Field(..., alias="occurredAt")
+    reference: str | None = Field(None, max_length=128)
+
+
+class UsageEventBatchRequest(CamelModel):
+    """批量上报用量事件请求."""
+
+    events: list[UsageEventItemSchema] = Field(..., min_length=1, max_length=10_000)
+    source: str = Field("WMS", min_length=1, max_length=32)
+
+
+class UsageEventRejectedSchema(CamelModel):
+    index: int
+    idempotency_key: str = Field(..., alias="idempotencyKey")
+    reason: str
+
+
+class UsageEventBatchResponse(CamelModel):
+    """批量上报结果；duplicates 为幂等键重复而跳过的事件数，rejected 中的事件未写入，可修正后用原幂等键重报."""
+
+    received: int
+    inserted: int
+    duplicates: int
+    rejected: list[UsageEventRejectedSchema]
@@ -6,6 +6,8 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import inspect
 
+from src.application.carrier.use_cases import ParcelQuoteResult, ServicePrice, ServiceUnavailable
+from src.domain.carrier import TariffMatch, expand_tariff_payload
 from src.intrastructure.database.models import (
     Carrier,
     CarrierService,
@@ -13,6 +15,7 @@ from src.intrastructure.database.models import (
     CarrierServiceGeoGroupRegion,
     CarrierServiceGeoGroupStatus,
     CarrierServiceStatus,
+    CarrierServiceTariffSnapshot,
     CarrierStatus,
 )
 from src.presentation.schema.base import CamelModel
@@ -68,8 +71,9 @@ class CarrierSchema(CamelModel):
 
 
 class CarrierListResponse(CamelModel):
-    total: int
+    total: int | None = None
     items: list[CarrierSchema]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 class CarrierServiceCreateSchema(CamelModel):
@@ -108,8 +112,9 @@ class CarrierServiceSchema(CamelModel):
 
 
 class CarrierServiceListResponse(CamelModel):
-    total: int
+    total: int | None = None
     items: list[CarrierServiceSchema]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 class GeoGroupCreateSchema(CamelModel):
@@ -186,6 +191,19 @@ class CarrierServiceTariffRowSchema(CamelModel):
     price_amount: int = Field(alias="priceAmount")
 
 
+class CarrierServiceTariffExportSchema(CamelModel):
+    """运费导出行（一行一个价格档，附带承运商 / 服务 / 分组编码）."""
+
+    carrier_code: str = Field(alias="carrierCode")
+    service_code: str = Field(alias="serviceCode")
+    geo_group_code: str = Field(alias="geoGroupCode")
+    currency: str
+    weight_max_kg: float | None = Field(default=None, alias="weightMaxKg")
+    volume_max_cm3: int | None = Field(default=None, alias="volumeMaxCm3")
+    girth_max_cm: int | None = Field(default=None, alias="girthMaxCm")
+    price_amount: int = Field(alias="priceAmount")
+
+
 class CarrierServiceTariffUpsertSchema(CamelModel):
     geo_group_id: int = Field(alias="geoGroupId")
     effective_from: datetime | None = Field(default=None, alias="effectiveFrom")
@@ -203,6 +221,117 @@ class CarrierServiceTariffGroupListResponse(CamelModel):
     items: list[CarrierServiceTariffGroupSchema]
 
 
+class CarrierServiceQuoteRequest(CamelModel):
+    region_code: str = Field(alias="regionCode")
+    girth_cm: float | None = Field(default=None, ge=0, alias="girthCm")
+    weight_kg: float | None = Field(default=None, ge=0, alias="weightKg")
+    volume_cm3: float | None = Field(default=None, ge=0, alias="volumeCm3")
+    as_of: datetime | None = Field(default=None, alias="asOf")
+
+
+class CarrierServiceQuoteSchema(CamelModel):
+    snapshot_id: int = Field(alias="snapshotId")
+    version: int
+    region_code: str = Field(alias="regionCode")
+    currency: str
+    price_amount: int = Field(alias="priceAmount")
+    girth_max_cm: float | None = Field(default=None, alias="girthMaxCm")
+    weight_max_kg: float | None = Field(default=None, alias="weightMaxKg")
+    volume_max_cm3: float | None = Field(default=None, alias="volumeMaxCm3")
+
+    @classmethod
+    def from_match(cls, match: TariffMatch, *, snapshot_id: int, version: int) -> CarrierServiceQuoteSchema:
+        return cls(
+            snapshotId=snapshot_id,
+            version=version,
+            regionCode=match.region_code,
+            currency=match.currency,
+            priceAmount=match.price_amount,
+            girthMaxCm=match.girth_max_cm,
+            weightMaxKg=match.weight_max_kg,
+            volumeMaxCm3=match.volume_max_cm3,
+        )
+
+
+class ParcelQuoteItemSchema(CamelModel):
+    reference: str | None = None
+    region_code: str = Field(alias="regionCode")
+    weight_kg: float | None = Field(default=None, ge=0, alias="weightKg")
+    length_cm: float | None = Field(default=None, ge=0, alias="lengthCm")
+    width_cm: float | None = Field(default=None, ge=0, alias="widthCm")
+    height_cm: float | None = Field(default=None, ge=0, alias="heightCm")
+
+
+class ParcelBatchQuoteRequest(CamelModel):
+    parcels: list[ParcelQuoteItemSchema] = Field(min_length=1, max_length=10_000)
+    as_of: datetime | None = Field(default=None, alias="asOf")
+
+
+class ServicePriceSchema(CamelModel):
+    carrier_id: int = Field(alias="carrierId")
+    carrier_code: str = Field(alias="carrierCode")
+    service_id: int = Field(alias="serviceId")
+    service_code: str = Field(alias="serviceCode")
+    snapshot_version: int = Field(alias="snapshotVersion")
+    currency: str
+    price_amount: int = Field(alias="priceAmount")
+
+    @classmethod
+    def from_price(cls, price: ServicePrice) -> ServicePriceSchema:
+        return cls(
+            carrierId=price.carrier_id,
+            carrierCode=price.carrier_code,
+            serviceId=price.service_id,
+            serviceCode=price.service_code,
+            snapshotVersion=price.snapshot_version,
+            currency=price.currency,
+            priceAmount=price.price_amount,
+        )
+
+
+class ServiceUnavailableSchema(CamelModel):
+    carrier_id: int = Field(alias="carrierId")
+    carrier_code: str = Field(alias="carrierCode")
+    service_id: int = Field(alias="serviceId")
+    service_code: str = Field(alias="serviceCode")
+    reason: str
+
+    @classmethod
+    def from_unavailable(cls, item: ServiceUnavailable) -> ServiceUnavailableSchema:
+        return cls(
+            carrierId=item.carrier_id,
+            carrierCode=item.carrier_code,
+            serviceId=item.service_id,
+            serviceCode=item.service_code,
+            reason=item.reason,
+        )
+
+
+class ParcelQuoteResultSchema(CamelModel):
+    """包裹试算结果；cheapest 仅在各服务币种一致时给出，unavailable 为无法报价的服务及原因."""
+
+    reference: str | None = None
+    region_code: str = Field(alias="regionCode")
+    cheapest: ServicePriceSchema | None = None
+    prices: list[ServicePriceSchema]
+    unavailable: list[ServiceUnavailableSchema] = Field(default_factory=list)
+
+    @classmethod
+    def from_result(cls, result: ParcelQuoteResult) -> ParcelQuoteResultSchema:
+        cheapest = result.cheapest
+        return cls(
+            reference=result.parcel.reference,
+            regionCode=result.parcel.region_code,
+            cheapest=ServicePriceSchema.from_price(cheapest) if cheapest is not None else None,
+            prices=[ServicePriceSchema.from_price(price) for price in result.prices],
+            unavailable=[ServiceUnavailableSchema.from_unavailable(item) for item in result.unavailable],
+        )
+
+
+class ParcelBatchQuoteResponse(CamelModel):
+    items: list[ParcelQuoteResultSchema]
+
+
 class CarrierServiceTariffSnapshotSchema(CamelModel):
     id: int
     carrier_id: int = Field(alias="carrierId")
@@ -214,7 +343,7 @@ class CarrierServiceTariffSnapshotSchema(CamelModel):
     payload: CarrierServiceTariffSnapshotPayloadSchema
 
     @classmethod
-    def from_model(cls, model: Any) -> CarrierServiceTariffSnapshotSchema:
+    def from_model(cls, model: CarrierServiceTariffSnapshot) -> CarrierServiceTariffSnapshotSchema:
         return cls(
             id=model.id,
             carrierId=model.carrier_id,
@@ -223,7 +352,7 @@ class CarrierServiceTariffSnapshotSchema(CamelModel):
             serviceCode=model.service_code,
             effectiveFrom=model.effective_from,
             effectiveTo=model.effective_to,
-            payload=CarrierServiceTariffSnapshotPayloadSchema.model_validate(model.payload),
+            payload=CarrierServiceTariffSnapshotPayloadSchema.model_validate(expand_tariff_payload(model.payload)),
         )
 
 
@@ -86,8 +86,9 @@ class CustomerResponse(CamelModel):
 
 
 class CustomerListResponse(CamelModel):
-    total: int
+    total: int | None = None
     items: list[CustomerResponse]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 class CompanySummary(CamelModel):
@@ -4,6 +4,7 @@ from typing import Any
 
 from pydantic import Field
 
+from src.domain.region import GeoGroupRef, PostalResolution, RegionNode
 from src.intrastructure.database.models import Region
 from src.presentation.schema.base import CamelModel
 
@@ -31,5 +32,68 @@ class RegionSchema(CamelModel):
 
 
 class RegionListResponse(CamelModel):
-    total: int
+    total: int | None = None
     items: list[RegionSchema]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+
+
+class PostalCodeResolveRequest(CamelModel):
+    postal_codes: list[str] = Field(min_length=1, max_length=10_000, alias="postalCodes")
+    carrier_service_id: int | None = Field(default=None, alias="carrierServiceId")
+
+
+class RegionNodeSchema(CamelModel):
+    region_code: str = Field(alias="regionCode")
+    name: str
+    level: str
+    parent_code: str | None = Field(default=None, alias="parentCode")
+
+    @classmethod
+    def from_node(cls, node: RegionNode) -> RegionNodeSchema:
+        return cls(regionCode=node.region_code, name=node.name, level=node.level, parentCode=node.parent_code)
+
+
+class GeoGroupRefSchema(CamelModel):
+    carrier_service_id: int = Field(alias="carrierServiceId")
+    group_id: int = Field(alias="groupId")
+    group_code: str = Field(alias="groupCode")
+    region_code: str = Field(alias="regionCode")
+
+    @classmethod
+    def from_ref(cls, ref: GeoGroupRef) -> GeoGroupRefSchema:
+        return cls(
+            carrierServiceId=ref.carrier_service_id,
+            groupId=ref.group_id,
+            groupCode=ref.group_code,
+            regionCode=ref.region_code,
+        )
+
+
+class PostalCodeResolveItemSchema(CamelModel):
+    postal_code: str = Field(alias="postalCode")
+    region: RegionNodeSchema | None = None
+    geo_groups: list[GeoGroupRefSchema] = Field(default_factory=list, alias="geoGroups")
+
+    @classmethod
+    def from_resolution(cls, postal_code: str, resolution: PostalResolution | None) -> PostalCodeResolveItemSchema:
+        if resolution is None:
+            return cls(postalCode=postal_code)
+        return cls(
+            postalCode=postal_code,
+            region=RegionNodeSchema.from_node(resolution.region),
+            geoGroups=[GeoGroupRefSchema.from_ref(ref) for ref in resolution.geo_groups.values()],
+        )
+
+
+class PostalCodeResolveResponse(CamelModel):
+    items: list[PostalCodeResolveItemSchema]
+
+
+class RegionNodeListResponse(CamelModel):
+    total: int
+    items: list[RegionNodeSchema]
+
+
+class RegionCoverageResponse(CamelModel):
+    region_code: str = Field(alias="regionCode")
+    geo_groups: list[GeoGroupRefSchema] = Field(default_factory=list, alias="geoGroups")
@@ -2,9 +2,11 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from src.shared.config.auth_config import DingTalkAuthSettings, JwtSettings
+from src.shared.config.billing_config import BillingSettings
 from src.shared.config.cors_config import CorsSettings
 from src.shared.config.database_config import ExternalMySQLSettings, PostgresSettings, RedisSettings
 from src.shared.config.log_config import LogSettings
+from src.shared.config.region_config import RegionSettings
 
 
 class Settings(BaseSettings):
@@ -24,6 +26,10 @@ class Settings(BaseSettings):
     redis: RedisSettings = Field(default_factory=RedisSettings)
     dingtalk: DingTalkAuthSettings = Field(default_factory=lambda: DingTalkAuthSettings())
     jwt: JwtSettings = Field(default_factory=lambda: JwtSettings())
+    # 计费配置
+    billing: BillingSettings = Field(default_factory=BillingSettings)
+    # 区域配置
+    region: RegionSettings = Field(default_factory=RegionSettings)
 
     class Config:
         env_file = ".env"
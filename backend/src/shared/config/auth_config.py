@@ -46,6 +46,8 @@ class JwtSettings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 120
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # 进程内已验签 token 缓存容量，0 表示关闭
+    VERIFIED_CACHE_SIZE: int = 4096
 
     model_config = SettingsConfigDict(
         env_prefix="JWT_",
@@ -0,0 +1,26 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class BillingSettings(BaseSettings):
+    """计费相关配置"""
+
+    # 进程内价目表 LRU 容量（按报价单计）
+    PRICE_BOOK_CACHE_SIZE: int = 512
+    # 进程内已解码运费快照 LRU 容量（按快照计）
+    TARIFF_SNAPSHOT_CACHE_SIZE: int = 256
+    # 客户生效报价 Redis 缓存
+    QUOTE_CACHE_PREFIX: str = "billing:effective_quote"
+    QUOTE_CACHE_TTL_SECONDS: int = 300
+    # 客户生效报价物化表（customer_effective_quotes）；开启前需执行 scripts/rebuild_customer_effective_quotes.py
+    MATERIALIZE_EFFECTIVE_QUOTES: bool = False
+    # 月度出账（python -m src.jobs.bill_run）：并发分区数受 Postgres 连接池上限约束
+    BILL_RUN_WORKERS: int = 4
+    BILL_RUN_PARTITIONS: int = 16
+    BILL_RUN_BATCH_SIZE: int = 500
+
+    model_config = SettingsConfigDict(
+        env_prefix="BILLING_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+    )
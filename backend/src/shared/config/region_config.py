@@ -0,0 +1,15 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RegionSettings(BaseSettings):
+    """区域相关配置"""
+
+    # 邮编 → 区域进程内索引刷新间隔（秒），<= 0 表示只在启动时构建
+    POSTAL_INDEX_REFRESH_SECONDS: int = 600
+
+    model_config = SettingsConfigDict(
+        env_prefix="REGION_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+    )
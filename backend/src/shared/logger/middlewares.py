@@ -1,21 +1,29 @@
 import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
 from src.shared.context import clear_request_context, get_trace_id, set_trace_id
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware:
     """
-    全局请求上下文中间件：
+    全局请求上下文中间件（纯 ASGI，不额外创建任务、不复制响应体）：
     - 自动生成 trace_id
     - 绑定 path / method
+    - 响应头写入 X-Trace-Id
     - 可扩展 tenant_id / user_id
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         clear_contextvars()
         clear_request_context()
         trace_id = str(uuid.uuid4())
@@ -23,11 +31,14 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
 
         bind_contextvars(
             trace_id=trace_id,
-            path=request.url.path,
-            method=request.method,
+            path=scope["path"],
+            method=scope["method"],
         )
 
-        response = await call_next(request)
-        current_trace_id = get_trace_id() or trace_id
-        response.headers["X-Trace-Id"] = current_trace_id
-        return response
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Trace-Id"] = get_trace_id() or trace_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_trace_id)
@@ -1,19 +1,40 @@
-from collections.abc import Awaitable, Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.shared.error.app_error import AppError, handle_app_error
 from src.shared.error.handle import handle_error
 
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
-    """统一异常处理中间件"""
+class ExceptionHandlerMiddleware:
+    """统一异常处理中间件（纯 ASGI）.
+
+    响应头尚未发出时将异常转换为统一错误响应；已开始发送（如流式响应中途出错）则继续抛出。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         try:
-            return await call_next(request)
-        except AppError as exc:
-            return handle_app_error(request, exc)
+            await self.app(scope, receive, send_tracking)
         except Exception as exc:
-            return handle_error(request, exc)
+            if response_started:
+                raise
+            request = Request(scope, receive)
+            if isinstance(exc, AppError):
+                response = handle_app_error(request, exc)
+            else:
+                response = handle_error(request, exc)
+            await response(scope, receive, send)
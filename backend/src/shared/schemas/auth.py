@@ -90,6 +90,7 @@ class TokenClaims(BaseModel):
     trace_id: str
     user: CurrentUser
     type: str = "access"
+    exp: int | None = None
 
 
 class DingTalkLoginRequest(BaseModel):
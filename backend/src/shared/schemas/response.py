@@ -1,8 +1,10 @@
 """统一响应模型"""
 
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+from starlette.responses import Response
 
 from src.shared.constants.error_code import ErrorCode
 from src.shared.constants.error_message import ErrorMessage
@@ -29,3 +31,21 @@ class ErrorResponse(BaseResponse):
     data: dict | None = Field(default=None, description="错误详情")
     code: str = Field(default=ErrorCode.SYSTEM_ERROR, description="错误码")
     message: str = Field(default=ErrorMessage.get_message(ErrorCode.SYSTEM_ERROR), description="错误消息")
+
+
+class JSONBytesResponse(Response):
+    """由 pydantic-core 直接编码为 JSON 字节的响应.
+
+    路由直接返回该响应时 FastAPI 不再按 response_model 重新校验、序列化；
+    datetime / Enum / Decimal 的编码与模型序列化一致（``Z`` 时区、枚举取值、Decimal 为字符串）。
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def success_json(data: Any = None, message: str = "", status_code: int = 200) -> JSONBytesResponse:
+    """与 ``SuccessResponse`` 结构一致的快速响应，data 为已按别名展开的 dict / list."""
+    return JSONBytesResponse({"success": True, "data": data, "message": message}, status_code=status_code)
@@ -1,6 +1,6 @@
 """Shared utility helpers."""
 
-from .datetime import now_utc
+from .datetime import ensure_utc, now_utc
 from .random import generate_urlsafe_code
 
-__all__ = ["now_utc", "generate_urlsafe_code"]
+__all__ = ["ensure_utc", "now_utc", "generate_urlsafe_code"]
@@ -6,3 +6,10 @@ from datetime import UTC, datetime
 def now_utc() -> datetime:
     """Return current UTC time."""
     return datetime.now(tz=UTC)
+
+
+def ensure_utc(value: datetime) -> datetime:
+    """Normalize to an aware UTC datetime; naive values are taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
@@ -0,0 +1,371 @@
+"""月度出账：分区、检查点续跑、账单幂等写入与失败账单重算（依赖数据库）."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+
+from src.application.billing import (
+    PrepareBillRunCommand,
+    PrepareBillRunUseCase,
+    RunBillPartitionCommand,
+    RunBillPartitionUseCase,
+)
+from src.domain.billing.entities import (
+    SCOPE_PRIORITY,
+    BillingDomainError,
+    PricingMode,
+    QuoteScope,
+    QuoteStatus,
+    RuleCategory,
+    RuleChannel,
+    RuleUnit,
+    TemplateRule,
+    TemplateType,
+)
+from src.domain.billing.invoice import BillRunPartitionStatus, BillRunStatus, InvoiceDraft, InvoiceStatus
+from src.domain.billing.rating import RatingResult
+from src.domain.billing.storage import BillingPeriod
+from src.intrastructure.database.models import (
+    BillingQuote,
+    BillingTemplate,
+    BillRun,
+    BillRunPartition,
+    BusinessDomain,
+    Company,
+    Customer,
+    CustomerStatus,
+    InventoryDailySnapshot,
+    Invoice,
+    InvoiceLine,
+    UsageEvent,
+)
+from src.intrastructure.database.postgres import PostgresDatabase
+from src.intrastructure.repositories import BillRunRepository, InvoiceRepository
+from src.jobs.bill_run import bill_run
+
+DOMAIN = "TEST_BILL_RUN"
+COMPANY_ID = "test-bill-run"
+QUOTE_CODE = "test-bill-run-global"
+PERIOD = BillingPeriod.parse("2001-03")
+CUSTOMERS = 12
+
+
+@dataclass(slots=True)
+class Seeded:
+    customer_ids: list[int]
+    bill_run_id: int
+
+
+class RatingSpy:
+    """包装 ``_InvoiceRating``：记录被计价的客户，可在第 ``fail_on_call`` 批时模拟进程被杀."""
+
+    def __init__(self, inner: Any, fail_on_call: int | None = None) -> None:
+        self._inner = inner
+        self._fail_on_call = fail_on_call
+        self.calls = 0
+        self.rated: list[int] = []
+
+    async def rate(self, customers: list[tuple[int, str]], period: BillingPeriod, **kwargs: Any) -> list[InvoiceDraft]:
+        self.calls += 1
+        if self.calls == self._fail_on_call:
+            raise RuntimeError("worker killed")
+        self.rated.extend(customer_id for customer_id, _ in customers)
+        return await self._inner.rate(customers, period, **kwargs)
+
+
+def quote_payload() -> dict[str, Any]:
+    storage = TemplateRule(
+        charge_code="STO_CBM",
+        charge_name="仓储费",
+        category=RuleCategory.STORAGE,
+        channel=RuleChannel.AUTO,
+        unit=RuleUnit.CBM_DAY,
+        pricing_mode=PricingMode.FLAT,
+        price=120,
+    )
+    scan = TemplateRule(
+        charge_code="SCAN_LABEL",
+        charge_name="贴标",
+        category=RuleCategory.INBOUND_OUTBOUND,
+        channel=RuleChannel.SCAN,
+        unit=RuleUnit.PIECE,
+        pricing_mode=PricingMode.FLAT,
+        price=50,
+    )
+    return {"template": {}, "rules": [storage.to_dict(), scan.to_dict()]}
+
+
+@pytest.fixture
+async def seeded(db: PostgresDatabase) -> AsyncIterator[Seeded]:
+    """独立业务域的客户、GLOBAL 报价与库存快照；出账批次按本组客户切成两个分区预先创建."""
+    async with db.session() as session, session.begin():
+        session.add(BusinessDomain(code=DOMAIN, name=DOMAIN))
+        session.add(
+            Company(
+                company_id=COMPANY_ID,
+                company_name=COMPANY_ID,
+                company_code=COMPANY_ID,
+                company_corporation="-",
+                company_phone="-",
+                company_email="-",
+                company_address="-",
+                source="TEST",
+            )
+        )
+        await session.flush()
+        customer_ids = list(
+            (
+                await session.execute(
+                    insert(Customer).returning(Customer.id),
+                    [
+                        {
+                            "customer_name": f"test-bill-run-{idx}",
+                            "customer_code": f"test-bill-run-{idx}",
+                            "address": "-",
+                            "contact_email": "-",
+                            "contact_person": "-",
+                            "operation_name": "-",
+                            "operation_uid": "-",
+                            "status": CustomerStatus.ACTIVE,
+                            "company_id": COMPANY_ID,
+                            "business_domain": DOMAIN,
+                            "source": "TEST",
+                        }
+                        for idx in range(CUSTOMERS)
+                    ],
+                )
+            ).scalars()
+        )
+        customer_ids.sort()
+        template = BillingTemplate(
+            template_code=QUOTE_CODE,
+            template_name=QUOTE_CODE,
+            template_type=TemplateType.GLOBAL.value,
+            business_domain=DOMAIN,
+            effective_date=datetime(2001, 1, 1, tzinfo=UTC),
+        )
+        session.add(template)
+        await session.flush()
+        session.add(
+            BillingQuote(
+                quote_code=QUOTE_CODE,
+                template_id=template.id,
+                scope_type=QuoteScope.GLOBAL.value,
+                scope_priority=SCOPE_PRIORITY[QuoteScope.GLOBAL],
+                business_domain=DOMAIN,
+                status=QuoteStatus.ACTIVE.value,
+                effective_date=datetime(2001, 1, 1, tzinfo=UTC),
+                payload=quote_payload(),
+            )
+        )
+        await session.execute(
+            insert(InventoryDailySnapshot),
+            [
+                {
+                    "customer_id": customer_id,
+                    "business_domain": DOMAIN,
+                    "snapshot_date": PERIOD.start + timedelta(days=day),
+                    "volume_cbm": idx + 1,
+                    "weight_kg": 0,
+                    "source": "TEST",
+                }
+                for idx, customer_id in enumerate(customer_ids)
+                for day in range(3)
+            ],
+        )
+        middle = CUSTOMERS // 2
+        run = await BillRunRepository(session).create(
+            period=PERIOD.label,
+            bounds=[(customer_ids[0], customer_ids[middle - 1]), (customer_ids[middle], customer_ids[-1])],
+        )
+    try:
+        yield Seeded(customer_ids=customer_ids, bill_run_id=run.id)
+    finally:
+        async with db.session() as session, session.begin():
+            invoice_ids = select(Invoice.id).where(Invoice.period == PERIOD.label)
+            run_ids = select(BillRun.id).where(BillRun.period == PERIOD.label)
+            await session.execute(delete(InvoiceLine).where(InvoiceLine.invoice_id.in_(invoice_ids)))
+            await session.execute(delete(Invoice).where(Invoice.period == PERIOD.label))
+            await session.execute(delete(BillRunPartition).where(BillRunPartition.bill_run_id.in_(run_ids)))
+            await session.execute(delete(BillRun).where(BillRun.period == PERIOD.label))
+            await session.execute(
+                delete(InventoryDailySnapshot).where(InventoryDailySnapshot.business_domain == DOMAIN)
+            )
+            await session.execute(delete(UsageEvent).where(UsageEvent.business_domain == DOMAIN))
+            await session.execute(delete(BillingQuote).where(BillingQuote.business_domain == DOMAIN))
+            await session.execute(delete(BillingTemplate).where(BillingTemplate.business_domain == DOMAIN))
+            await session.execute(delete(Customer).where(Customer.business_domain == DOMAIN))
+            await session.execute(delete(Company).where(Company.company_id == COMPANY_ID))
+            await session.execute(delete(BusinessDomain).where(BusinessDomain.code == DOMAIN))
+
+
+async def invoice_statuses(db: PostgresDatabase) -> dict[int, str]:
+    async with db.session() as session:
+        rows = await session.execute(
+            select(Invoice.customer_id, Invoice.status).where(Invoice.period == PERIOD.label).order_by(Invoice.id)
+        )
+        return dict(rows.tuples().all())
+
+
+async def invoice_count(db: PostgresDatabase) -> int:
+    async with db.session() as session:
+        stmt = select(func.count()).select_from(Invoice).where(Invoice.period == PERIOD.label)
+        return int((await session.execute(stmt)).scalar_one())
+
+
+async def get_partition(db: PostgresDatabase, bill_run_id: int, partition_no: int) -> BillRunPartition:
+    async with db.session() as session:
+        partition = await session.get(BillRunPartition, (bill_run_id, partition_no))
+        assert partition is not None
+        return partition
+
+
+async def set_quote_effective_date(db: PostgresDatabase, effective_date: datetime) -> None:
+    async with db.session() as session, session.begin():
+        await session.execute(
+            update(BillingQuote).where(BillingQuote.quote_code == QUOTE_CODE).values(effective_date=effective_date)
+        )
+
+
+async def test_killed_partition_resumes_without_re_rating(db: PostgresDatabase, seeded: Seeded) -> None:
+    first_half = seeded.customer_ids[: CUSTOMERS // 2]
+    cmd = RunBillPartitionCommand(bill_run_id=seeded.bill_run_id, partition_no=0, batch_size=2)
+
+    async with db.session() as session:
+        use_case = RunBillPartitionUseCase(session)
+        use_case._rating = RatingSpy(use_case._rating, fail_on_call=2)  # type: ignore[assignment]
+        with pytest.raises(RuntimeError, match="worker killed"):
+            await use_case.execute(cmd)
+
+    partition = await get_partition(db, seeded.bill_run_id, 0)
+    assert partition.status == BillRunPartitionStatus.FAILED.value
+    assert partition.cursor_customer_id == first_half[1]
+    assert list(await invoice_statuses(db)) == first_half[:2]
+
+    async with db.session() as session:
+        await PrepareBillRunUseCase(session).execute(PrepareBillRunCommand(period=PERIOD.label))
+    async with db.session() as session:
+        use_case = RunBillPartitionUseCase(session)
+        spy = RatingSpy(use_case._rating)
+        use_case._rating = spy  # type: ignore[assignment]
+        resumed = await use_case.execute(cmd)
+
+    assert spy.rated == first_half[2:]
+    assert resumed is not None
+    assert resumed.status == BillRunPartitionStatus.COMPLETED.value
+    assert resumed.attempts == 2
+    assert resumed.customer_count == len(first_half)
+    statuses = await invoice_statuses(db)
+    assert sorted(statuses) == first_half
+    assert set(statuses.values()) == {InvoiceStatus.ISSUED.value}
+
+
+async def test_second_run_of_period_creates_no_duplicate_invoices(db: PostgresDatabase, seeded: Seeded) -> None:
+    run = await bill_run(PERIOD.label, workers=2, partitions=2, batch_size=5)
+
+    assert run.status == BillRunStatus.COMPLETED.value
+    assert run.customer_count == run.invoice_count == CUSTOMERS
+    for partition_no in (0, 1):
+        assert (await get_partition(db, seeded.bill_run_id, partition_no)).customer_count == CUSTOMERS // 2
+
+    with pytest.raises(BillingDomainError, match="already completed"):
+        await bill_run(PERIOD.label, workers=2, partitions=2, batch_size=5)
+    assert await invoice_count(db) == CUSTOMERS
+
+    # 直接重放同一批写入：已出账的客户跳过，不覆盖原账单
+    drafts = [
+        InvoiceDraft(customer_id=customer_id, business_domain=DOMAIN, quote_id=None, result=RatingResult())
+        for customer_id in seeded.customer_ids
+    ]
+    async with db.session() as session, session.begin():
+        written = await InvoiceRepository(session).add_drafts(
+            bill_run_id=seeded.bill_run_id, period=PERIOD, drafts=drafts
+        )
+    assert written == []
+    assert await invoice_count(db) == CUSTOMERS
+    async with db.session() as session:
+        total = await session.execute(select(func.sum(Invoice.total_amount)).where(Invoice.period == PERIOD.label))
+        assert total.scalar_one() == run.total_amount > 0
+
+
+async def test_failed_invoices_are_re_rated_on_re_run(db: PostgresDatabase, seeded: Seeded) -> None:
+    # 报价在账期之后才生效：全部客户解析不到报价
+    await set_quote_effective_date(db, datetime(2001, 6, 1, tzinfo=UTC))
+    run = await bill_run(PERIOD.label, workers=2, partitions=2, batch_size=5)
+
+    assert run.status == BillRunStatus.FAILED.value
+    assert run.failed_count == CUSTOMERS
+    assert set((await invoice_statuses(db)).values()) == {InvoiceStatus.FAILED.value}
+
+    await set_quote_effective_date(db, datetime(2001, 1, 1, tzinfo=UTC))
+    run = await bill_run(PERIOD.label, workers=2, partitions=2, batch_size=5)
+
+    assert run.status == BillRunStatus.COMPLETED.value
+    assert run.invoice_count == CUSTOMERS
+    assert run.failed_count == 0
+    assert set((await invoice_statuses(db)).values()) == {InvoiceStatus.ISSUED.value}
+    async with db.session() as session:
+        lines = select(func.count()).select_from(InvoiceLine).join(Invoice, Invoice.id == InvoiceLine.invoice_id)
+        assert (await session.execute(lines.where(Invoice.period == PERIOD.label))).scalar_one() == CUSTOMERS
+    # 重算未新增分区出账：两次执行的分区各只执行一次
+    assert (await get_partition(db, seeded.bill_run_id, 0)).attempts == 1
+
+
+async def test_usage_events_are_rated_with_storage(db: PostgresDatabase, seeded: Seeded) -> None:
+    first, second = seeded.customer_ids[:2]
+
+    def usage(key: str, customer_id: int, quantity: str, occurred_at: datetime) -> dict[str, Any]:
+        return {
+            "idempotency_key": key,
+            "customer_id": customer_id,
+            "business_domain": DOMAIN,
+            "charge_code": "SCAN_LABEL",
+            "unit": RuleUnit.PIECE.value,
+            "quantity": Decimal(quantity),
+            "occurred_at": occurred_at,
+            "source": "TEST",
+        }
+
+    in_period = PERIOD.opens_at + timedelta(days=3)
+    async with db.session() as session, session.begin():
+        await session.execute(
+            insert(UsageEvent),
+            [
+                usage("k1", first, "1.5", in_period),
+                usage("k2", first, "1.5", in_period),
+                usage("k3", first, "3", PERIOD.closes_at),
+                usage("k4", first, "9", PERIOD.ends_at),
+                usage("k5", second, "2", PERIOD.opens_at),
+            ],
+        )
+
+    run = await bill_run(PERIOD.label, workers=2, partitions=2, batch_size=5)
+
+    assert run.status == BillRunStatus.COMPLETED.value
+    async with db.session() as session:
+        rows = await session.execute(
+            select(
+                Invoice.customer_id,
+                InvoiceLine.charge_code,
+                InvoiceLine.record_count,
+                InvoiceLine.quantity,
+                InvoiceLine.amount,
+            )
+            .join(Invoice, Invoice.id == InvoiceLine.invoice_id)
+            .where(Invoice.period == PERIOD.label, Invoice.customer_id.in_([first, second]))
+            .order_by(Invoice.customer_id, InvoiceLine.line_no)
+        )
+        # 数量相同的事件聚合计价：1.5 × 50 × 2 + 3 × 50；下一账期的事件不计入
+        assert rows.tuples().all() == [
+            (first, "STO_CBM", 3, Decimal(3), 360),
+            (first, "SCAN_LABEL", 3, Decimal(6), 300),
+            (second, "STO_CBM", 3, Decimal(6), 720),
+            (second, "SCAN_LABEL", 1, Decimal(2), 100),
+        ]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.application.billing.effective_quotes import EffectiveQuoteResolver
+
+
+class QuoteRepoSpy:
+    """记录解析路径（历史 / 实时）与传入时刻."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, datetime]] = []
+
+    async def resolve_quote_at(self, *, customer_id: int, at: datetime) -> None:
+        self.calls.append(("history", at))
+
+    async def resolve_effective_quote(self, *, customer_id: int, now: datetime) -> None:
+        self.calls.append(("live", now))
+
+    async def resolve_quote_ids_at(self, *, at: datetime, **_: Any) -> dict[int, int | None]:
+        self.calls.append(("history", at))
+        return {}
+
+    async def resolve_effective_quote_ids(self, *, now: datetime, **_: Any) -> dict[int, int | None]:
+        self.calls.append(("live", now))
+        return {}
+
+
+def make_resolver() -> tuple[EffectiveQuoteResolver, QuoteRepoSpy]:
+    resolver = EffectiveQuoteResolver(session=None, materialized=False)  # type: ignore[arg-type]
+    spy = QuoteRepoSpy()
+    resolver._quote_repo = spy  # type: ignore[assignment]
+    return resolver, spy
+
+
+async def test_resolve_at_accepts_naive_past_as_of() -> None:
+    resolver, spy = make_resolver()
+
+    await resolver.resolve_at(customer_id=1, at=datetime(2026, 9, 30))
+
+    assert spy.calls == [("history", datetime(2026, 9, 30, tzinfo=UTC))]
+
+
+async def test_resolve_ids_at_accepts_naive_as_of() -> None:
+    resolver, spy = make_resolver()
+    future = datetime.now(UTC).replace(tzinfo=None) + timedelta(days=1)
+
+    await resolver.resolve_ids_at(customer_ids=[1], business_domains=["warehouse"], at=datetime(2026, 9, 30))
+    await resolver.resolve_ids_at(customer_ids=[1], business_domains=["warehouse"], at=future)
+
+    assert spy.calls == [
+        ("history", datetime(2026, 9, 30, tzinfo=UTC)),
+        ("live", future.replace(tzinfo=UTC)),
+    ]
+
+
+async def test_resolve_at_converts_offset_to_utc() -> None:
+    resolver, spy = make_resolver()
+    await resolver.resolve_at(customer_id=1, at=datetime.fromisoformat("2026-09-30T09:00:00+09:00"))
+
+    assert spy.calls == [("history", datetime(2026, 9, 30, tzinfo=UTC))]
+    assert spy.calls[0][1].tzinfo is UTC
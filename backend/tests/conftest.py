@@ -0,0 +1,24 @@
+"""测试公共夹具.
+
+依赖数据库的用例使用 ``db`` 夹具：连接 ``settings.postgres`` 指向的库（需已执行 ``alembic upgrade head``），
+不可达时跳过。用例各自在独立业务域内写入数据并在结束时清理。
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.intrastructure.database.postgres import PostgresDatabase, postgres_db
+
+
+@pytest.fixture(scope="session")
+async def db() -> AsyncIterator[PostgresDatabase]:
+    try:
+        await postgres_db.connect()
+    except (OSError, SQLAlchemyError) as exc:
+        pytest.skip(f"postgres unavailable: {exc}")
+    yield postgres_db
+    await postgres_db.dispose()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.carrier import Parcel, TariffLookup, TariffLookupError, encode_tariff_payload
+
+
+def row(weight_max_kg: float | None, price_amount: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        girth_max_cm=None, weight_max_kg=weight_max_kg, volume_max_cm3=None, price_amount=price_amount
+    )
+
+
+def lookup() -> TariffLookup:
+    payload = encode_tariff_payload(
+        "JPY",
+        [(["KANTO"], [row(5, 800), row(20, 1200)]), (["TOKYO"], [row(5, 700)])],
+        {},
+    )
+    return TariffLookup.from_payload(payload)
+
+
+def test_quote_falls_back_to_nearest_covered_ancestor() -> None:
+    tariff = lookup()
+    parcel = Parcel(weight_kg=3)
+
+    assert tariff.quote("SHINJUKU", parcel, ancestors=("TOKYO", "KANTO")).region_code == "TOKYO"
+    assert tariff.price("YOKOHAMA", parcel, ancestors=("KANAGAWA", "KANTO")) == 800
+
+
+def test_quote_reports_uncovered_region_and_exceeded_limits() -> None:
+    tariff = lookup()
+
+    with pytest.raises(TariffLookupError, match="region MARS is not covered"):
+        tariff.price("MARS", Parcel(weight_kg=3))
+    with pytest.raises(TariffLookupError, match="limits for region TOKYO"):
+        tariff.price("SHINJUKU", Parcel(weight_kg=10), ancestors=("TOKYO", "KANTO"))
+
+
+def test_encode_rejects_conflicting_duplicate_bands() -> None:
+    with pytest.raises(ValueError, match="conflicting prices 800 and 900"):
+        encode_tariff_payload("JPY", [(["KANTO"], [row(5, 800), row(5, 900)])], {})
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from src.intrastructure.cache.tariff_snapshot import TariffSnapshotCache
+
+UPDATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def snapshot(snapshot_id: int, version: int, effective_from: datetime) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=snapshot_id,
+        version=version,
+        carrier_id=1,
+        service_id=10,
+        carrier_code="YAMATO",
+        service_code="TA-Q-BIN",
+        effective_from=effective_from,
+        effective_to=None,
+        updated_at=UPDATED_AT,
+    )
+
+
+class CarrierRepoStub:
+    """两个版本：v1 自 2026-01-01 生效，v2 自 2026-10-01 生效（快照头按版本倒序）."""
+
+    def __init__(self) -> None:
+        self.headers = [
+            snapshot(2, 2, datetime(2026, 10, 1, tzinfo=UTC)),
+            snapshot(1, 1, datetime(2026, 1, 1, tzinfo=UTC)),
+        ]
+
+    async def list_tariff_snapshot_versions(self, **_: Any) -> list[tuple[str, str, int, int, int, datetime]]:
+        return [("YAMATO", "TA-Q-BIN", 2, 2, 2, UPDATED_AT)]
+
+    async def list_tariff_snapshot_headers(self, keys: Sequence[tuple[str, str]]) -> list[SimpleNamespace]:
+        return self.headers
+
+    async def get_tariff_snapshot_payloads(self, snapshot_ids: Sequence[int]) -> dict[int, dict[str, object]]:
+        return {snapshot_id: {"currency": "JPY"} for snapshot_id in snapshot_ids}
+
+
+async def test_get_effective_accepts_naive_at() -> None:
+    cache = TariffSnapshotCache()
+    repo: Any = CarrierRepoStub()
+
+    before = await cache.get_effective(repo, datetime(2026, 9, 30, 23, 59), carrier_id=1, service_id=10)
+    after = await cache.get_effective(repo, datetime(2026, 10, 1), carrier_id=1, service_id=10)
+
+    assert before is not None and before.header.version == 1
+    assert after is not None and after.header.version == 2
+
+
+async def test_list_effective_accepts_naive_at() -> None:
+    cache = TariffSnapshotCache()
+    repo: Any = CarrierRepoStub()
+
+    snapshots = await cache.list_effective(repo, datetime(2026, 9, 15))
+
+    assert [item.header.version for item in snapshots] == [1]
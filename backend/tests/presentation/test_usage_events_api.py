@@ -0,0 +1,206 @@
+"""POST /billing/usage-events:batch：同批重复、重放与拒收计数（依赖数据库）."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import delete, insert, select
+
+from src.domain.billing.entities import (
+    SCOPE_PRIORITY,
+    PricingMode,
+    QuoteScope,
+    QuoteStatus,
+    RuleCategory,
+    RuleChannel,
+    RuleUnit,
+    TemplateRule,
+    TemplateType,
+)
+from src.intrastructure.database.models import (
+    BillingQuote,
+    BillingTemplate,
+    BusinessDomain,
+    Company,
+    Customer,
+    CustomerStatus,
+    UsageEvent,
+)
+from src.intrastructure.database.postgres import PostgresDatabase
+from src.main import app
+from src.presentation.dependencies.auth import get_current_user
+from src.shared.context import set_current_user_context
+from src.shared.models.user import UserContext
+
+DOMAIN = "TEST_USAGE_API"
+COMPANY_ID = "test-usage-api"
+URL = "/api/v1/billing/usage-events:batch"
+
+
+def rule(charge_code: str, category: RuleCategory, channel: RuleChannel, unit: RuleUnit) -> dict[str, Any]:
+    return TemplateRule(
+        charge_code=charge_code,
+        charge_name=charge_code,
+        category=category,
+        channel=channel,
+        unit=unit,
+        pricing_mode=PricingMode.FLAT,
+        price=50,
+    ).to_dict()
+
+
+@pytest.fixture
+async def customer_id(db: PostgresDatabase) -> AsyncIterator[int]:
+    """独立业务域的一个客户，GLOBAL 报价含 SCAN 收费项 SCAN_LABEL（PIECE）与 AUTO 收费项 STO_CBM."""
+    async with db.session() as session, session.begin():
+        session.add(BusinessDomain(code=DOMAIN, name=DOMAIN))
+        session.add(
+            Company(
+                company_id=COMPANY_ID,
+                company_name=COMPANY_ID,
+                company_code=COMPANY_ID,
+                company_corporation="-",
+                company_phone="-",
+                company_email="-",
+                company_address="-",
+                source="TEST",
+            )
+        )
+        await session.flush()
+        created = await session.execute(
+            insert(Customer).returning(Customer.id),
+            [
+                {
+                    "customer_name": COMPANY_ID,
+                    "customer_code": COMPANY_ID,
+                    "address": "-",
+                    "contact_email": "-",
+                    "contact_person": "-",
+                    "operation_name": "-",
+                    "operation_uid": "-",
+                    "status": CustomerStatus.ACTIVE,
+                    "company_id": COMPANY_ID,
+                    "business_domain": DOMAIN,
+                    "source": "TEST",
+                }
+            ],
+        )
+        template = BillingTemplate(
+            template_code=COMPANY_ID,
+            template_name=COMPANY_ID,
+            template_type=TemplateType.GLOBAL.value,
+            business_domain=DOMAIN,
+            effective_date=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        session.add(template)
+        await session.flush()
+        session.add(
+            BillingQuote(
+                quote_code=COMPANY_ID,
+                template_id=template.id,
+                scope_type=QuoteScope.GLOBAL.value,
+                scope_priority=SCOPE_PRIORITY[QuoteScope.GLOBAL],
+                business_domain=DOMAIN,
+                status=QuoteStatus.ACTIVE.value,
+                effective_date=datetime(2026, 1, 1, tzinfo=UTC),
+                payload={
+                    "template": {},
+                    "rules": [
+                        rule("SCAN_LABEL", RuleCategory.INBOUND_OUTBOUND, RuleChannel.SCAN, RuleUnit.PIECE),
+                        rule("STO_CBM", RuleCategory.STORAGE, RuleChannel.AUTO, RuleUnit.CBM_DAY),
+                    ],
+                },
+            )
+        )
+    try:
+        yield created.scalar_one()
+    finally:
+        async with db.session() as session, session.begin():
+            await session.execute(delete(UsageEvent).where(UsageEvent.business_domain == DOMAIN))
+            await session.execute(delete(BillingQuote).where(BillingQuote.business_domain == DOMAIN))
+            await session.execute(delete(BillingTemplate).where(BillingTemplate.business_domain == DOMAIN))
+            await session.execute(delete(Customer).where(Customer.business_domain == DOMAIN))
+            await session.execute(delete(Company).where(Company.company_id == COMPANY_ID))
+            await session.execute(delete(BusinessDomain).where(BusinessDomain.code == DOMAIN))
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    async def current_user() -> None:
+        set_current_user_context(UserContext(user_id="test", union_id="test", name="test", domain_codes=[DOMAIN]))
+
+    app.dependency_overrides[get_current_user] = current_user
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+def event(key: str, customer_id: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        "idempotencyKey": key,
+        "customerId": customer_id,
+        "chargeCode": "SCAN_LABEL",
+        "unit": "PIECE",
+        "quantity": "1.5",
+        "occurredAt": "2026-09-03T10:00:00+08:00",
+        **overrides,
+    }
+
+
+async def test_batch_counts_duplicates_replays_and_rejections(
+    db: PostgresDatabase, client: httpx.AsyncClient, customer_id: int
+) -> None:
+    body = {
+        "source": "PDA",
+        "events": [
+            event("k1", customer_id),
+            event("k2", customer_id),
+            event("k1", customer_id, quantity="9"),
+            event("k3", 0),
+            event("k4", customer_id, chargeCode="UNKNOWN"),
+            event("k5", customer_id, chargeCode="STO_CBM", unit="CBM_DAY"),
+            event("k6", customer_id, unit="ORDER"),
+        ],
+    }
+
+    first = (await client.post(URL, json=body)).json()["data"]
+    assert (first["received"], first["inserted"], first["duplicates"]) == (7, 2, 1)
+    assert [(item["index"], item["idempotencyKey"]) for item in first["rejected"]] == [
+        (3, "k3"),
+        (4, "k4"),
+        (5, "k5"),
+        (6, "k6"),
+    ]
+
+    replay = (await client.post(URL, json=body)).json()["data"]
+    assert (replay["received"], replay["inserted"], replay["duplicates"]) == (7, 0, 3)
+    assert len(replay["rejected"]) == 4
+
+    async with db.session() as session:
+        rows = await session.execute(
+            select(UsageEvent.idempotency_key, UsageEvent.quantity, UsageEvent.occurred_at)
+            .where(UsageEvent.business_domain == DOMAIN)
+            .order_by(UsageEvent.idempotency_key)
+        )
+        occurred_at = datetime(2026, 9, 3, 2, tzinfo=UTC)
+        assert rows.all() == [("k1", Decimal("1.5"), occurred_at), ("k2", Decimal("1.5"), occurred_at)]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"occurredAt": "2026-09-03T10:00:00"}, {"quantity": "1.23456"}, {"quantity": "-1"}],
+    ids=["naive-occurred-at", "quantity-scale", "negative-quantity"],
+)
+async def test_batch_rejects_invalid_events(
+    client: httpx.AsyncClient, customer_id: int, overrides: dict[str, Any]
+) -> None:
+    response = await client.post(URL, json={"events": [event("k1", customer_id, **overrides)]})
+
+    assert response.json()["code"] == "E0422"